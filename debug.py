@@ -85,7 +85,7 @@ def run_model():
         nitrogen=[(5, 20), (30, 10), (50, 10)],
         overview=True
     )
-    df = df.iloc[:, 3:].astype(int).replace(-99, np.nan)
+    df = df.iloc[:, 3:].select_dtypes("number")
     print(df.describe())
     from collections import Counter
     print(Counter([l[:7] for l in overview if "Sowing" in l]))
@@ -133,7 +133,7 @@ def run_model_forecast_onthefly():
         nitrogen=[(5, 20), (30, 10), (50, 10)],
         overview=True
     )
-    df = df.iloc[:, 3:].astype(int).replace(-99, np.nan)
+    df = df.iloc[:, 3:].select_dtypes("number")
     print(df.describe())
     # parse_overview("".join(overview))
     from collections import Counter
@@ -25,12 +25,14 @@ import tempfile
 VARIABLES_ERA5_NC = db.VARIABLES_ERA5_NC
 VARIABLES_PRISM = db.VARIABLES_PRISM
 
-def ingest_era5_record(con:pg.extensions.connection, schema:str, date:datetime):
+def ingest_era5_record(con:pg.extensions.connection, schema:str, date:datetime,
+                       encode:bool=False):
     """
     Add a row to each ERA5 table: rain, tmax, tmin, and srad. Given a schema (country),
     it will download, process, and ingest the data for that schema. The country must 
     be already created in the database. The data extent is defined by the geometry
-    in the COUNTRY.admin table.
+    in the COUNTRY.admin table. If encode is True the rasters are stored as 
+    scaled integers (see database.RASTER_ENCODING) instead of Float32.
     """
     schema = schema.lower()
     # Check admin shapefile is in the db
@@ -44,13 +46,14 @@ def ingest_era5_record(con:pg.extensions.connection, schema:str, date:datetime):
     date = datetime(date.year, date.month, date.day)
     for var, ncvar in VARIABLES_ERA5_NC.items():      
         try:
-            nc_path = download.download_era5(date, var, bbox)
-            tiff_path = transform.nc_to_tiff(ncvar, date, nc_path)
             table = f"era5_{var}"
-            # Delete rasters if exists
-            db.delete_rasters(con, schema, table, date)
-
-            db.tiff_to_db(tiff_path, con, schema, table, date)
+            encoding = db.resolve_raster_encoding(con, schema, table, encode)
+            nc_path = download.download_era5(date, var, bbox)
+            tiff_path = transform.nc_to_tiff(
+                ncvar, date, nc_path, encoding=encoding
+            )
+            # Rasters for that date are replaced if they exist
+            db.tiff_to_db(tiff_path, con, schema, table, date, replace=True)
             os.remove(nc_path)
             os.remove(tiff_path)
             logger.info(
@@ -67,14 +70,15 @@ def ingest_era5_record(con:pg.extensions.connection, schema:str, date:datetime):
         
 
 def ingest_era5_series(con:pg.extensions.connection, 
-                       schema:str, datefrom:datetime, dateto:datetime):
+                       schema:str, datefrom:datetime, dateto:datetime,
+                       encode:bool=False):
     """
     Ingest data for the requested schema, from the specified to the specified
     dates. It ingests all four ERA5 variables needed to run the model
     """
     date = datefrom 
     while date <= dateto:
-        ingest_era5_record(con, schema, date)
+        ingest_era5_record(con, schema, date, encode)
         date += timedelta(days=1)
 
 def ingest_soil(con:pg.extensions.connection, schema:str, soilfile:str, 
@@ -110,6 +114,8 @@ def ingest_soil(con:pg.extensions.connection, schema:str, soilfile:str,
     cur = con.cursor()
     if not db.table_exists(con, schema, f"soil"):
         db._create_soil_table(con, schema)
+    else:
+        db.migrate_soil_profiles(con, schema)
 
     for line in tqdm(soil_lines):
         if line[0] == "*":
@@ -137,13 +143,20 @@ def ingest_soil(con:pg.extensions.connection, schema:str, soilfile:str,
             # TODO: Raise if the point is not in crop mask
             soilProfile_lines = "".join(soilProfile_lines)
             soilProfile_lines = soilProfile_lines.replace("'", " ")
-            # Write to DB
+            profile = db.soil_profile_hash(soilProfile_lines)
+            # Write to DB. Identical profiles are stored only once
             try:
                 query = """
-                    INSERT INTO {0}.soil(geom, mask1, mask2, soil) 
+                    INSERT INTO {0}.soil_profile(profile, soil) 
+                    VALUES ('{1}', '{2}')
+                    ON CONFLICT DO NOTHING;
+                    """.format(schema, profile, soilProfile_lines)
+                cur.execute(query)
+                query = """
+                    INSERT INTO {0}.soil(geom, mask1, mask2, profile) 
                     VALUES (ST_Point({1}, {2}), {3}, {4}, '{5}');
                     """.format(schema, lon, lat, mask1_value, mask2_value, 
-                            soilProfile_lines)
+                            profile)
                 cur.execute(query)
                 con.commit()
             except pg.errors.UniqueViolation: # If soil for that location is repeated
@@ -154,6 +167,8 @@ def ingest_soil(con:pg.extensions.connection, schema:str, soilfile:str,
                 soilProfile_lines = [line]
     cur.close()
     # con.close()
+    # Soil points are assigned to their admin1 once, at ingest
+    db.assign_soil_admin1(con, schema)
 
 def ingest_static(con:pg.extensions.connection, schema:str, rast:str, 
                   parname:str):
@@ -186,6 +201,7 @@ def ingest_static(con:pg.extensions.connection, schema:str, rast:str,
         table="static",
         par=parname
     )
+    db.clear_static_cache(schema)
     
 def ingest_cultivars(con:pg.extensions.connection, schema:str, csv:str):
     """
@@ -259,13 +275,14 @@ def ingest_baseline_run(con:pg.extensions.connection, schema:str, csv:str):
     cur.close()
         
 def ingest_nmme_rain(con:pg.extensions.connection, schema:str, ens:int,
-                     weather_table:str='era5'):
+                     weather_table:str='era5', encode:bool=False):
     """
     Ingest the NMME rain data
     """
     logger = logging.getLogger(__name__)
     if not db.table_exists(con, schema, f"nmme_rain"):
          db._create_climate_forecast_table(con, schema, f"nmme_rain")
+    encoding = db.resolve_raster_encoding(con, schema, "nmme_rain", encode)
 
     bbox = db.get_envelope(con, schema, pad=1.)
     
@@ -288,17 +305,21 @@ def ingest_nmme_rain(con:pg.extensions.connection, schema:str, ens:int,
     table = f"nmme_rain"
     for date, file in files_dict.items():
         file_path = os.path.join(folder, f"gtr{file}")
-        # Delete rasters if exists
-        where = "fdate='{0}' AND ens={1}".format(date.strftime("%Y-%m-%d"), ens)
-        db.delete_rasters(con, schema, table, where=where)
-        db.tiff_to_db(file_path, con, schema, table, date, ens=ens)
+        if encoding is not None:
+            file_path = transform.encode_tiff(
+                file_path, encoding, os.path.join(folder, f"enc{file}")
+            )
+        # Rasters for that date and ensemble are replaced if they exist
+        db.tiff_to_db(
+            file_path, con, schema, table, date, ens=ens, replace=True
+        )
         logger.info(
             f"\nNMME INGEST: {date.date()} nmme_rain ens {ens} for {schema} ingested\n"
         )         
     shutil.rmtree(folder)
 
 def ingest_nmme_temp(con:pg.extensions.connection, schema:str, ens:int,
-                     weather_table:str='era5'):
+                     weather_table:str='era5', encode:bool=False):
     """
     Ingest nmme temperature data. For that it conducts the next steps:
         1. Download and geotransform nmme data
@@ -313,6 +334,10 @@ def ingest_nmme_temp(con:pg.extensions.connection, schema:str, ens:int,
     for var in variables:
         if not db.table_exists(con, schema, f"nmme_{var}"):
             db._create_climate_forecast_table(con, schema, f"nmme_{var}")
+    encodings = {
+        var: db.resolve_raster_encoding(con, schema, f"nmme_{var}", encode)
+        for var in variables
+    }
 
     bbox = db.get_envelope(con, schema, pad=1.)
     
@@ -390,22 +415,27 @@ def ingest_nmme_temp(con:pg.extensions.connection, schema:str, ens:int,
         for var in ["tmin", "tmax"]:
             table = f"nmme_{var}"
             file_path = os.path.join(folder, f"{var}{file}")
-            where = "fdate='{0}' AND ens={1}".format(date.strftime("%Y-%m-%d"), ens)
-            db.delete_rasters(con, schema, table, where=where)
-            db.tiff_to_db(file_path, con, schema, table, date, ens=ens)
+            if encodings[var] is not None:
+                file_path = transform.encode_tiff(
+                    file_path, encodings[var], 
+                    os.path.join(folder, f"enc{var}{file}")
+                )
+            db.tiff_to_db(
+                file_path, con, schema, table, date, ens=ens, replace=True
+            )
             logger.info(
                 f"\nNMME INGEST: {date.date()} {table} ens {ens} for {schema} ingested\n"
             )         
     shutil.rmtree(folder)
     
 def ingest_nmme(con:pg.extensions.connection, schema:str, 
-                weather_table:str="era5"):
+                weather_table:str="era5", encode:bool=False):
     """
     Ingest the NMME Rain and temperature data
     """
     for e in range(1, 11):
-        ingest_nmme_temp(con, schema, e, weather_table)
-        ingest_nmme_rain(con, schema, e, weather_table)
+        ingest_nmme_temp(con, schema, e, weather_table, encode)
+        ingest_nmme_rain(con, schema, e, weather_table, encode)
 
 def calculate_climatology(con:pg.extensions.connection, schema:str, 
                           weather_table:str='era5'):
@@ -426,10 +456,9 @@ def calculate_climatology(con:pg.extensions.connection, schema:str,
             table = f"{ds}_{var}"
             agg = 'mean'
             variable = f"{var}_{agg}"
+            rast_str = db.decoded_rast_sql(con, schema, table)
             if weather_table == 'prism': # Prism is in celsius 
-                rast_str = "ST_MapAlgebra(rast, NULL, '([rast]+273.15)')"
-            else:
-                rast_str = 'rast'
+                rast_str = f"ST_MapAlgebra({rast_str}, NULL, '([rast]+273.15)')"
             rast_query = """
                 SELECT ST_Union({4}, '{3}') as rast FROM {0}.{1}
                 WHERE
@@ -465,15 +494,19 @@ def calculate_climatology(con:pg.extensions.connection, schema:str,
         rast_query = """
             -- Time series of temperature range for that month
             WITH merged As (
-                SELECT * FROM {0}.{2}_tmax
+                SELECT fdate, {3} AS rast FROM {0}.{2}_tmax
                     WHERE date_part('month', fdate)={1}
                 UNION ALL
-                (SELECT * FROM {0}.{2}_tmin
+                (SELECT fdate, {4} AS rast FROM {0}.{2}_tmin
                     WHERE date_part('month', fdate)={1})
             )
             SELECT fdate, ST_Union(rast, 'RANGE') as rast FROM merged
             GROUP BY fdate
-        """.format(schema, month, ds)
+        """.format(
+            schema, month, ds, 
+            db.decoded_rast_sql(con, schema, f"{ds}_tmax"),
+            db.decoded_rast_sql(con, schema, f"{ds}_tmin")
+        )
         sql = """
             WITH Trange As ({4})
             INSERT INTO {0}.{1} ("month", variable, rast)(  
@@ -497,7 +530,8 @@ def calculate_climatology(con:pg.extensions.connection, schema:str,
 
 
 def ingest_prism_series(con:pg.extensions.connection, 
-                       schema:str, datefrom:datetime, dateto:datetime):
+                       schema:str, datefrom:datetime, dateto:datetime,
+                       encode:bool=False):
     """
     Ingest PRISM data for the requested schema, from the specified to the specified
     dates. It ingests all four PRISM variables needed to run the model. PRISM does 
@@ -513,6 +547,10 @@ def ingest_prism_series(con:pg.extensions.connection,
             db._create_reanalysis_table(con, schema, f"prism_{var}")
     if not db.table_exists(con, schema, f"prism_srad"):
         db._create_reanalysis_table(con, schema, f"prism_srad")
+    encodings = {
+        var: db.resolve_raster_encoding(con, schema, f"prism_{var}", encode)
+        for var in list(VARIABLES_PRISM.keys()) + ["srad"]
+    }
     # Get the envelope for that region
     bbox = db.get_envelope(con, schema)
     logger = logging.getLogger(__name__)
@@ -562,10 +600,14 @@ def ingest_prism_series(con:pg.extensions.connection,
                 tiff_path = bil_path.replace('.bil', '.tif')
                 # Translate raster
                 transform.translate_raster(bil_path, tiff_path, bbox)
-                # Delete rasters if exists
+                if encodings[var] is not None:
+                    tiff_path = transform.encode_tiff(
+                        tiff_path, encodings[var], 
+                        tiff_path.replace('.tif', '_enc.tif')
+                    )
+                # Rasters for that date are replaced if they exist
                 table = f"prism_{var}"
-                db.delete_rasters(con, schema, table, date)
-                db.tiff_to_db(tiff_path, con, schema, table, date)
+                db.tiff_to_db(tiff_path, con, schema, table, date, replace=True)
                 shutil.rmtree(tmpfolder)
                 logger.info(
                     f"\nPRISM INGEST: {date.date()} {pvar} for {schema} ingested\n"
@@ -576,12 +618,12 @@ def ingest_prism_series(con:pg.extensions.connection,
         if download_srad:
             nc_path = download.download_era5(date, 'srad', bbox)
             tiff_path = transform.nc_to_tiff(
-                VARIABLES_ERA5_NC['srad'], date, nc_path
+                VARIABLES_ERA5_NC['srad'], date, nc_path, 
+                encoding=encodings['srad']
             )
             table = f"prism_srad"
-            # Delete rasters if exists
-            db.delete_rasters(con, schema, table, date)
-            db.tiff_to_db(tiff_path, con, schema, table, date)
+            # Rasters for that date are replaced if they exist
+            db.tiff_to_db(tiff_path, con, schema, table, date, replace=True)
             logger.info(
                 f"\nPRISM INGEST: {date.date()} {pvar} for {schema} ingested\n"
             )
@@ -4,21 +4,59 @@ This module contains funtions to transform data. Transformation implies
 converting between data formats, or extrating data from some file to create a new
 file.
 """
-from netCDF4 import Dataset, num2date
+from __future__ import annotations
+from typing import TYPE_CHECKING
 import numpy as np
 import pandas as pd
 
 import tempfile
 from datetime import datetime
-import re
 import subprocess
-import psycopg2 as pg
 
-from osgeo import gdal
-from osgeo import osr
-from osgeo_utils import gdal_calc
+# netCDF4 and GDAL are imported by the functions that use them, then 
+# importing this module is fast (see experiments/import_time.py).
+if TYPE_CHECKING:
+    import psycopg2 as pg
 
-def write_tiff(lat, lon, res, data, tiffpath=None, epsg=4326):
+def encode_array(data, encoding, nodata=None):
+    """
+    Encodes a float array as scaled integers. The stored value is 
+    round((value - offset)/scale). Missing values (masked, non finite, or equal
+    to nodata) are set to the encoding nodata value. It returns the encoded 
+    array.
+
+    Arguments
+    ----------
+    data: 2D array
+        2D array or masked array containing the data
+    encoding: dict
+        Encoding definition with dtype, scale, offset, and nodata keys. See
+        database.RASTER_ENCODING
+    nodata: float
+        Nodata value of the input data, if any.
+    """
+    dtype = np.dtype(encoding["dtype"].lower())
+    if isinstance(data, np.ma.masked_array):
+        missing = np.ma.getmaskarray(data)
+        data = data.data
+    else:
+        missing = np.zeros(data.shape, dtype=bool)
+    data = data.astype(np.float64)
+    missing |= ~np.isfinite(data)
+    if nodata is not None:
+        missing |= (data == nodata)
+    out = np.round((data - encoding["offset"])/encoding["scale"])
+    # Nodata is one of the dtype limits, then valid values are clipped to the
+    # rest of the range.
+    info = np.iinfo(dtype)
+    if encoding["nodata"] == info.min:
+        out = np.clip(out, info.min + 1, info.max)
+    else:
+        out = np.clip(out, info.min, info.max - 1)
+    out[missing] = encoding["nodata"]
+    return out.astype(dtype)
+
+def write_tiff(lat, lon, res, data, tiffpath=None, epsg=4326, encoding=None):
     """
     Writes Geotif in temporary directory so it can be imported into the PostGIS database.
     This function was addapted from RHEAS. It returns the path to the tiff file.
@@ -37,21 +75,33 @@ def write_tiff(lat, lon, res, data, tiffpath=None, epsg=4326):
         Path to the tiff file to write. If None then a tmpfile is created.
     epsg: int
         EPSG code for CRS
+    encoding: dict
+        If passed, data is written as scaled integers (e.g. Int16) instead of 
+        Float32. See database.RASTER_ENCODING
     """
+    from osgeo import gdal
+    from osgeo import osr
     if isinstance(data, np.ma.masked_array):
         nodata = np.double(data.fill_value)
-        data = data.data
     else:
         nodata = -9999.
+    if encoding is None:
+        if isinstance(data, np.ma.masked_array):
+            data = data.data
+        out = data
+        gdal_type = gdal.GDT_Float32
+    else:
+        out = encode_array(data, encoding, nodata)
+        nodata = encoding["nodata"]
+        gdal_type = gdal.GetDataTypeByName(encoding["dtype"])
 
-    nrows, ncols = data.shape
-    out = data
+    nrows, ncols = out.shape
     if tiffpath is None:
         f = tempfile.NamedTemporaryFile(suffix=".tif", delete=False)
         tiffpath = f.name
         f.close()
     driver = gdal.GetDriverByName("GTiff")
-    ods = driver.Create(tiffpath, ncols, nrows, 1, gdal.GDT_Float32)
+    ods = driver.Create(tiffpath, ncols, nrows, 1, gdal_type)
     srs = osr.SpatialReference()
     srs.ImportFromEPSG(epsg)
     ods.SetProjection(srs.ExportToWkt())
@@ -61,9 +111,40 @@ def write_tiff(lat, lon, res, data, tiffpath=None, epsg=4326):
     )
     ods.GetRasterBand(1).WriteArray(out)
     ods.GetRasterBand(1).SetNoDataValue(nodata)
+    if encoding is not None:
+        ods.GetRasterBand(1).SetScale(encoding["scale"])
+        ods.GetRasterBand(1).SetOffset(encoding["offset"])
     ods = None
     return tiffpath
 
+def encode_tiff(tiffin, encoding, tiffout=None):
+    """
+    Re-writes a Float tiff as a scaled integer tiff. It returns the path to the
+    encoded tiff. If tiffout is None then a tmpfile is created.
+    """
+    from osgeo import gdal
+    ids = gdal.Open(tiffin)
+    band = ids.GetRasterBand(1)
+    out = encode_array(band.ReadAsArray(), encoding, band.GetNoDataValue())
+    if tiffout is None:
+        f = tempfile.NamedTemporaryFile(suffix=".tif", delete=False)
+        tiffout = f.name
+        f.close()
+    driver = gdal.GetDriverByName("GTiff")
+    ods = driver.Create(
+        tiffout, ids.RasterXSize, ids.RasterYSize, 1, 
+        gdal.GetDataTypeByName(encoding["dtype"])
+    )
+    ods.SetProjection(ids.GetProjection())
+    ods.SetGeoTransform(ids.GetGeoTransform())
+    ods.GetRasterBand(1).WriteArray(out)
+    ods.GetRasterBand(1).SetNoDataValue(encoding["nodata"])
+    ods.GetRasterBand(1).SetScale(encoding["scale"])
+    ods.GetRasterBand(1).SetOffset(encoding["offset"])
+    ods = None
+    ids = None
+    return tiffout
+
 def nc_to_tiff(variable:str, date:datetime, ncpath:str, tiffpath:str=None,
                **kwargs):
     """
@@ -82,8 +163,10 @@ def nc_to_tiff(variable:str, date:datetime, ncpath:str, tiffpath:str=None,
     kwargs:
         Other kwargs can be passed. Those kwargs are lat, lon, and time , they 
         map each variable to the netcdf variable that represents each. If not 
-        provided then default values from AgERA5 are taken
+        provided then default values from AgERA5 are taken. An encoding kwarg
+        can be passed to write the tiff as scaled integers (see write_tiff).
     """
+    from netCDF4 import Dataset, num2date
     timevar = kwargs.get("time", "time")
     latvar = kwargs.get("lat", "lat")
     lonvar = kwargs.get("lon", "lon")
@@ -100,7 +183,10 @@ def nc_to_tiff(variable:str, date:datetime, ncpath:str, tiffpath:str=None,
     lat = nc.variables[latvar][:].data
     res = (lat.max() - lat.min())/len(lat)
 
-    tiffpath = write_tiff(lat, lon, res, data, tiffpath=None, epsg=4326)
+    tiffpath = write_tiff(
+        lat, lon, res, data, tiffpath=None, epsg=4326, 
+        encoding=kwargs.get("encoding")
+    )
     return tiffpath
 
 ENV_PARSE_INDEX = (
@@ -115,18 +201,129 @@ ENV_STRESS_COLNAMES = (
     "stressNitPhto", "stressNitGro", "stressPhoPho", "stressPhoGro" 
 )
 
+# Stress metric columns of the overview arrays (all but the phase name)
+ENV_STRESS_METRICS = ENV_STRESS_COLNAMES[1:]
+ENV_INT_COLNAMES = tuple(
+    col for col in ENV_STRESS_METRICS
+    if col == "timeSpan" or col.startswith("ndays")
+)
+OVERVIEW_RUN_START = "*DSSAT Cropping System Model"
+
+class OverviewParser:
+    """
+    Single pass parser of the environmental and stress factors of the DSSAT
+    overview. Lines (or chunks of text) are fed as the overview is read, so
+    the overview can be parsed straight from the DSSAT output stream or file
+    without keeping the whole text in memory. A new run starts with each
+    DSSAT header line, or when a phase is found twice in the same run.
+    """
+    def __init__(self):
+        self._runs = []
+        self._current = None
+        self._partial = ""
+
+    def feed(self, chunk:str):
+        """
+        Parses a chunk of text. The chunk does not need to end in a full line.
+        """
+        lines = (self._partial + chunk).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self.feed_line(line)
+
+    def feed_line(self, line:str):
+        """
+        Parses a line of the overview.
+        """
+        if line.startswith(OVERVIEW_RUN_START):
+            self._current = None
+            return
+        if line[:1] != " ":
+            return
+        for phase, key in enumerate(ENV_PARSE_INDEX):
+            if line.startswith(key, 1):
+                break
+        else:
+            return
+        values = line[len(key)+1:].split()
+        if len(values) != len(ENV_STRESS_METRICS):
+            return
+        if (self._current is None) or (phase in self._current):
+            self._current = {}
+            self._runs.append(self._current)
+        self._current[phase] = [float(v) for v in values]
+
+    def close(self):
+        """
+        Parses the remaining partial line, if any.
+        """
+        if self._partial:
+            self.feed_line(self._partial)
+            self._partial = ""
+        return self
+
+    @property
+    def nruns(self):
+        return len(self._runs)
+
+    def array(self):
+        """
+        Returns the parsed values as a float array with (run, phase, metric)
+        dimensions. Phases are in the ENV_PARSE_INDEX order, and metrics in the
+        ENV_STRESS_METRICS order. Phases missing in a run are NaN.
+        """
+        arr = np.full(
+            (len(self._runs), len(ENV_PARSE_INDEX), len(ENV_STRESS_METRICS)),
+            np.nan
+        )
+        for run, phases in enumerate(self._runs):
+            for phase, values in phases.items():
+                arr[run, phase] = values
+        return arr
+
+    def to_frame(self):
+        """
+        Returns the parsed values as a DataFrame with the RUN and
+        ENV_STRESS_COLNAMES columns, sorted by phase and run.
+        """
+        arr = self.array()
+        phase_idx, run_idx = np.nonzero(
+            ~np.isnan(arr[:, :, 0]).T
+        )
+        df = pd.DataFrame(
+            arr[run_idx, phase_idx], columns=list(ENV_STRESS_METRICS)
+        )
+        df.insert(0, "devPhase", np.array(ENV_PARSE_INDEX)[phase_idx])
+        df.insert(0, "RUN", run_idx + 1)
+        df = df.astype({col: int for col in ENV_INT_COLNAMES})
+        return df
+
+def parse_overview_lines(lines):
+    """
+    Parses an iterable of overview lines (or text chunks), like the DSSAT
+    overview file or the overview returned by run_spatial_dssat. It returns
+    the OverviewParser.
+    """
+    parser = OverviewParser()
+    for line in lines:
+        parser.feed(line)
+    return parser.close()
+
+def parse_overview_file(path:str):
+    """
+    Parses the overview file in path line by line. It returns the
+    OverviewParser.
+    """
+    with open(path, "r", errors="replace") as f:
+        return parse_overview_lines(f)
+
 def parse_overview(overview_str):
     """
     Parse the overview file to get environmental and stress factors
     """
-    lines = []
-    for key in ENV_PARSE_INDEX:
-        for n, l in enumerate(re.findall(f"({key}.+)\n", overview_str), 1):
-            lines.append(
-                [n, key] + l.replace(key, "").split()
-            )
-    df = pd.DataFrame(lines, columns=["RUN"]+list(ENV_STRESS_COLNAMES))
-    return df  
+    parser = OverviewParser()
+    parser.feed(overview_str)
+    return parser.close().to_frame()
 
 def reproject_raster(rin, rout, rref=None, resampling="bilinear", **kwargs):
     """
@@ -134,6 +331,7 @@ def reproject_raster(rin, rout, rref=None, resampling="bilinear", **kwargs):
     If a reference raster is not passed, then the shape and geotransform parameters
     must be passed.
     """
+    from osgeo import gdal
     if rref:
         ref_ds = gdal.Open(rref)
         x_size, y_size = ref_ds.RasterXSize, ref_ds.RasterYSize
@@ -152,6 +350,7 @@ def reproject_raster(rin, rout, rref=None, resampling="bilinear", **kwargs):
     gdal.Warp(rout, rin, options=warp_options)
 
 def translate_raster(rin, rou, bbox):
+    from osgeo import gdal
     translate_options = gdal.TranslateOptions(
         projWin=[bbox[1], bbox[0], bbox[3], bbox[2]], 
         projWinSRS='EPSG:4326'
@@ -165,12 +364,14 @@ def tiff_union(tifflist, tiffout, redf=np.mean, calc="mean(a,axis=0)"):
     the function specified in redf. Rasters must be compatible: same size
     and resolution
     """
+    from osgeo_utils import gdal_calc
     gdal_calc.Calc(calc=calc, a=tifflist, outfile=tiffout)
 
 def db_to_tiff(con:pg.extensions.connection, schema, table, where, saveto):
     """
     Exports raster fom table to tiff.
     """
+    from osgeo import gdal
     cur = con.cursor()
     user = con.info.user
     password = con.info.password
@@ -190,4 +391,5 @@ def rast_calc(A, B, calc, outfile):
     Does raster calculations using numpy syntax. calc is the operation to perform,
     for example A + B
     """
+    from osgeo_utils import gdal_calc
     gdal_calc.Calc(calc, A=A, B=B, outfile=outfile)
\ No newline at end of file
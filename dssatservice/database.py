@@ -2,10 +2,9 @@
 It contains most of the functions to create schemas, tables, and get data from
 the database.
 """
-import psycopg2 as pg
-from sqlalchemy import create_engine
-import geopandas as gpd
-from pandas import date_range, Series, DataFrame
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from pandas import date_range, Series, DataFrame, DateOffset, Timestamp
 import numpy as np
 
 import warnings
@@ -15,6 +14,13 @@ import os
 from datetime import datetime
 import random
 import string
+import logging
+import hashlib
+
+# psycopg2, geopandas and SQLAlchemy are imported by the functions that use
+# them, then importing this module is fast (see experiments/import_time.py).
+if TYPE_CHECKING:
+    import psycopg2 as pg
 
 
 VARIABLES_ERA5_NC = {
@@ -29,13 +35,38 @@ VARIABLES_PRISM = {
     'rain': 'ppt', 'tmax': 'tmax', 'tmin': 'tmin',
 }
 
+# Scaled integer encoding for the weather tables. Values are stored as
+# round((value - offset)/scale), which is enough precision for DSSAT (0.01 K, 
+# 0.01 mm, and 0.001 MJ/m2). The encoding used by each table is recorded in the
+# SCHEMA.raster_encoding table, and readers decode it transparently.
+_ENC_KELVIN = {"dtype": "Int16", "scale": 0.01, "offset": 273.15, "nodata": -32768}
+_ENC_CELSIUS = {"dtype": "Int16", "scale": 0.01, "offset": 0., "nodata": -32768}
+_ENC_RAIN = {"dtype": "UInt16", "scale": 0.01, "offset": 0., "nodata": 65535}
+_ENC_SRAD = {"dtype": "UInt16", "scale": 1000., "offset": 0., "nodata": 65535}
+RASTER_ENCODING = {
+    "era5_tmax": _ENC_KELVIN, "era5_tmin": _ENC_KELVIN, 
+    "era5_rain": _ENC_RAIN, "era5_srad": _ENC_SRAD,
+    "prism_tmax": _ENC_CELSIUS, "prism_tmin": _ENC_CELSIUS, 
+    "prism_rain": _ENC_RAIN, "prism_srad": _ENC_SRAD,
+    "nmme_tmax": _ENC_KELVIN, "nmme_tmin": _ENC_KELVIN, "nmme_rain": _ENC_RAIN,
+}
+
 TMP = tempfile.gettempdir()
+logger = logging.getLogger(__name__)
+
+# Static rasters loaded in memory, (dbname, schema, par): (values, geotransform)
+_STATIC_GRIDS = {}
+# Soil points loaded in memory, (dbname, schema): index. See get_soil_index
+_SOIL_INDEX = {}
+# Raster encodings, (dbname, schema, table): encoding. See get_raster_encoding
+_RASTER_ENCODING = {}
 
 def connect(dbname):
     """
     Retuns a connection. If dbname is a connection then it returns dbname. If not,
     then it tries to return a local connection to dbname
     """
+    import psycopg2 as pg
     if isinstance(dbname, pg.extensions.connection):
         return dbname
     else:
@@ -156,11 +187,31 @@ def _create_static_table(con, schema):
     # con.close()
     return 
 
+def _create_soil_profile_table(con, schema):
+    """
+    Creates the table of unique soil profiles, keyed by the profile hash (see
+    soil_profile_hash).
+    """
+    cur = con.cursor()
+    query = """
+        CREATE TABLE {0}.soil_profile (
+            profile char(32) PRIMARY KEY,
+            soil text NOT NULL
+        );
+        """.format(schema)
+    cur.execute(query)
+    con.commit()
+    cur.close()
+    return
+
 def _create_soil_table(con, schema):
     """
-    Creates soil table
+    Creates soil table. Each soil point references its profile in the 
+    soil_profile table.
     """
     table = "soil"
+    if not table_exists(con, schema, "soil_profile"):
+        _create_soil_profile_table(con, schema)
     # con = connect(dbname)
     cur = con.cursor()
     query = """
@@ -169,10 +220,19 @@ def _create_soil_table(con, schema):
             geom geometry (POINT, 4326) UNIQUE,
             mask1 boolean,
             mask2 boolean,
-            soil text
+            profile char(32) REFERENCES {0}.soil_profile (profile),
+            admin1 text
         );
         """.format(schema, table)
     cur.execute(query)
+    query = """
+        CREATE INDEX {1}_admin1 ON {0}.{1} (admin1);
+        """.format(schema, table)
+    cur.execute(query)
+    query = """
+        CREATE INDEX {1}_profile ON {0}.{1} (profile);
+        """.format(schema, table)
+    cur.execute(query)
     query = """
         CREATE INDEX {1}_mask1 ON {0}.{1} (mask1);
         """.format(schema, table)
@@ -311,6 +371,57 @@ def _create_climatology_table(con, schema, weather_table='era5'):
     # con.close()
 
 
+def _create_sample_plan_table(con, schema):
+    """
+    Creates the table of precomputed sample plans. Each row is one (soil 
+    point, weather pixel, NMME ensemble member) tuple of the plan, weight is 
+    the number of ensemble members it represents.
+    """
+    cur = con.cursor()
+    query = """
+        CREATE TABLE {0}.sample_plan (
+            admin1 text NOT NULL,
+            nens integer NOT NULL,
+            weather_table character(32) NOT NULL,
+            method character(32) NOT NULL,
+            soil_gid integer,
+            soil_lon double precision,
+            soil_lat double precision,
+            weather_lon double precision,
+            weather_lat double precision,
+            ens integer,
+            weight integer NOT NULL
+        );
+        """.format(schema)
+    cur.execute(query)
+    query = """
+        CREATE INDEX sample_plan_key 
+        ON {0}.sample_plan (admin1, nens, weather_table, method);
+        """.format(schema)
+    cur.execute(query)
+    con.commit()
+    cur.close()
+
+def _create_raster_encoding_table(con, schema):
+    """
+    Creates the table that records the scaled integer encoding of the raster
+    tables.
+    """
+    cur = con.cursor()
+    query = """
+        CREATE TABLE {0}.raster_encoding (
+            tname text PRIMARY KEY,
+            dtype text NOT NULL,
+            scale float8 NOT NULL,
+            add_offset float8 NOT NULL,
+            nodata float8 NOT NULL
+        );
+        """.format(schema)
+    cur.execute(query)
+    con.commit()
+    cur.close()
+    return
+
 def schema_exists(con, schema):
     """
     Check if schema exists in database.
@@ -344,6 +455,21 @@ def table_exists(con, schema, table):
     cur.close()
     return table_exists
 
+def column_exists(con, schema, table, column):
+    """
+    Check if column exists in the table.
+    """
+    cur = con.cursor()
+    query = """
+        SELECT 1 FROM information_schema.columns 
+        WHERE 
+            table_schema=%s AND table_name=%s AND column_name=%s;
+        """
+    cur.execute(query, (schema.lower(), table.lower(), column.lower()))
+    column_exists = bool(cur.rowcount)
+    cur.close()
+    return column_exists
+
 def add_country(con:pg.extensions.connection, name:str, shapefile:str, 
                 admin1:str="admin1"):
     """
@@ -364,6 +490,7 @@ def add_country(con:pg.extensions.connection, name:str, shapefile:str,
     admin1: str 
         Name of the admin1 division.
     """
+    import geopandas as gpd
     gdf = gpd.read_file(shapefile)
     assert admin1 in gdf.columns, f"{admin1} column not in shapefile"
     gdf = gdf.rename(columns={admin1: "admin1"})
@@ -433,36 +560,177 @@ def get_envelope(con:pg.extensions.connection, schema:str, pad=0.1):
     bbox = [bbox[0]+pad, bbox[1]-pad, bbox[2]-pad, bbox[3]+pad]
     return bbox
 
-def delete_rasters(con, schema, table, date=None, where=None):
+def get_raster_encoding(con, schema:str, table:str):
+    """
+    Returns the scaled integer encoding of the table as a dict (dtype, scale, 
+    offset, nodata). It returns None if the table stores plain floats. The
+    encoding is cached for the process. The encoding of a table can only be
+    set while it is empty, then plain float tables are cached only if they 
+    have data.
+    """
+    key = (con.info.dbname, schema.lower(), table.lower())
+    if key in _RASTER_ENCODING:
+        return _RASTER_ENCODING[key]
+    encoding = None
+    cur = con.cursor()
+    if table_exists(con, schema, "raster_encoding"):
+        query = """
+            SELECT dtype, scale, add_offset, nodata FROM {0}.raster_encoding
+            WHERE tname=%s;
+            """.format(schema)
+        cur.execute(query, (table.lower(), ))
+        rows = cur.fetchall()
+        if len(rows) > 0:
+            dtype, scale, offset, nodata = rows[0]
+            encoding = {
+                "dtype": dtype, "scale": scale, "offset": offset, 
+                "nodata": nodata
+            }
+    if encoding is None:
+        if not table_exists(con, schema, table):
+            cur.close()
+            return None
+        cur.execute("SELECT 1 FROM {0}.{1} LIMIT 1;".format(schema, table))
+        if cur.rowcount == 0:
+            cur.close()
+            return None
+    cur.close()
+    _RASTER_ENCODING[key] = encoding
+    return encoding
+
+def clear_raster_encoding_cache(schema:str=None):
     """
-    If date already exists delete associated rasters before ingesting.
+    Removes the raster encodings of the schema from the process cache. If 
+    schema is None the whole cache is cleared.
     """
-    # con = connect(dbname)
+    for key in list(_RASTER_ENCODING):
+        if (schema is None) or (key[1] == schema.lower()):
+            _RASTER_ENCODING.pop(key)
+
+def resolve_raster_encoding(con, schema:str, table:str, encode:bool):
+    """
+    Returns the encoding to use when ingesting data into the table, and 
+    records it in the SCHEMA.raster_encoding table. It returns None if the data
+    must be stored as floats. Encoded and non-encoded rasters can't be mixed in
+    the same table, then it raises an error if the requested storage does not
+    match the data already in the table.
+    """
+    current = get_raster_encoding(con, schema, table)
+    if not encode:
+        assert current is None, \
+            f"{schema}.{table} is encoded as {current['dtype']}. Ingest it " +\
+            "with encode=True"
+        return None
+    encoding = RASTER_ENCODING[table.lower()]
+    if current is not None:
+        assert current == encoding, \
+            f"{schema}.{table} encoding {current} does not match {encoding}"
+        return encoding
     cur = con.cursor()
+    cur.execute("SELECT 1 FROM {0}.{1} LIMIT 1;".format(schema, table))
+    is_empty = cur.rowcount == 0
+    assert is_empty, \
+        f"{schema}.{table} already contains Float rasters. Encoding can " +\
+        "only be set on empty tables"
+    if not table_exists(con, schema, "raster_encoding"):
+        _create_raster_encoding_table(con, schema)
+    query = """
+        INSERT INTO {0}.raster_encoding(tname, dtype, scale, add_offset, nodata)
+        VALUES (%s, %s, %s, %s, %s);
+        """.format(schema)
+    cur.execute(query, (
+        table.lower(), encoding["dtype"], encoding["scale"], 
+        encoding["offset"], encoding["nodata"]
+    ))
+    con.commit()
+    cur.close()
+    _RASTER_ENCODING[(con.info.dbname, schema.lower(), table.lower())] = \
+        encoding
+    return encoding
+
+def decoded_value_sql(con, schema:str, table:str, value:str):
+    """
+    Returns the SQL expression that decodes the value expression (e.g. 
+    ST_Value(rast, geom)) for the table. It returns value if the table stores
+    plain floats.
+    """
+    encoding = get_raster_encoding(con, schema, table)
+    if encoding is None:
+        return value
+    return "({0}*{1}+{2})".format(value, encoding["scale"], encoding["offset"])
+
+def decoded_rast_sql(con, schema:str, table:str, rast:str="rast"):
+    """
+    Returns the SQL expression that decodes the raster column of the table as 
+    a 32 bit float raster. It returns rast if the table stores plain floats.
+    """
+    encoding = get_raster_encoding(con, schema, table)
+    if encoding is None:
+        return rast
+    return "ST_MapAlgebra({0}, '32BF', '[rast]*{1}+{2}')".format(
+        rast, encoding["scale"], encoding["offset"]
+    )
+
+def delete_rasters(con, schema, table, date=None, where=None, dateto=None,
+                   ens=None, commit=True):
+    """
+    Deletes the rasters for a date, or for the span between date and dateto, 
+    before ingesting. The rows are deleted in a single statement that returns 
+    the number of deleted rows, so raster data is never fetched. It returns the
+    number of deleted rows.
+
+    Parameters
+    ----------
+    con: pg.extensions.connection
+        Database connection
+    schema: str
+        Schema of the table
+    table: str
+        Raster table
+    date: datetime
+        Date to delete, or first date of the span if dateto is passed
+    where: str
+        SQL condition of the rows to delete. If passed, date, dateto, and ens
+        are ignored.
+    dateto: datetime
+        Last date (inclusive) of the span to delete.
+    ens: int
+        Ensemble member to delete. Only for ensemble-based tables.
+    commit: bool
+        If False the transaction is not commited, so the delete can be commited
+        along with the replacement insert.
+    """
     if (where is None):
-        where = "fdate='{0}'".format(date.strftime('%Y-%m-%d'))
+        dateto = date if dateto is None else dateto
+        where = "fdate>=date '{0}' AND fdate<=date '{1}'".format(
+            date.strftime('%Y-%m-%d'), dateto.strftime('%Y-%m-%d')
+        )
+        if ens is not None:
+            where += " AND ens={0}".format(int(ens))
+    cur = con.cursor()
     query = """
-        SELECT * FROM {0}.{1}
-        WHERE
-            {2}
-        """.format(schema, table, where)
-    cur.execute(query)
-    if bool(cur.rowcount):
-        # TODO: This has to go in a log
-        warnings.warn("Overwriting raster in {0}.{1} table for {1}".format(
-            schema, table, query.replace('\n', " ")
-        ))
-        query = """
-            DELETE FROM {0}.{1} 
+        WITH deleted AS (
+            DELETE FROM {0}.{1}
             WHERE
                 {2}
-            """.format(schema, table, where)
-        cur.execute(query)
-        con.commit()
+            RETURNING 1
+        )
+        SELECT count(*) FROM deleted;
+        """.format(schema, table, where)
+    cur.execute(query)
+    count = cur.fetchall()[0][0]
     cur.close()
+    if count > 0:
+        logger.warning(
+            f"Overwriting {count} rasters in {schema}.{table} table for {where}"
+        )
+    if commit:
+        con.commit()
+    return count
 
 def tiff_to_db(tiffpath:str, con:pg.extensions.connection, schema:str,
-               table:str, date:datetime=None, ens:int=None, par:str=None):
+               table:str, date:datetime=None, ens:int=None, par:str=None,
+               replace:bool=False, commit:bool=True):
     """
     Saves tiff to the database.
 
@@ -482,6 +750,11 @@ def tiff_to_db(tiffpath:str, con:pg.extensions.connection, schema:str,
         Ensemble number. It is used when ensemble-based datasets are used.
     par: str
         Name of the parameter. Only applies for the static rasters.
+    replace: bool
+        If True, the existing rasters for that date (and ensemble) or parameter
+        are deleted in the same transaction as the insert.
+    commit: bool
+        If False the transaction is not commited. 
     """ 
     assert any((date is not None, par is not None)), \
         "date must be set for timeseries data. par must be set for static data" 
@@ -561,24 +834,36 @@ def tiff_to_db(tiffpath:str, con:pg.extensions.connection, schema:str,
                 CREATE INDEX {0}_ens ON {1} (ens);
                 """.format(table, temptable)
             cur.execute(query)
+        # Replace existing rasters within the same transaction
+        if replace and (par is not None):
+            delete_rasters(
+                con, schema, table, where=f"par='{par}'", commit=False
+            )
+        elif replace:
+            delete_rasters(con, schema, table, date, ens=ens, commit=False)
         # Copy to permanent table
         query = """
             INSERT INTO {0}.{1}({2}) (SELECT {2} FROM {3});
             """.format(schema, table, ",".join(columns), temptable)
         cur.execute(query)
-        con.commit()
+        query = """
+            DROP TABLE {0};
+            """.format(temptable)
+        cur.execute(query)
+        if commit:
+            con.commit()
         cur.close()
-    finally:
-        # con.close() # Closed in case something failed on the try
-        # con = connect(dbname)
+    except Exception:
+        # Nothing is written if something failed, only the temp table is dropped
+        con.rollback()
         cur = con.cursor()
         query = """
-            DROP TABLE {0};
+            DROP TABLE IF EXISTS {0};
             """.format(temptable)
         cur.execute(query)
         con.commit()
         cur.close()
-        # con.close()
+        raise
     return
 
 def verify_static_par_exists(con:pg.extensions.connection, schema:str,
@@ -651,8 +936,11 @@ def get_era5_for_point(con, schema:str, lon:float, lat:float,
     cur = con.cursor()
     df = DataFrame()
     for var in variables:
+        value = decoded_value_sql(
+            con, schema, f"era5_{var}", "ST_value(ra.rast, pn.pt_geom)"
+        )
         query = """
-        SELECT fdate, ST_value(ra.rast, pn.pt_geom) AS val
+        SELECT fdate, {6} AS val
         FROM {0}.era5_{1} AS ra,
             (
                 SELECT ST_SetSRID(ST_Point({2}, {3}), 4326) AS pt_geom
@@ -661,7 +949,7 @@ def get_era5_for_point(con, schema:str, lon:float, lat:float,
             ST_Within(pn.pt_geom, ST_Envelope(rast))
             AND fdate>=date '{4}' AND fdate<=date '{5}'
         """.format(schema, var, lon, lat, datefrom.strftime("%Y-%m-%d"),
-                   dateto.strftime("%Y-%m-%d"))
+                   dateto.strftime("%Y-%m-%d"), value)
         cur.execute(query)
         rows = np.array(cur.fetchall())
         if len(rows) < 1:
@@ -693,8 +981,11 @@ def get_prism_for_point(con, schema:str, lon:float, lat:float,
     cur = con.cursor()
     df = DataFrame()
     for var in variables:
+        value = decoded_value_sql(
+            con, schema, f"prism_{var}", "ST_value(ra.rast, pn.pt_geom)"
+        )
         query = """
-        SELECT fdate, ST_value(ra.rast, pn.pt_geom) AS val
+        SELECT fdate, {6} AS val
         FROM {0}.prism_{1} AS ra,
             (
                 SELECT ST_SetSRID(ST_Point({2}, {3}), 4326) AS pt_geom
@@ -703,7 +994,7 @@ def get_prism_for_point(con, schema:str, lon:float, lat:float,
             ST_Within(pn.pt_geom, ST_Envelope(rast))
             AND fdate>=date '{4}' AND fdate<=date '{5}'
         """.format(schema, var, lon, lat, datefrom.strftime("%Y-%m-%d"),
-                   dateto.strftime("%Y-%m-%d"))
+                   dateto.strftime("%Y-%m-%d"), value)
         cur.execute(query)
         rows = np.array(cur.fetchall())
         if len(rows) < 1:
@@ -747,8 +1038,11 @@ def get_nmme_for_point(con, schema:str, lon:float, lat:float,
     
     df = DataFrame()
     for var in variables:
+        value = decoded_value_sql(
+            con, schema, f"nmme_{var}", "ST_value(ra.rast, pn.pt_geom)"
+        )
         query = """
-        SELECT fdate, ST_value(ra.rast, pn.pt_geom) AS val
+        SELECT fdate, {7} AS val
         FROM {0}.nmme_{1} AS ra,
             (
                 SELECT ST_SetSRID(ST_Point({2}, {3}), 4326) AS pt_geom
@@ -757,7 +1051,7 @@ def get_nmme_for_point(con, schema:str, lon:float, lat:float,
             ST_Within(pn.pt_geom, ST_Envelope(rast))
             AND fdate>=date '{4}' AND fdate<=date '{5}' AND ens={6}
         """.format(schema, var, lon, lat, datefrom.strftime("%Y-%m-%d"),
-                   dateto.strftime("%Y-%m-%d"), ens)
+                   dateto.strftime("%Y-%m-%d"), ens, value)
         cur.execute(query)
         rows = np.array(cur.fetchall())
         if len(rows) < 1:
@@ -771,6 +1065,99 @@ def get_nmme_for_point(con, schema:str, lon:float, lat:float,
         return
     return df.sort_index()
 
+def soil_profile_hash(soil:str):
+    """
+    Returns the hash that identifies a soil profile. The hash excludes the 
+    profile ID and the site coordinates, so profiles with identical bodies at
+    different points share the same hash.
+    """
+    lines = soil.splitlines(keepends=True)
+    if len(lines) > 2:
+        lines[0] = lines[0][11:]
+        lines[2] = lines[2][:25] + lines[2][42:]
+    return hashlib.md5("".join(lines).encode()).hexdigest()
+
+def _soil_profile_sql(con, schema:str):
+    """
+    Returns the SQL for the profile id and profile text columns, and the join
+    clause to get them in a query to the soil table (aliased so). Soil tables
+    created before profiles were deduplicated store the profile text in the 
+    soil table (see migrate_soil_profiles).
+    """
+    if column_exists(con, schema, "soil", "profile"):
+        join = "JOIN {0}.soil_profile AS sp ON sp.profile=so.profile".format(
+            schema
+        )
+        return "sp.profile", "sp.soil", join
+    return "md5(so.soil)", "so.soil", ""
+
+def migrate_soil_profiles(con, schema:str):
+    """
+    Moves the soil profiles of a soil table created before profiles were 
+    deduplicated to the soil_profile table. Each unique profile is stored once,
+    and the soil points reference it.
+    """
+    if column_exists(con, schema, "soil", "profile"):
+        return
+    if not table_exists(con, schema, "soil_profile"):
+        _create_soil_profile_table(con, schema)
+    cur = con.cursor()
+    cur.execute("SELECT gid, soil FROM {0}.soil;".format(schema))
+    rows = cur.fetchall()
+    query = """
+        ALTER TABLE {0}.soil ADD COLUMN profile 
+            char(32) REFERENCES {0}.soil_profile (profile);
+        CREATE INDEX soil_profile ON {0}.soil (profile);
+        """.format(schema)
+    cur.execute(query)
+    profiles = {}
+    gid_profiles = []
+    for gid, soil in rows:
+        profile = soil_profile_hash(soil)
+        profiles.setdefault(profile, soil)
+        gid_profiles.append((profile, gid))
+    query = """
+        INSERT INTO {0}.soil_profile(profile, soil) VALUES (%s, %s)
+        ON CONFLICT DO NOTHING;
+        """.format(schema)
+    cur.executemany(query, list(profiles.items()))
+    query = """
+        UPDATE {0}.soil SET profile=%s WHERE gid=%s;
+        """.format(schema)
+    cur.executemany(query, gid_profiles)
+    cur.execute("ALTER TABLE {0}.soil DROP COLUMN soil;".format(schema))
+    con.commit()
+    cur.close()
+    logger.info(
+        f"{len(rows)} soil points of {schema}.soil reference " +\
+        f"{len(profiles)} unique profiles"
+    )
+    clear_soil_index(schema)
+
+def assign_soil_admin1(con, schema:str):
+    """
+    Assigns each soil point to the admin1 unit that contains it, and stores it
+    in the admin1 column of the soil table. The column is created if the soil
+    table was created before that column existed.
+    """
+    cur = con.cursor()
+    if not column_exists(con, schema, "soil", "admin1"):
+        query = """
+            ALTER TABLE {0}.soil ADD COLUMN admin1 text;
+            CREATE INDEX soil_admin1 ON {0}.soil (admin1);
+            """.format(schema)
+        cur.execute(query)
+    query = """
+        UPDATE {0}.soil AS so SET admin1 = ad.admin1
+        FROM {0}.admin AS ad
+        WHERE
+            ST_Contains(ad.geom, so.geom);
+        """.format(schema)
+    cur.execute(query)
+    con.commit()
+    cur.close()
+    clear_soil_index(schema)
+
 def get_soils(con, schema:str, admin1:str, mask:int=None):
     """
     Return the soils for a region (admin1). If mask is 1, then it'll return
@@ -781,22 +1168,140 @@ def get_soils(con, schema:str, admin1:str, mask:int=None):
         mask_query = ""
     else:
         mask_query = f"AND so.mask{mask}=TRUE"
+    _, soil_col, profile_join = _soil_profile_sql(con, schema)
     cur = con.cursor()
-    query = """
-        SELECT ST_X(so.geom), ST_Y(so.geom), so.soil, so.mask1, so.mask2 
-        FROM {0}.soil AS so, {0}.admin AS ad
-        WHERE
-            ST_Contains(ad.geom, so.geom)
-            AND ad.admin1='{1}'
-            {2};
-        """.format(schema, admin1.replace("'", "''"), mask_query)
-        # Single quote is represented as double quotes in the SQL query
-    cur.execute(query)
+    if column_exists(con, schema, "soil", "admin1"):
+        query = """
+            SELECT ST_X(so.geom), ST_Y(so.geom), {2}, so.mask1, so.mask2 
+            FROM {0}.soil AS so
+            {3}
+            WHERE
+                so.admin1=%s
+                {1};
+            """.format(schema, mask_query, soil_col, profile_join)
+    else:
+        query = """
+            SELECT ST_X(so.geom), ST_Y(so.geom), {2}, so.mask1, so.mask2 
+            FROM {0}.soil AS so
+            {3}, {0}.admin AS ad
+            WHERE
+                ST_Contains(ad.geom, so.geom)
+                AND ad.admin1=%s
+                {1};
+            """.format(schema, mask_query, soil_col, profile_join)
+    cur.execute(query, (admin1, ))
     rows = cur.fetchall()
     df = DataFrame(rows, columns=["lon", "lat", "soil", "mask1", "mask2"])
     cur.close()
     return df
 
+def get_soil_index(con, schema:str):
+    """
+    Returns the in memory soil index of the schema. The index is loaded from 
+    the soil table once, and then it is cached for the process. The index is a 
+    dict with:
+        gid, lon, lat, mask1, mask2, admin1, profile: arrays sorted by admin1
+        slices: dict mapping each admin1 to its slice of the arrays
+        point_profiles: dict mapping each (lon, lat) point to its profile id
+        profiles: dict mapping each profile id to its soil profile text
+    """
+    key = (con.info.dbname, schema.lower())
+    if key in _SOIL_INDEX:
+        return _SOIL_INDEX[key]
+    profile_col, soil_col, profile_join = _soil_profile_sql(con, schema)
+    cur = con.cursor()
+    if column_exists(con, schema, "soil", "admin1"):
+        query = """
+            SELECT so.gid, ST_X(so.geom), ST_Y(so.geom), so.mask1, so.mask2, 
+                so.admin1, {1}
+            FROM {0}.soil AS so
+            {2}
+            ORDER BY so.admin1, so.gid;
+            """.format(schema, profile_col, profile_join)
+    else: # admin1 was not assigned at ingest
+        query = """
+            SELECT DISTINCT ON (so.admin1, so.gid) so.* FROM (
+                SELECT so.gid, ST_X(so.geom), ST_Y(so.geom), so.mask1, 
+                    so.mask2, ad.admin1, {1}
+                FROM {0}.soil AS so
+                {2}
+                LEFT JOIN {0}.admin AS ad
+                    ON ST_Contains(ad.geom, so.geom)
+            ) AS so
+            ORDER BY so.admin1, so.gid;
+            """.format(schema, profile_col, profile_join)
+    cur.execute(query)
+    rows = cur.fetchall()
+    # Each unique profile is loaded once
+    query = """
+        SELECT DISTINCT {1}, {2} FROM {0}.soil AS so {3};
+        """.format(schema, profile_col, soil_col, profile_join)
+    cur.execute(query)
+    profiles = dict(cur.fetchall())
+    cur.close()
+    index = {
+        "gid": np.array([r[0] for r in rows], dtype=int),
+        "lon": np.array([r[1] for r in rows], dtype=float),
+        "lat": np.array([r[2] for r in rows], dtype=float),
+        "mask1": np.array([bool(r[3]) for r in rows], dtype=bool),
+        "mask2": np.array([bool(r[4]) for r in rows], dtype=bool),
+        "admin1": np.array([r[5] for r in rows], dtype=object),
+        "profile": np.array([r[6] for r in rows], dtype=object),
+        "point_profiles": {(r[1], r[2]): r[6] for r in rows},
+        "profiles": profiles,
+        "slices": {},
+    }
+    # Rows are sorted by admin1, then each admin1 is a contiguous slice
+    start = 0
+    for n in range(1, len(rows) + 1):
+        if (n == len(rows)) or (rows[n][5] != rows[start][5]):
+            index["slices"][rows[start][5]] = slice(start, n)
+            start = n
+    _SOIL_INDEX[key] = index
+    return index
+
+def get_admin1_soils(con, schema:str, admin1:str, mask:int=None):
+    """
+    Return the soil points for a region (admin1) from the in memory soil index.
+    If mask is 1, then it'll return only the soil points included in mask1, and
+    same case if mask is 2 but with mask2. If mask is None then it returns all 
+    points. Returns a DataFrame with the gid, lon, lat, mask1, mask2, and 
+    profile (profile id) columns. Use get_soil_profile to get the profile of 
+    each point.
+    """
+    index = get_soil_index(con, schema)
+    sl = index["slices"].get(admin1, slice(0, 0))
+    df = DataFrame({
+        col: index[col][sl] 
+        for col in ("gid", "lon", "lat", "mask1", "mask2", "profile")
+    })
+    if mask is not None:
+        df = df.loc[df[f"mask{mask}"]].reset_index(drop=True)
+    return df
+
+def get_soil_profile_id(con, schema:str, lon:float, lat:float):
+    """
+    Returns the profile id (hash) of the soil point at lon, lat. Soil points
+    with identical profiles share the same id.
+    """
+    return get_soil_index(con, schema)["point_profiles"][(lon, lat)]
+
+def get_soil_profile(con, schema:str, lon:float, lat:float):
+    """
+    Returns the soil profile for the soil point at lon, lat.
+    """
+    index = get_soil_index(con, schema)
+    return index["profiles"][index["point_profiles"][(lon, lat)]]
+
+def clear_soil_index(schema:str=None):
+    """
+    Removes the soil index of the schema from the process cache. If schema is
+    None the whole cache is cleared.
+    """
+    for key in list(_SOIL_INDEX):
+        if (schema is None) or (key[1] == schema.lower()):
+            _SOIL_INDEX.pop(key)
+
 def get_static_par(con, schema:str, lon:float, lat:float, par:str):
     """
     Get a static parameter value for a location
@@ -819,7 +1324,219 @@ def get_static_par(con, schema:str, lon:float, lat:float, par:str):
         return None 
     else:
         return rows[0][0]
+
+def get_static_grid(con, schema:str, par:str):
+    """
+    Returns a tuple with the static parameter raster as a 2D array and its 
+    geotransform (x_min, dx, 0, y_max, 0, dy). The raster is loaded from the 
+    static table only once and then it is cached for the process. Nodata 
+    pixels are NaN. It returns None if the parameter is not in the static table.
+    """
+    key = (con.info.dbname, schema.lower(), par)
+    if key in _STATIC_GRIDS:
+        return _STATIC_GRIDS[key]
+    if not table_exists(con, schema, "static"):
+        return None
+    cur = con.cursor()
+    query = """
+        WITH un AS (
+            SELECT ST_Union(rast) AS rast FROM {0}.static 
+            WHERE par=%s
+        )
+        SELECT 
+            ST_UpperLeftX(rast), ST_ScaleX(rast), 
+            ST_UpperLeftY(rast), ST_ScaleY(rast), ST_DumpValues(rast, 1)
+        FROM un
+        WHERE rast IS NOT NULL;
+        """.format(schema)
+    cur.execute(query, (par, ))
+    rows = cur.fetchall()
+    cur.close()
+    if len(rows) < 1:
+        return None
+    x_min, dx, y_max, dy, values = rows[0]
+    # Nodata values are returned as NULL
+    grid = (np.array(values, dtype=float), (x_min, dx, 0., y_max, 0., dy))
+    _STATIC_GRIDS[key] = grid
+    return grid
+
+def sample_static_grid(grid, lon, lat):
+    """
+    Samples a static grid (see get_static_grid) at the lon, lat points. It 
+    returns an array with the value of the pixel that contains each point, NaN
+    if the point is out of the grid.
+    """
+    values, (x_min, dx, _, y_max, _, dy) = grid
+    lon = np.asarray(lon, dtype=float)
+    lat = np.asarray(lat, dtype=float)
+    col = np.floor((lon - x_min)/dx).astype(int)
+    row = np.floor((lat - y_max)/dy).astype(int)
+    inside = (
+        (row >= 0) & (row < values.shape[0]) & 
+        (col >= 0) & (col < values.shape[1])
+    )
+    out = np.full(lon.shape, np.nan)
+    out[inside] = values[row[inside], col[inside]]
+    return out
+
+def get_static_pars(con, schema:str, points, pars):
+    """
+    Get the static parameters for a list of (lon, lat) points. It returns a 
+    DataFrame with lon, lat, and one column per parameter. Values are NaN where
+    the parameter is not available.
+    """
+    points = np.array(list(points), dtype=float).reshape(-1, 2)
+    df = DataFrame({"lon": points[:, 0], "lat": points[:, 1]})
+    for par in pars:
+        grid = get_static_grid(con, schema, par)
+        if grid is None:
+            df[par] = np.nan
+        else:
+            df[par] = sample_static_grid(grid, df.lon, df.lat)
+    return df
+
+def clear_static_cache(schema:str=None):
+    """
+    Removes the static grids of the schema from the process cache. If schema is
+    None the whole cache is cleared.
+    """
+    for key in list(_STATIC_GRIDS):
+        if (schema is None) or (key[1] == schema.lower()):
+            _STATIC_GRIDS.pop(key)
     
+def get_mean_rain(con, schema:str, points, weather_table:str='era5',
+                  years:int=10):
+    """
+    Returns the mean daily rainfall (mm) of the last years at the points 
+    [(lon, lat), ...]. The mean rainfall raster is calculated once for all the
+    points.
+    """
+    table = f"{weather_table}_rain"
+    latest = latest_date(con, schema, table)
+    # DateOffset moves Feb 29 to Feb 28 on non leap years
+    datefrom = (Timestamp(latest) - DateOffset(years=years)).to_pydatetime()
+    query = """
+        WITH clim AS (
+            SELECT ST_Union({2}, 'MEAN') AS rast FROM {0}.{1}
+            WHERE fdate>%s
+        ), pts AS (
+            SELECT 
+                unnest(%s::double precision[]) AS lon, 
+                unnest(%s::double precision[]) AS lat
+        )
+        SELECT ST_Value(clim.rast, ST_SetSRID(ST_Point(pts.lon, pts.lat), 4326))
+        FROM pts, clim;
+        """.format(schema, table, decoded_rast_sql(con, schema, table))
+    cur = con.cursor()
+    cur.execute(query, (
+        datefrom, [float(p[0]) for p in points], [float(p[1]) for p in points]
+    ))
+    rows = cur.fetchall()
+    cur.close()
+    return np.array(
+        [np.nan if r[0] is None else r[0] for r in rows], dtype=float
+    )
+
+def save_sample_plan(con, schema:str, admin1:str, nens:int, weather_table:str,
+                     method:str, plan:DataFrame):
+    """
+    Stores the sample plan for the admin1 unit, replacing the existing plan 
+    with the same nens, weather_table and method. plan is a DataFrame with the
+    soil_gid, soil_lon, soil_lat, weather_lon, weather_lat, ens and weight 
+    columns.
+    """
+    if not table_exists(con, schema, "sample_plan"):
+        _create_sample_plan_table(con, schema)
+    cur = con.cursor()
+    if not column_exists(con, schema, "sample_plan", "ens"):
+        # Plans stored before the ensemble member was part of the plan
+        cur.execute(
+            "ALTER TABLE {0}.sample_plan ADD COLUMN ens integer;".format(schema)
+        )
+    query = """
+        DELETE FROM {0}.sample_plan
+        WHERE admin1=%s AND nens=%s AND weather_table=%s AND method=%s;
+        """.format(schema)
+    cur.execute(query, (admin1, nens, weather_table, method))
+    query = """
+        INSERT INTO {0}.sample_plan (
+            admin1, nens, weather_table, method, soil_gid, soil_lon, soil_lat,
+            weather_lon, weather_lat, ens, weight
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s);
+        """.format(schema)
+    cur.executemany(query, [
+        (admin1, nens, weather_table, method, int(r.soil_gid), 
+         float(r.soil_lon), float(r.soil_lat), float(r.weather_lon), 
+         float(r.weather_lat), int(r.ens), int(r.weight))
+        for r in plan.itertuples()
+    ])
+    con.commit()
+    cur.close()
+
+def fetch_sample_plan(con, schema:str, admin1:str, nens:int, 
+                      weather_table:str, method:str):
+    """
+    Returns the stored sample plan for the admin1 unit (see save_sample_plan),
+    or None if there is not a plan. Plans stored without ensemble members are
+    ignored.
+    """
+    if not table_exists(con, schema, "sample_plan"):
+        return
+    if not column_exists(con, schema, "sample_plan", "ens"):
+        return
+    cur = con.cursor()
+    query = """
+        SELECT 
+            soil_gid, soil_lon, soil_lat, weather_lon, weather_lat, ens, weight
+        FROM {0}.sample_plan
+        WHERE admin1=%s AND nens=%s AND weather_table=%s AND method=%s
+            AND ens IS NOT NULL
+        ORDER BY soil_gid, weather_lon, weather_lat;
+        """.format(schema)
+    cur.execute(query, (admin1, nens, weather_table, method))
+    rows = cur.fetchall()
+    cur.close()
+    if len(rows) == 0:
+        return
+    return DataFrame(rows, columns=[
+        "soil_gid", "soil_lon", "soil_lat", "weather_lon", "weather_lat", 
+        "ens", "weight"
+    ])
+
+def set_forecast_version(con, schema:str, version:str):
+    """
+    Stamps the published forecast of the schema with version. It does not
+    commit, then the stamp is written in the same transaction that publishes
+    the forecast tables (see forecast.publish_forecast).
+    """
+    cur = con.cursor()
+    query = """
+        CREATE TABLE IF NOT EXISTS {0}.forecast_version (
+            version text NOT NULL,
+            published timestamp NOT NULL
+        );
+        DELETE FROM {0}.forecast_version;
+        INSERT INTO {0}.forecast_version (version, published) 
+        VALUES (%s, now());
+        """.format(schema)
+    cur.execute(query, (version, ))
+    cur.close()
+
+def fetch_forecast_version(con, schema:str):
+    """
+    Returns the version stamp of the published forecast of the schema, or None
+    if the forecast has not been stamped.
+    """
+    if not table_exists(con, schema, "forecast_version"):
+        return
+    cur = con.cursor()
+    cur.execute("SELECT version FROM {0}.forecast_version;".format(schema))
+    row = cur.fetchone()
+    cur.close()
+    if row is None:
+        return
+    return row[0]
+
 def check_admin1_in_country(con, schema, admin1):
     """
     Check if the admin1 unit is on the country geometry table.
@@ -837,6 +1554,19 @@ def check_admin1_in_country(con, schema, admin1):
     assert len(rows) == 1, f"Multiple {admin1} in {schema} schema"
     
     
+def get_admin1_units(con, schema):
+    """
+    Returns the list of all the admin units in the country geometry table.
+    """
+    cur = con.cursor()
+    query = """
+        SELECT admin1 FROM {0}.admin ORDER BY admin1;
+        """.format(schema)
+    cur.execute(query)
+    rows = cur.fetchall()
+    cur.close()
+    return [r[0] for r in rows]
+
 def fetch_admin1_list(con, schema):
     """
     NOT IMPLEMENTED, it was part of former stages of the service.
@@ -928,6 +1658,7 @@ def add_latest_forecast(con:pg.extensions.connection, schema:str, geojson:str):
     columns: admin1, pred_cat, pred, obs_avg, planting_p, ref_period, nitro_rate,
     urea_rate.
     """
+    import geopandas as gpd
     gdf = gpd.read_file(geojson)
     gdf["geometry"] = gdf.geometry.simplify(0.001)
 
@@ -952,8 +1683,11 @@ def add_latest_forecast(con:pg.extensions.connection, schema:str, geojson:str):
 def dataframe_to_table(con:pg.extensions.connection, df, schema, table, index_label):
     """
     Uploads a dataframe to the database. It is used to upload the latest forecast
-    results.
+    results. Uploads of the latest forecast tables stamp a new forecast 
+    version (see set_forecast_version), and drop the charts rendered for the
+    previous forecast.
     """
+    from sqlalchemy import create_engine
     if con.info.host == '/var/run/postgresql':
         host = 'localhost'
     else:
@@ -966,6 +1700,17 @@ def dataframe_to_table(con:pg.extensions.connection, df, schema, table, index_la
         if_exists="replace", index=True, index_label=index_label
     )
     engine.dispose()
+    if table.startswith("latest_forecast"):
+        if table_exists(con, schema, "latest_forecast_charts"):
+            cur = con.cursor()
+            cur.execute(
+                "DELETE FROM {0}.latest_forecast_charts;".format(schema)
+            )
+            cur.close()
+        set_forecast_version(
+            con, schema, datetime.now().strftime("%Y%m%d%H%M%S%f")
+        )
+        con.commit()
     
 def fetch_forecast_tables(con, schema, admin1):
     """
@@ -1004,6 +1749,24 @@ def fetch_forecast_tables(con, schema, admin1):
     overview_df = DataFrame(rows, columns=cols)
     return results_df, overview_df
 
+def fetch_forecast_charts(con, schema, admin1):
+    """
+    Returns a dict with the forecast charts rendered when the forecast was 
+    published (chart name: chart JSON text) for that admin1. It is empty if 
+    there are not stored charts.
+    """
+    if not table_exists(con, schema, "latest_forecast_charts"):
+        return {}
+    cur = con.cursor()
+    query = """
+        SELECT chart, payload FROM {0}.latest_forecast_charts
+        WHERE admin1=%s 
+        """.format(schema)
+    cur.execute(query, (admin1, ))
+    rows = cur.fetchall()
+    cur.close()
+    return dict(rows)
+
 def fetch_historical_data(con, schema, admin1):
     """
     NOT IMPLEMENTED, it was part of former stages of the service.
@@ -1,8 +1,8 @@
 """
 This module contains the function to run the model given a set of inputs.
 """
-from spatialDSSAT.run import GSRun
-from DSSATTools import Weather
+from __future__ import annotations
+from typing import TYPE_CHECKING
 import dssatservice.database as db
 
 import numpy as np
@@ -11,21 +11,65 @@ import pandas as pd
 from datetime import datetime, timedelta
 from itertools import product
 import tempfile
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed, Future
+from contextlib import nullcontext
+import threading
 import os
 import shutil
-from tqdm import tqdm
 import logging
-import psycopg2 as pg
 
-# For SRAD estimation when using NMME data
-from sklearn.neighbors import KNeighborsRegressor
+# spatialDSSAT, DSSATTools and scikit-learn (SRAD estimation when using NMME 
+# data, and stratified sampling) are imported by the functions that use them,
+# then importing this module is fast (see experiments/import_time.py).
+if TYPE_CHECKING:
+    import psycopg2 as pg
 
 
 MIN_SAMPLES = 4
+# Package-wide default for the ram option of the run functions. If True, the
+# input files of the runs (weather files) go to RAM_DIR. GSRun writes the DSSAT
+# runs to the default temporary directory, the process-wide setting is not 
+# changed here. Pool workers set it to their working directory, which is RAM
+# backed if the pool ram option is True (see pool.WorkerPool).
+RAM_SCRATCH = False
+RAM_DIR = "/dev/shm"
+RAM_MIN_FREE = 256*2**20 # Bytes that must remain free in RAM_DIR
+# Approximate scratch size of one weather file day, and one DSSAT treatment
+WTH_DAY_BYTES = 32
+TREATMENT_BYTES = 64*2**10
+NMME_ENSEMBLES = 10
 # MAX_SIM_LENGTH = 8*30  
 MAX_SIM_LENGTH = 270 # This is maximum simulation lenght since planting.
 logger = logging.getLogger(__name__)
 
+# Weather file variables, in the same order they are written
+WTH_VARIABLES = ("tmax", "tmin", "rain", "srad")
+WTH_HEADER = "$WEATHER DATA : Weather station\n\n" + \
+    "@ INSI      LAT     LONG  ELEV   TAV   AMP REFHT WNDHT  CCO2\n"
+
+# Treatment metadata columns added to the results (see typed_results)
+RESULTS_METADATA = ("soil_gid", "pixel_lon", "pixel_lat", "ens")
+# Types of the DSSAT results columns (see typed_results). Other columns are 
+# Float32.
+RESULTS_DTYPES = {
+    "RUN": "Int32", "CR": "category", "TRT": "Int32", "FLO": "Int32",
+    "MAT": "Int32", "TOPWT": "Int32", "HARWT": "Int32", "RAIN": "Int32",
+    "TIRR": "Int32", "CET": "Int32", "PESW": "Int32", "TNUP": "Int32",
+    "TNLF": "Int32", "TSON": "Int32", "TSOC": "Int32"
+}
+
+# Options of run_spatial_dssat_batch that change the results, and defaults
+BATCH_OPTIONS = (
+    ("nens", 50), ("all_random", True), ("overview", False), 
+    ("weather_table", "era5"), ("stratified", False), ("seed", None),
+    ("expand", True)
+)
+# Runs in progress in the process, batch_key: Future. Identical runs 
+# requested meanwhile wait for the same result (see run_spatial_dssat_batch)
+_IN_FLIGHT = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
 HARM_VARS = ["constant", "cos1", "sin1", "cos2", "sin2"]
 def add_harmonic_coefs(tmp_df):
     """
@@ -47,10 +91,13 @@ def run_spatial_dssat(con:pg.extensions.connection, schema:str, admin1:str,
                       nitrogen:list[tuple], nens:int=50, 
                       all_random:bool=True, overview:bool=False,
                       return_input=False, weather_table:str='era5',
-                      **kwargs):
+                      stratified:bool=False, seed:int=None, ram:bool=None,
+                      expand:bool=True, progress=None, slot=None, **kwargs):
     """
     Runs DSSAT in spatial mode for the defined country (schema) and admin
-    subdivision (admin1). 
+    subdivision (admin1). Results have the RESULTS_DTYPES types with NA for
+    the missing values, and the treatment metadata columns soil_gid, pixel_lon,
+    pixel_lat (weather pixel) and ens (see typed_results).
 
     Parameters
     ----------
@@ -84,255 +131,1525 @@ def run_spatial_dssat(con:pg.extensions.connection, schema:str, admin1:str,
         conection to dbname
     weather_table: str
         Weather table to get the data from. Default is era5
+    stratified: bool
+        If True, the stored stratified sample plan is used instead of random 
+        sampling (see stratified_plan).
+    seed: int
+        Seed for the pixel sampling. By default the stored sample plan is used
+        (see sample_pixels).
+    ram: bool
+        If True, the input files of the run go to a RAM backed directory 
+        (see scratch_dir and RAM_SCRATCH). By default RAM_SCRATCH.
+    expand: bool
+        If False, identical treatments are returned once with their weight
+        instead of being expanded to nens rows (see run_spatial_dssat_batch).
+    progress: callable
+        If passed, it is called as progress(stage, done, total) as the run 
+        advances (see run_spatial_dssat_batch).
+    slot: context manager
+        Admission of the run (see run_spatial_dssat_batch).
     kwargs: 
         kwargs to pass to the GSRun.run function
     """
+    if return_input:
+        # Simulation will start 30 days prior (As sugested by Ines et al., 2013)
+        start_date = plantingdate - timedelta(days=30)
+        end_date = plantingdate + timedelta(days=MAX_SIM_LENGTH)
+        pairs = sample_pixels(
+            con, schema, admin1, start_date, nens, all_random, weather_table,
+            stratified=stratified, seed=seed
+        )
+        folder = scratch_dir(ram, scratch_size(
+            pairs.weather.nunique(), 0, start_date, end_date
+        ))
+        inputs = write_inputs(
+            con, schema, pairs, start_date, end_date, 
+            tempfile.mkdtemp(dir=folder), weather_table, progress=progress
+        )
+        input_files = []
+        for row in inputs.itertuples():
+            input_files += [(
+                (row.weather, row.wth),
+                (row.soil, row.soil_profile)
+            )]*row.weight
+        return input_files
+    # Run DSSAT
+    # Set automatic management
+    # planting_window_start = plantingdate - timedelta(days=15)
+    # planting_window_end = plantingdate + timedelta(days=15)
+    # sim_controls = {
+    #     "PLANT": "F", # Automatic, force in last day of window
+    #     "PFRST": planting_window_start.strftime("%y%j"),
+    #     "PLAST": planting_window_end.strftime("%y%j"),
+    #     "PH2OL": 50, "PH2OU": 100, "PH2OD": 20, 
+    #     "PSTMX": 40, "PSTMN": 10
+    # }
+    # Get run kwargs if defined
+    scenario = {
+        "id": 0,
+        "plantingdate": plantingdate,
+        "cultivar": cultivar,
+        "nitrogen": nitrogen,
+        "sim_controls": kwargs.get("sim_controls", {}),
+        "start_date": kwargs.get("start_date"),
+    }
+    out = run_spatial_dssat_batch(
+        con, schema, admin1, [scenario], nens, all_random, overview, 
+        weather_table, stratified, seed, ram=ram, expand=expand,
+        progress=progress, slot=slot
+    )
+    if overview:
+        out, overviews = out
+        return out.drop(columns=["scenario"]), overviews[0]
+    return out.drop(columns=["scenario"])
+
+def batch_key(dbname:str, schema:str, admin1:str, scenarios:list[dict],
+              **options):
+    """
+    Returns a hashable key for a run_spatial_dssat_batch call on the database
+    dbname. options are the keyword arguments that change the results 
+    (BATCH_OPTIONS), missing ones take their default value. Calls with the 
+    same key give the same results.
+    """
+    return (
+        dbname, schema, admin1,
+        tuple((scn["id"], scenario_key(scn)) for scn in scenarios),
+        tuple(options.get(name, default) for name, default in BATCH_OPTIONS)
+    )
+
+def scenario_key(scenario:dict):
+    """
+    Returns a hashable key for the scenario inputs (planting date, cultivar,
+    nitrogen, simulation start and simulation controls). Scenarios with the
+    same key give the same results.
+    """
+    sim_controls = scenario.get("sim_controls") or {}
+    return (
+        scenario["plantingdate"], scenario["cultivar"],
+        tuple(tuple(app) for app in scenario["nitrogen"]),
+        scenario.get("start_date"),
+        repr(sorted(sim_controls.items()))
+    )
+
+def run_spatial_dssat_batch(con:pg.extensions.connection, schema:str, 
+                            admin1:str, scenarios:list[dict], nens:int=50,
+                            all_random:bool=True, overview:bool=False,
+                            weather_table:str='era5', stratified:bool=False,
+                            seed:int=None, input_cache=None, ram:bool=None,
+                            expand:bool=True, progress=None, slot=None):
+    """
+    Runs several scenarios for the same admin subdivision (admin1) sharing the
+    same inputs. Soil and weather pixels are sampled, and the weather files are
+    written only once for the period that covers all the scenarios. Then, 
+    every scenario x pixel combination is added as a treatment. Scenarios with
+    the same simulation start and simulation controls are run in the same 
+    DSSAT execution. It returns a DataFrame with the results of all the 
+    scenarios, tagged by the scenario column. An identical call (same 
+    batch_key) made while the run is in progress in the process does not run
+    again, it waits for the run and gets a copy of its results.
+
+    Parameters
+    ----------
+    con: pg.extensions.connection
+        pg connection
+    schema: str
+        Name of the schema (country)
+    admin1: str
+        Name of the administrative subdivision in that country
+    scenarios: list of dict
+        Each scenario is a dict with the next keys: id (scenario id), 
+        plantingdate (datetime), cultivar (DSSAT cultivar code), nitrogen (list
+        of (days after planting, kg/ha) tuples). Optionally, sim_controls (dict
+        of simulation controls passed to GSRun.run), and start_date (simulation
+        start, 30 days before planting by default).
+    nens: int
+        Number of random samples within the region
+    all_random: bool
+        If false soil and weather are from the same pixel. If true soil and
+        weather pixels are shuffled and randomly selected.
+    overview: bool
+        If true it will also return a dict mapping each scenario id to its 
+        overview file lines.
+    weather_table: str
+        Weather table to get the data from. Default is era5
+    stratified: bool
+        If True, the stored stratified sample plan is used instead of random 
+        sampling (see stratified_plan).
+    seed: int
+        Seed for the pixel sampling. By default the stored sample plan is used
+        (see sample_pixels).
+    input_cache: InputCache
+        If passed, the weather files are kept in the cache and reused by the
+        next runs with the same weather window.
+    ram: bool
+        If True, the input files of the run go to a RAM backed directory 
+        (see scratch_dir and RAM_SCRATCH). By default RAM_SCRATCH.
+    expand: bool
+        Identical treatments are simulated once. If True, the results are 
+        expanded back to the sampled ensemble (nens rows per scenario). If 
+        False, there is one row per distinct treatment, and the weight column
+        has the number of ensemble members it represents. The overview is not
+        expanded either.
+    progress: callable
+        If passed, it is called as progress(stage, done, total) as the run 
+        advances. Stages are sampling, weather (one step per weather pixel
+        retrieved) and simulation (one step per DSSAT execution).
+    slot: context manager
+        If passed, the run holds it while it is in progress, e.g. a slot of 
+        the scheduler (see scheduler.Scheduler.slot). It is not entered if 
+        the run waits for an identical run in progress, then waiting runs do
+        not take the slots of the runs that do the work.
+    """
+    key = batch_key(
+        con.info.dbname, schema, admin1, scenarios, nens=nens, 
+        all_random=all_random, overview=overview, weather_table=weather_table,
+        stratified=stratified, seed=seed, expand=expand
+    )
+    with _IN_FLIGHT_LOCK:
+        future = _IN_FLIGHT.get(key)
+        leader = future is None
+        if leader:
+            future = Future()
+            _IN_FLIGHT[key] = future
+    if not leader:
+        # The same run is in progress, its result is shared
+        logger.info(f"Attached to the run in progress for {admin1}")
+        out = future.result()
+        if overview:
+            return out[0].copy(), dict(out[1])
+        return out.copy()
+    try:
+        with slot or nullcontext():
+            out = _run_spatial_dssat_batch(
+                con, schema, admin1, scenarios, nens, all_random, overview,
+                weather_table, stratified, seed, input_cache, ram, expand, 
+                progress
+            )
+        future.set_result(out)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _IN_FLIGHT_LOCK:
+            _IN_FLIGHT.pop(key, None)
+    if overview:
+        return out[0].copy(), dict(out[1])
+    return out.copy()
+
+def _run_spatial_dssat_batch(con:pg.extensions.connection, schema:str, 
+                             admin1:str, scenarios:list[dict], nens:int=50,
+                             all_random:bool=True, overview:bool=False,
+                             weather_table:str='era5', stratified:bool=False,
+                             seed:int=None, input_cache=None, ram:bool=None,
+                             expand:bool=True, progress=None):
+    """
+    Runs the scenarios, see run_spatial_dssat_batch.
+    """
+    from spatialDSSAT.run import GSRun
+    assert len(scenarios) > 0, "At least one scenario must be passed"
+    ids = [scn["id"] for scn in scenarios]
+    assert len(set(ids)) == len(ids), "Scenario ids must be unique"
+    # Identical scenarios are simulated once
+    unique_scenarios = {}
+    for scn in scenarios:
+        unique_scenarios.setdefault(scenario_key(scn), []).append(scn["id"])
+    duplicates = {
+        scn_ids[0]: scn_ids[1:] for scn_ids in unique_scenarios.values()
+    }
+    scenarios = [scn for scn in scenarios if scn["id"] in duplicates]
     # Simulation will start 30 days prior (As sugested by Ines et al., 2013)
-    # start_date = plantingdate
-    start_date = plantingdate - timedelta(days=30)
+    start_dates = {
+        scn["id"]: scn.get("start_date") or \
+            (scn["plantingdate"] - timedelta(days=30))
+        for scn in scenarios
+    }
+    start_date = min(start_dates.values())
+    end_date = max(
+        scn["plantingdate"] for scn in scenarios
+    ) + timedelta(days=MAX_SIM_LENGTH)
+
+    pairs = sample_pixels(
+        con, schema, admin1, start_date, nens, all_random, weather_table,
+        stratified=stratified, seed=seed
+    )
+    if progress is not None:
+        progress("sampling", 1, 1)
+    scratch = scratch_dir(ram, scratch_size(
+        pairs.weather.nunique(), len(pairs)*len(scenarios), start_date, 
+        end_date
+    ))
+    if input_cache is None:
+        tmp_dir = tempfile.TemporaryDirectory(dir=scratch)
+        folder, weather_files = tmp_dir.name, {}
+    else:
+        tmp_dir = None
+        latest_past_weather = db.latest_date(
+            con, schema, f"{weather_table}_rain"
+        )
+        # Weather files in forecast mode change when new NMME data arrives
+        latest_forecast_weather = None
+        if latest_past_weather < end_date:
+            latest_forecast_weather = db.latest_date(con, schema, "nmme_rain")
+        folder, weather_files = input_cache.get((
+            schema, weather_table, start_date, end_date, latest_past_weather,
+            latest_forecast_weather
+        ))
+    inputs = write_inputs(
+        con, schema, pairs, start_date, end_date, folder, weather_table,
+        weather_files, progress
+    )
+    weights = list(inputs.weight)
+
+    # Scenarios that can share the same DSSAT execution
+    groups = {}
+    for scn in scenarios:
+        key = (start_dates[scn["id"]], scenario_key(scn)[-1])
+        groups.setdefault(key, []).append(scn)
+
+    results = []
+    overviews = {}
+    for n_group, ((group_start, _), group) in enumerate(groups.items()):
+        if progress is not None:
+            progress("simulation", n_group, len(groups))
+        gs = GSRun()
+        for scn in group:
+            # Planting 
+            planting = {
+                "PDATE": scn["plantingdate"], 
+                "PLDP": 5
+            }
+            for row in inputs.itertuples():
+                gs.add_treatment(
+                    soil_profile=row.soil_profile,
+                    weather=row.wth,
+                    nitrogen=scn["nitrogen"],
+                    planting=planting,
+                    cultivar=scn["cultivar"]
+                )
+        out = gs.run(
+            start_date=group_start,
+            sim_controls=group[0].get("sim_controls") or {}
+        )
+        assert len(out) == len(group)*len(inputs), \
+            "DSSAT output does not match the number of treatments"
+        header, runs = split_overview(gs.overview)
+        for n, scn in enumerate(group):
+            scn_out = typed_results(
+                out.iloc[n*len(inputs):(n + 1)*len(inputs)], inputs
+            )
+            scn_overview = header + sum(
+                runs[n*len(inputs):(n + 1)*len(inputs)], []
+            )
+            if expand:
+                # Expand the distinct treatments back to the sampled ensemble
+                scn_out = scn_out.loc[scn_out.index.repeat(weights)]
+                scn_overview = expand_overview(scn_overview, weights)
+            else:
+                scn_out = scn_out.assign(weight=weights)
+            scn_out = scn_out.reset_index(drop=True)
+            if scn_out.MAT.isna().mean() > .5:
+                logger.warning(
+                    "Most of the simulations were terminated before reaching "
+                    "maturity. It is likely that the available weather data "
+                    "was not long enough to complete the simulation."
+                )
+            for scn_id in [scn["id"]] + duplicates[scn["id"]]:
+                results.append(scn_out.assign(scenario=scn_id))
+                if overview:
+                    overviews[scn_id] = scn_overview
+    if progress is not None:
+        progress("simulation", len(groups), len(groups))
+    if tmp_dir is not None:
+        tmp_dir.cleanup()
+    # Results in the same order the scenarios were passed
+    out = pd.concat(results, ignore_index=True)
+    out.insert(0, "scenario", out.pop("scenario"))
+    out = out.iloc[
+        np.argsort([ids.index(i) for i in out.scenario], kind="stable")
+    ].reset_index(drop=True)
+    if overview:
+        return out, overviews
+    return out
+
+def quantiles_change(previous:np.ndarray, current:np.ndarray):
+    """
+    Returns the maximum change between two sets of yield quantiles, relative 
+    to the current median yield.
+    """
+    scale = max(abs(np.median(current)), 1.)
+    return np.max(np.abs(current - previous))/scale
+
+def run_spatial_dssat_adaptive(con:pg.extensions.connection, schema:str, 
+                               admin1:str, plantingdate:datetime, 
+                               cultivar:str, nitrogen:list[tuple],
+                               min_nens:int=20, max_nens:int=200, 
+                               batch_size:int=10, tol:float=0.05,
+                               quantiles:tuple=(.05, .25, .5, .75, .95),
+                               overview:bool=False, weather_table:str='era5',
+                               seed:int=None, ram:bool=None, **kwargs):
+    """
+    Runs DSSAT in spatial mode for the admin subdivision (admin1) using an 
+    adaptive number of samples. Samples are simulated in batches, and the 
+    simulation stops when the yield quantiles change less than tol (relative
+    to the median yield) after adding a batch. At least min_nens and at most
+    max_nens samples are simulated. Then, homogeneous regions finish sooner, 
+    while heterogeneous regions get more samples. Parameters are the same as
+    run_spatial_dssat.
+
+    Parameters
+    ----------
+    min_nens: int
+        Minimum number of samples
+    max_nens: int
+        Maximum number of samples
+    batch_size: int
+        Number of samples added on each batch
+    tol: float
+        Maximum change of the quantiles, relative to the median yield, to
+        consider that the yield distribution is stable.
+    quantiles: tuple
+        Yield quantiles to track.
+    seed: int
+        Seed for the pixel sampling. By default it is derived from the admin1
+        and the batch parameters, then identical requests sample the same
+        pixels.
+    ram: bool
+        If True, the input files of the run go to a RAM backed directory 
+        (see scratch_dir and RAM_SCRATCH). By default RAM_SCRATCH.
+    """
+    from spatialDSSAT.run import GSRun
+    assert 0 < min_nens <= max_nens, "min_nens must be in (0, max_nens]"
+    # Simulation will start 30 days prior (As sugested by Ines et al., 2013)
+    start_date = kwargs.get("start_date") or \
+        (plantingdate - timedelta(days=30))
     end_date = plantingdate + timedelta(days=MAX_SIM_LENGTH)
+    sim_controls = kwargs.get("sim_controls", {})
+    
     db.check_admin1_in_country(con, schema, admin1)
-    # Get soils and verify a minimum number of pixel samples
-    soils = db.get_soils(con, schema, admin1, 1)
-    # Assign weather retrieval function
-    if weather_table == 'era5':
-        get_weather_for_point = db.get_era5_for_point
-    elif weather_table == 'prism':
-        get_weather_for_point = db.get_prism_for_point
+    weather_pixels = get_weather_pixels(
+        con, schema, start_date, weather_table, [admin1]
+    ).get(admin1, [])
+    folder = scratch_dir(ram, scratch_size(
+        max_nens, max_nens, start_date, end_date
+    ))
+    tmp_dir = tempfile.TemporaryDirectory(dir=folder)
+    weather_files = {}
+    planting = {
+        "PDATE": plantingdate, 
+        "PLDP": 5
+    }
+    results = []
+    overviews = []
+    nens = 0
+    previous = None
+    while nens < max_nens:
+        batch = min(batch_size, max_nens - nens)
+        # Each batch gets its own seed, otherwise batches would be identical
+        pairs = sample_pixels(
+            con, schema, admin1, start_date, batch, True, weather_table,
+            weather_pixels, seed=sampling_seed(
+                seed, schema, admin1, batch_size, weather_table, nens
+            )
+        )
+        inputs = write_inputs(
+            con, schema, pairs, start_date, end_date, tmp_dir.name, 
+            weather_table, weather_files
+        )
+        nens += int(pairs.weight.sum())
+        if len(inputs) > 0:
+            gs = GSRun()
+            for row in inputs.itertuples():
+                gs.add_treatment(
+                    soil_profile=row.soil_profile,
+                    weather=row.wth,
+                    nitrogen=nitrogen,
+                    planting=planting,
+                    cultivar=cultivar
+                )
+            out = gs.run(start_date=start_date, sim_controls=sim_controls)
+            out = typed_results(out, inputs)
+            weights = list(inputs.weight)
+            # Expand the distinct treatments back to the sampled ensemble
+            results.append(
+                out.loc[out.index.repeat(weights)].reset_index(drop=True)
+            )
+            if overview:
+                overviews.append(expand_overview(gs.overview, weights))
+        if pairs.weight.sum() != batch:
+            # All the pixel combinations were sampled, the region is too 
+            # small to get more samples.
+            break
+        if nens < min_nens or len(results) == 0:
+            continue
+        out = pd.concat(results, ignore_index=True)
+        harwt = out.loc[out.MAT.notna(), "HARWT"].dropna().astype(float)
+        if len(harwt) == 0:
+            continue
+        current = harwt.quantile(quantiles).values
+        if previous is not None and quantiles_change(previous, current) < tol:
+            break
+        previous = current
+    tmp_dir.cleanup()
+    assert len(results) > 0, f"No valid inputs for {admin1}"
+    out = pd.concat(results, ignore_index=True)
+    logger.info(f"{admin1} converged after {len(out)} samples")
+    if overview:
+        header, _ = split_overview(overviews[0])
+        runs = sum([split_overview(ov)[1] for ov in overviews], [])
+        return out, header + sum(runs, [])
+    return out
+
+def run_national_dssat(con:pg.extensions.connection, schema:str,
+                       plantingdate, cultivar, nitrogen,
+                       admin1_list:list=None, nens:int=50,
+                       all_random:bool=True, overview:bool=False,
+                       weather_table:str='era5', workers:int=None,
+                       on_result=None, stratified:bool=False, seed:int=None,
+                       ram:bool=None, progress=None, **kwargs):
+    """
+    Runs DSSAT in spatial mode for several admin subdivisions of the country
+    (schema). Pixels for all the admin subdivisions are sampled in one pass, 
+    and the weather files are written once for the union of the sampled 
+    pixels. Then, the treatments of each admin subdivision are run in a pool 
+    of workers. It returns one DataFrame with the results of all the admin
+    subdivisions, tagged by the admin1 column.
+
+    Parameters
+    ----------
+    con: pg.extensions.connection
+        pg connection
+    schema: str
+        Name of the schema (country)
+    plantingdate: datetime or dict
+        Planting date. A dict mapping each admin1 to its planting date can be
+        passed.
+    cultivar: str or dict
+        Cultivar code. A dict mapping each admin1 to its cultivar can be 
+        passed.
+    nitrogen: list of tuples or dict
+        Nitrogen applications (see run_spatial_dssat). A dict mapping each
+        admin1 to its nitrogen applications can be passed.
+    admin1_list: list
+        List of the admin subdivisions to run. By default all the admin 
+        subdivisions in the schema.
+    nens: int
+        Number of random samples within each admin subdivision
+    all_random: bool
+        If false soil and weather are from the same pixel. If true soil and
+        weather pixels are shuffled and randomly selected.
+    overview: bool
+        If true it will also return a dict mapping each admin1 to its overview
+        file lines.
+    weather_table: str
+        Weather table to get the data from. Default is era5
+    workers: int
+        Number of DSSAT runs executed at the same time. By default the number
+        of CPUs.
+    on_result: callable
+        Function called as on_result(admin1, results, overview) as soon as an
+        admin subdivision is done. It allows to stream the results somewhere 
+        else while the other admin subdivisions are still running.
+    stratified: bool
+        If True, the stored stratified sample plans are used instead of random
+        sampling (see precompute_sample_plans).
+    seed: int
+        Seed for the pixel sampling. By default the stored sample plans are 
+        used (see sample_pixels).
+    ram: bool
+        If True, the input files of the run go to a RAM backed directory 
+        (see scratch_dir and RAM_SCRATCH). By default RAM_SCRATCH.
+    progress: callable
+        If passed, it is called as progress(stage, done, total) as the run 
+        advances. Stages are sampling (admin subdivisions sampled), weather 
+        (weather files written) and simulation (admin subdivisions done).
+    kwargs: 
+        kwargs to pass to the GSRun.run function
+    """
+    from spatialDSSAT.run import GSRun
+    if admin1_list is None:
+        admin1_list = db.get_admin1_units(con, schema)
     else:
+        all_admin1 = set(db.get_admin1_units(con, schema))
+        for admin1 in admin1_list:
+            assert admin1 in all_admin1, f"{admin1} not in {schema} schema"
+    def by_admin1(par, admin1):
+        return par[admin1] if isinstance(par, dict) else par
+    plantingdates = {
+        admin1: by_admin1(plantingdate, admin1) for admin1 in admin1_list
+    }
+    # Simulation will start 30 days prior (As sugested by Ines et al., 2013)
+    start_dates = {
+        admin1: kwargs.get("start_date") or (pdate - timedelta(days=30))
+        for admin1, pdate in plantingdates.items()
+    }
+    start_date = min(start_dates.values())
+    end_date = max(plantingdates.values()) + timedelta(days=MAX_SIM_LENGTH)
+    sim_controls = kwargs.get("sim_controls", {})
+
+    # Sample all the admin subdivisions in one pass
+    weather_pixels = get_weather_pixels(
+        con, schema, start_date, weather_table, admin1_list
+    )
+    pairs = []
+    for n, admin1 in enumerate(admin1_list):
+        if progress is not None:
+            progress("sampling", n, len(admin1_list))
+        try:
+            admin_pairs = sample_pixels(
+                con, schema, admin1, start_date, nens, all_random, 
+                weather_table, weather_pixels.get(admin1, []), stratified,
+                None if seed is None else sampling_seed(seed, admin1)
+            )
+        except AssertionError as e:
+            logger.warning(f"{admin1} skipped: {e}")
+            continue
+        admin_pairs.insert(0, "admin1", admin1)
+        pairs.append(admin_pairs)
+    if progress is not None:
+        progress("sampling", len(admin1_list), len(admin1_list))
+    assert len(pairs) > 0, f"No admin subdivision of {schema} could be sampled"
+    pairs = pd.concat(pairs, ignore_index=True)
+
+    folder = scratch_dir(ram, scratch_size(
+        pairs.weather.nunique(), len(pairs), start_date, end_date
+    ))
+    tmp_dir = tempfile.TemporaryDirectory(dir=folder)
+    inputs = write_inputs(
+        con, schema, pairs, start_date, end_date, tmp_dir.name, weather_table,
+        progress=progress
+    )
+
+    def run_admin1(admin1):
+        admin_inputs = inputs.loc[inputs.admin1 == admin1]
+        if len(admin_inputs) == 0:
+            return admin1, None, None
+        planting = {
+            "PDATE": plantingdates[admin1], 
+            "PLDP": 5
+        }
+        gs = GSRun()
+        for row in admin_inputs.itertuples():
+            gs.add_treatment(
+                soil_profile=row.soil_profile,
+                weather=row.wth,
+                nitrogen=by_admin1(nitrogen, admin1),
+                planting=planting,
+                cultivar=by_admin1(cultivar, admin1)
+            )
+        out = gs.run(
+            start_date=start_dates[admin1],
+            sim_controls=sim_controls
+        )
+        out = typed_results(out, admin_inputs)
+        weights = list(admin_inputs.weight)
+        # Expand the distinct treatments back to the sampled ensemble
+        out = out.loc[out.index.repeat(weights)].reset_index(drop=True)
+        out.insert(0, "admin1", admin1)
+        admin_overview = None
+        if overview:
+            admin_overview = expand_overview(gs.overview, weights)
+        return admin1, out, admin_overview
+
+    # DSSAT runs as an external executable, then threads are enough to run
+    # several admin subdivisions at the same time.
+    results = {}
+    overviews = {}
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = {
+            pool.submit(run_admin1, admin1): admin1 for admin1 in admin1_list
+        }
+        if progress is not None:
+            progress("simulation", 0, len(futures))
+        for n, future in enumerate(as_completed(futures)):
+            if progress is not None:
+                progress("simulation", n + 1, len(futures))
+            # A failed admin subdivision does not abort the others
+            try:
+                admin1, out, admin_overview = future.result()
+            except Exception:
+                logger.exception(f"{futures[future]} failed")
+                continue
+            if out is None:
+                logger.warning(f"No valid inputs for {admin1}")
+                continue
+            results[admin1] = out
+            overviews[admin1] = admin_overview
+            if on_result is not None:
+                on_result(admin1, out, admin_overview)
+    tmp_dir.cleanup()
+    assert len(results) > 0, f"No admin subdivision of {schema} was simulated"
+    out = pd.concat(
+        [results[admin1] for admin1 in admin1_list if admin1 in results],
+        ignore_index=True
+    )
+    if out.MAT.isna().mean() > .5:
+        logger.warning(
+            "Most of the simulations were terminated before reaching maturity. "
+            "It is likely that the available weather data was not long enough "
+            "to complete the simulation."
+        )
+    if overview:
+        return out, overviews
+    return out
+
+def get_weather_pixels(con:pg.extensions.connection, schema:str,
+                       start_date:datetime, weather_table:str='era5',
+                       admin1_list:list=None):
+    """
+    Returns a dict with the centroids (lon, lat) of the weather pixels within
+    each admin subdivision. All the admin subdivisions are queried at once. If 
+    admin1_list is None, all the admin subdivisions in the schema are returned.
+    """
+    if weather_table not in ('era5', 'prism'):
         raise NameError(f'{weather_table} tables not in database')
-    # Get weather pixels
     query = """
         WITH pts As ( 
-        SELECT (ST_PixelAsCentroids(ST_Clip(wt.rast, ad.geom))).geom as geom
+        SELECT 
+            ad.admin1,
+            (ST_PixelAsCentroids(ST_Clip(wt.rast, ad.geom))).geom as geom
         FROM {0}.{1}_rain as wt, {0}.admin as ad
         WHERE 
             fdate=%s
-        AND ad.admin1=%s
+        AND ST_Intersects(wt.rast, ad.geom)
+        {2}
         )  
-        SELECT ST_X(geom), ST_Y(geom) FROM pts;
-        """.format(schema, weather_table)
+        SELECT admin1, ST_X(geom), ST_Y(geom) FROM pts;
+        """.format(
+            schema, weather_table, 
+            "" if admin1_list is None else "AND ad.admin1 = ANY(%s)"
+        )
     cur = con.cursor()
-    cur.execute(query, (start_date, admin1,))
+    if admin1_list is None:
+        cur.execute(query, (start_date,))
+    else:
+        cur.execute(query, (start_date, list(admin1_list)))
     rows = cur.fetchall()
     cur.close()
-    all_pixels_weather = pd.Series([(i[0], i[1]) for i in rows])
+    weather_pixels = {}
+    for admin1, lon, lat in rows:
+        weather_pixels.setdefault(admin1, []).append((lon, lat))
+    return weather_pixels
+
+class InputCache:
+    """
+    Keeps the weather files written by previous runs, so the next runs with 
+    the same weather window reuse them. Each weather window gets its own 
+    folder within folder. Only the latest max_windows windows are kept. It is
+    meant for long lived processes (see dssatservice.pool).
+    """
+    def __init__(self, folder:str, max_windows:int=8):
+        os.makedirs(folder, exist_ok=True)
+        self.folder = folder
+        self.max_windows = max_windows
+        self.windows = {}
+
+    def get(self, key:tuple):
+        """
+        Returns the folder and the weather files dict (see write_inputs) for 
+        the weather window key.
+        """
+        if key in self.windows:
+            # Most recently used windows are the last ones
+            self.windows[key] = self.windows.pop(key)
+            return self.windows[key]
+        while len(self.windows) >= self.max_windows:
+            oldest = next(iter(self.windows))
+            shutil.rmtree(self.windows.pop(oldest)[0], ignore_errors=True)
+        folder = tempfile.mkdtemp(dir=self.folder)
+        self.windows[key] = (folder, {})
+        return self.windows[key]
+
+    def clear(self):
+        """
+        Removes all the cached weather files.
+        """
+        for folder, _ in self.windows.values():
+            shutil.rmtree(folder, ignore_errors=True)
+        self.windows = {}
+
+def scratch_dir(ram:bool=None, size:int=0):
+    """
+    Returns the directory for the scratch data of a run, or None to use the
+    default temporary directory. If ram is True (RAM_SCRATCH by default), it
+    returns RAM_DIR when it is writable and has room for size bytes plus 
+    RAM_MIN_FREE. Otherwise it falls back to the default temporary directory.
+    """
+    if ram is None:
+        ram = RAM_SCRATCH
+    if not ram:
+        return
+    if not (os.path.isdir(RAM_DIR) and os.access(RAM_DIR, os.W_OK)):
+        logger.warning(f"{RAM_DIR} is not available, using the disk instead")
+        return
+    free = shutil.disk_usage(RAM_DIR).free
+    if free - size < RAM_MIN_FREE:
+        logger.warning(
+            f"Not enough space in {RAM_DIR} ({free/2**20:.0f} MB free, "
+            f"{size/2**20:.0f} MB required), using the disk instead"
+        )
+        return
+    return RAM_DIR
+
+def scratch_size(n_weather:int, n_treatments:int, start_date:datetime, 
+                 end_date:datetime):
+    """
+    Returns the approximate scratch size (bytes) of a run.
+    """
+    days = (end_date - start_date).days + 1
+    return n_weather*days*WTH_DAY_BYTES + n_treatments*TREATMENT_BYTES
+
+def sampling_seed(*parts):
+    """
+    Returns a deterministic 32 bits seed derived from parts. Identical parts 
+    (e.g. the same scenario) always get the same seed.
+    """
+    key = repr(tuple(
+        p.isoformat() if isinstance(p, datetime) else p for p in parts
+    ))
+    return int(hashlib.md5(key.encode()).hexdigest()[:8], 16)
+
+def sample_pixels(con:pg.extensions.connection, schema:str, admin1:str,
+                  start_date:datetime, nens:int=50, all_random:bool=True,
+                  weather_table:str='era5', weather_pixels:list=None,
+                  stratified:bool=False, seed:int=None):
+    """
+    Samples the soil and weather pixels for the admin subdivision (admin1). 
+    Treatments with the same soil profile and weather pixel are identical, 
+    then it returns a DataFrame with the distinct pairs: profile (soil profile
+    id), weather (lon, lat), soil (lon, lat), soil_gid (gid of the soil 
+    point), ens (NMME ensemble member used in forecast mode), and weight 
+    (number of times that pair was sampled). If weather_pixels is passed, the
+    weather pixels are not queried from the database (see 
+    get_weather_pixels). If stratified is True, a stratified sample plan is 
+    used (see stratified_plan). 
     
-    if len(soils) < MIN_SAMPLES:
-       soils = db.get_soils(con, schema, admin1, 2)
-       if len(soils) < MIN_SAMPLES:
-          soils = db.get_soils(con, schema, admin1, None)
-          assert len(soils) > MIN_SAMPLES, \
-            f"Region is not large enough to have at least {MIN_SAMPLES} samples"
+    Sampling is deterministic. If seed is None, the stored sample plan for the
+    admin1, nens and sampling method is used (see precompute_sample_plans).
+    If there is not a stored plan, or it refers to soil points or weather 
+    pixels that are not in the database anymore, the pixels are sampled with
+    a seed derived from those parameters. If a seed is passed, the pixels are
+    sampled using that seed. Plans are never stored here.
+    """
+    if stratified:
+        method = "stratified"
+    else:
+        method = "random" if all_random else "same_pixel"
+    if seed is None:
+        plan = db.fetch_sample_plan(
+            con, schema, admin1, nens, weather_table, method
+        )
+        if plan is not None:
+            try:
+                return stored_plan_to_pairs(con, schema, plan, weather_pixels)
+            except KeyError as e:
+                logger.warning(
+                    f"Stored {method} plan of {admin1} is outdated ({e}), "
+                    "it is sampled again"
+                )
+        seed = sampling_seed(schema, admin1, nens, weather_table, method)
+    if weather_pixels is None:
+        db.check_admin1_in_country(con, schema, admin1)
+        weather_pixels = get_weather_pixels(
+            con, schema, start_date, weather_table, [admin1]
+        ).get(admin1, [])
+    if stratified:
+        plan = stratified_plan(
+            con, schema, admin1, nens, weather_table=weather_table,
+            weather_pixels=weather_pixels, seed=seed
+        )
+    else:
+        plan = random_plan(
+            con, schema, admin1, nens, all_random, weather_pixels, seed
+        )
+    return plan_to_pairs(con, schema, plan)
 
-    all_pixels_soil = soils.apply(lambda row: (row.lon, row.lat), axis=1)
-    n_pixels = min(len(all_pixels_soil), len(all_pixels_weather))
+def stored_plan_to_pairs(con:pg.extensions.connection, schema:str,
+                         plan:pd.DataFrame, weather_pixels:list=None):
+    """
+    Returns the pairs of a stored sample plan (see plan_to_pairs). It raises 
+    KeyError if a soil point of the plan is not in the soil table, or if a 
+    weather pixel is not in weather_pixels (when passed).
+    """
+    if weather_pixels is not None:
+        missing = set(zip(plan.weather_lon, plan.weather_lat)) - \
+            set(map(tuple, weather_pixels))
+        if missing:
+            raise KeyError(f"weather pixel {missing.pop()}")
+    return plan_to_pairs(con, schema, plan)
+
+def random_plan(con:pg.extensions.connection, schema:str, admin1:str,
+                nens:int, all_random:bool, weather_pixels:list, seed:int):
+    """
+    Randomly samples nens soil points and weather pixels for the admin1 using 
+    the seed. If all_random is False, each soil point gets the weather pixel
+    that contains it. It returns the sample plan as a DataFrame with the 
+    soil_gid, soil_lon, soil_lat, weather_lon, weather_lat, ens and weight
+    columns.
+    """
+    rng = np.random.default_rng(seed)
+    assert len(weather_pixels) > 0, f"No weather pixels in {admin1}"
+    all_pixels_weather = pd.Series(weather_pixels)
+    soils = admin1_soils(con, schema, admin1)
+
+    n_pixels = min(len(soils), len(all_pixels_weather))
     if all_random:
         # In case all pixel combinations are posible
         if n_pixels < np.sqrt(nens):
-            pix_prod = list(product(all_pixels_soil, all_pixels_weather))
-            soil_pixels = [p[0] for p in pix_prod]
+            pix_prod = list(product(range(len(soils)), all_pixels_weather))
+            soil_rows = [p[0] for p in pix_prod]
             weather_pixels = [p[1] for p in pix_prod]
         else:
-            soil_pixels = all_pixels_soil.sample(nens, replace=n_pixels<nens)
-            weather_pixels = all_pixels_weather.sample(nens, replace=n_pixels<nens)
+            soil_rows = rng.choice(len(soils), nens, replace=n_pixels<nens)
+            weather_pixels = all_pixels_weather.sample(
+                nens, replace=n_pixels<nens, random_state=rng
+            )
     else:
-        nens = min(nens, n_pixels)
-        soil_pixels = weather_pixels = soil_pixels.sample(nens, replace=False)
+        # Soil points are sampled, and each one gets the weather pixel that
+        # contains it (the closest weather pixel centroid).
+        nens = min(nens, len(soils))
+        soil_rows = rng.choice(len(soils), nens, replace=False)
+        weather_pixels = [
+            closest_pixel(all_pixels_weather, (soils.lon[n], soils.lat[n])) 
+            for n in soil_rows
+        ]
+    weather_pixels = list(weather_pixels)
+    plan = pd.DataFrame({
+        "soil_gid": soils.gid.values[soil_rows],
+        "soil_lon": soils.lon.values[soil_rows],
+        "soil_lat": soils.lat.values[soil_rows],
+        "weather_lon": [w[0] for w in weather_pixels],
+        "weather_lat": [w[1] for w in weather_pixels],
+        "weight": 1
+    })
+    plan = plan.groupby(
+        ["soil_gid", "soil_lon", "soil_lat", "weather_lon", "weather_lat"],
+        sort=False
+    ).weight.sum().reset_index()
+    plan = add_plan_ensembles(plan, rng)
+    return plan
 
-    # tmpdir to save wth files
-    if return_input:
-        tmp_dir_name = tempfile.mkdtemp()
-        input_files =[]
-    else:
-        tmp_dir = tempfile.TemporaryDirectory()
-        tmp_dir_name = tmp_dir.name
-    # Add treatments
-    gs = GSRun()        
-
-    # Check if TAVG and TAMP are in static table
-    tav_exists = db.verify_static_par_exists(con, schema, "tav")
-    tamp_exists = db.verify_static_par_exists(con, schema, "tamp")
-    
-    iter_pixels = list(enumerate(zip(soil_pixels, weather_pixels)))
-    for (n, (soil, weather)) in tqdm(iter_pixels):
-        soil_profile = soils.loc[
-            (soils.lon==soil[0]) & (soils.lat==soil[1]),
-            "soil" 
-        ].values[0]
-        
-        # Get weather
-        # Verify that all the series are available from past weather
-        latest_past_weather = db.latest_date(con, schema, f"{weather_table}_rain")
-        if latest_past_weather >= end_date: # End of season
-            weather_df = get_weather_for_point(
-                con, schema, weather[0], weather[1], 
-                start_date, end_date
-            )
-            if weather_df is None:
-                continue
-        else: # Forecast
-            latest_forecast_weather = db.latest_date(con, schema, "nmme_rain")
-            end_date = latest_forecast_weather
-            # Get latest year of past weather. That year is used to train a 
-            # KNN estimator for srad
-            start_past_forecast = min(
-                latest_past_weather - timedelta(365), start_date
-            )
-            past_weather_df = get_weather_for_point(
-                con, schema, weather[0], weather[1], 
-                start_past_forecast, latest_past_weather
-            )
-            if past_weather_df is None:
-                continue
-            ens = np.random.randint(1, 11)
-            future_weather_df = db.get_nmme_for_point(
-                con, schema, weather[0], weather[1], 
-                latest_past_weather, end_date, ens
-            )    
-            if future_weather_df is None:
-                continue        
-            # Estimate forecast srad
-            # Adjust a harmonic model to past srad
-            add_harmonic_coefs(past_weather_df)          
-            past_weather_df["srad_rolling"] = \
-                past_weather_df.srad.rolling(10).mean()
-            A = past_weather_df.dropna()[HARM_VARS].to_numpy()
-            b = past_weather_df.dropna()["srad_rolling"].to_numpy()
-            coefs, _, _, _ = np.linalg.lstsq(A, b)
-            # Estimate the srad difference when compared to harmonic
-            past_weather_df["srad_harm"] = (
-                past_weather_df[HARM_VARS].to_numpy() @ coefs
-            ).flatten()
-            past_weather_df["srad_dif"] = \
-                past_weather_df.srad - past_weather_df.srad_harm
-            
-            # Adjust a KNN regressor to srad_diff using cos1 and rain
-            knn_reg = KNeighborsRegressor()
-            x = past_weather_df[["cos1", "rain"]].to_numpy()
-            y = past_weather_df.srad_dif.to_numpy()
-            knn_reg = knn_reg.fit(x, y)
-            add_harmonic_coefs(future_weather_df)
-            future_weather_df["srad_harm"] = (
-                future_weather_df[HARM_VARS].to_numpy() @ coefs
-            ).flatten()
-            future_weather_df["srad_dif"] = knn_reg.predict(
-                future_weather_df[["cos1", "rain"]].to_numpy()
-            )
-            future_weather_df["srad"] = \
-                future_weather_df.srad_harm + future_weather_df.srad_dif
-            
-            past_weather_df = past_weather_df[
-                ["tmax", 'tmin', 'rain', 'srad']
-            ]
-            future_weather_df = future_weather_df[
-                ["tmax", 'tmin', 'rain', 'srad']
-            ]
-            
-            # Fill whatever is missed by repeating past_weather
-            post_forecast_df = past_weather_df.copy()
-            post_forecast_df.index = post_forecast_df.index + timedelta(365)
-            post_forecast_df = post_forecast_df.loc[
-                ~post_forecast_df.index.isin(future_weather_df.index)
-            ]
-            
-            # Concat dfs
-            weather_df = pd.concat([
-                past_weather_df, future_weather_df, post_forecast_df
-            ])
-            weather_df = weather_df.sort_index()
-            weather_df = weather_df.loc[
-                pd.to_datetime(weather_df.index) >= start_date
-            ]
-            
-            
-        if tav_exists and tamp_exists:
-            tav = db.get_static_par(con, schema, weather[0], weather[1], "tav")
-            tamp = db.get_static_par(con, schema, weather[0], weather[1], "tamp")
-        else:
-            tav = None
-            tamp = None
+def add_plan_ensembles(plan:pd.DataFrame, rng:np.random.Generator):
+    """
+    Returns the sample plan with the ens column. Each ensemble member of the 
+    plan (each unit of weight) gets a random NMME ensemble member, which is 
+    used if the simulation runs in forecast mode. Rows whose ensemble members
+    drew different NMME members are split, one row per NMME member.
+    """
+    rows = plan.index.repeat(plan.weight)
+    plan = plan.loc[rows].assign(
+        ens=rng.integers(1, NMME_ENSEMBLES + 1, len(rows)), weight=1
+    )
+    cols = [col for col in plan.columns if col != "weight"]
+    return plan.groupby(cols, sort=False).weight.sum().reset_index()
 
-        if (weather_df is None) or (len(weather_df) < 1):
-            # In the unlikely case that there is no data for that location.
-            # This can occur in soil pixels that are near coasts or very close
-            # to the domain's boundary
+def station_code(n:int):
+    """
+    Returns a unique four characters weather station code for the n-th weather
+    file. Codes are W plus three base 36 digits (up to 46656 files).
+    """
+    digits = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    assert 0 <= n < 36**3, "Too many weather files"
+    return "W" + "".join(digits[(n//36**i)%36] for i in (2, 1, 0))
+
+def admin1_soils(con:pg.extensions.connection, schema:str, admin1:str):
+    """
+    Returns the soil points to sample in the admin1. Points in mask1 are used
+    if there are enough of them, then points in mask2, and then all points.
+    """
+    soils = db.get_admin1_soils(con, schema, admin1, 1)
+    if len(soils) < MIN_SAMPLES:
+       soils = db.get_admin1_soils(con, schema, admin1, 2)
+       if len(soils) < MIN_SAMPLES:
+          soils = db.get_admin1_soils(con, schema, admin1, None)
+          assert len(soils) > MIN_SAMPLES, \
+            f"Region is not large enough to have at least {MIN_SAMPLES} samples"
+    return soils
+
+def closest_pixel(pixels, point:tuple):
+    """
+    Returns the pixel centroid (lon, lat) that is closest to the point.
+    """
+    coords = np.array(list(pixels), dtype=float)
+    dist = ((coords - np.array(point, dtype=float))**2).sum(axis=1)
+    return tuple(coords[np.argmin(dist)])
+
+def closest_pixels(pixels, points):
+    """
+    Returns the index of the pixel centroid (lon, lat) that is closest to each
+    point.
+    """
+    pixels = np.array(list(pixels), dtype=float)
+    points = np.array(list(points), dtype=float)
+    dist = ((points[:, None, :] - pixels[None, :, :])**2).sum(axis=2)
+    return np.argmin(dist, axis=1)
+
+def allocate_weights(fractions:np.ndarray, nens:int):
+    """
+    Allocates nens ensemble members proportionally to fractions using the 
+    largest remainder method. It returns the integer weights.
+    """
+    raw = np.asarray(fractions, dtype=float)*nens/np.sum(fractions)
+    weights = np.floor(raw).astype(int)
+    remainder = nens - weights.sum()
+    weights[np.argsort(raw - weights, kind="stable")[::-1][:remainder]] += 1
+    return weights
+
+def soil_water_capacity(soil:str):
+    """
+    Returns the water holding capacity (mm) of the soil profile, calculated as
+    the sum of (SDUL - SLLL)*thickness over the soil layers.
+    """
+    lines = soil.split("\n")
+    capacity = 0.
+    top = 0.
+    in_layers = False
+    for line in lines:
+        if line.startswith("@  SLB  SLMH  SLLL  SDUL"):
+            in_layers = True
             continue
-        weather_df["tmax"] -= 273.15
-        weather_df["tmin"] -= 273.15
-        weather_df["srad"] /= 1e6
-        weather_df["rain"] = weather_df.rain.abs()
-
-        # weather_df = weather_df.sort_index()
-        weather_df.index = pd.to_datetime(weather_df.index)
-        pars = {i: i.upper() for i in weather_df.columns}
-        # Weather class checks data consistency. If some inconsistency is found 
-        # (for example Tmax < Tmin) it will raise an error. It is not unusual to
-        # to find small inconsistencies in global datasets.  Then, in case that 
-        # there is an inconsitency, that pixel will be skiped.
-        try:
-            dssat_weather = Weather(
-                weather_df, pars, weather[1], weather[0],
-                tav=tav, amp=tamp
-                )
-        except AssertionError:
+        if not in_layers:
             continue
-        dssat_weather._name = f"WS{n:02}{dssat_weather._name[4:]}"
+        if (len(line.strip()) == 0) or line.startswith(("@", "*")):
+            break
+        try:
+            depth, slll, sdul = map(
+                float, (line[0:6], line[12:18], line[18:24])
+            )
+        except ValueError:
+            break
+        if (slll >= 0) and (sdul >= 0):
+            capacity += (sdul - slll)*(depth - top)*10
+        top = depth
+    return capacity
 
-        dssat_weather.write(tmp_dir_name)
+def standardize(features:np.ndarray):
+    """
+    Returns the columns of features standardized to zero mean and unit 
+    standard deviation. Constant columns are only centered.
+    """
+    features = np.asarray(features, dtype=float)
+    std = features.std(axis=0)
+    std[std == 0] = 1.
+    return (features - features.mean(axis=0))/std
 
-        # Planting 
-        planting = {
-            "PDATE": plantingdate, 
-            "PLDP": 5
-        }
-        if return_input:
-            input_files.append((
-                (weather, os.path.join(tmp_dir_name, f"{dssat_weather._name}.WTH")),
-                (soil, soil_profile)
+def cluster_labels(features:np.ndarray, n_clusters:int):
+    """
+    Clusters the rows of features (standardized) using KMeans. It returns the
+    cluster label of each row.
+    """
+    from sklearn.cluster import KMeans
+    features = standardize(features)
+    n_clusters = min(n_clusters, len(np.unique(features, axis=0)))
+    kmeans = KMeans(n_clusters=n_clusters, n_init=10, random_state=0)
+    return kmeans.fit_predict(features)
+
+def stratified_plan(con:pg.extensions.connection, schema:str, admin1:str,
+                    nens:int=50, n_strata:int=16, weather_table:str='era5',
+                    weather_pixels:list=None, seed:int=None,
+                    mean_rain:dict=None):
+    """
+    Calculates a stratified sample plan for the admin1. Soil points are 
+    clustered by their water holding capacity, and weather pixels by their 
+    mean rainfall and mean temperature (tav). Each soil point is paired with
+    the weather pixel that contains it (the closest pixel centroid), and each
+    stratum is a soil cluster and weather cluster combination. The nens 
+    ensemble members are allocated to the strata proportionally to the number
+    of soil points in them (the joint frequency of the clusters). The first
+    member of a stratum is the point closest to the stratum centroid, and the
+    rest are sampled at random within the stratum using seed. It returns a
+    DataFrame with the soil_gid, soil_lon, soil_lat, weather_lon, weather_lat,
+    ens and weight columns. The NMME ensemble members (ens) are sampled using
+    seed. mean_rain is a dict mapping the weather pixels to their mean 
+    rainfall (see db.get_mean_rain), it is queried if not passed.
+    """
+    if seed is None:
+        seed = sampling_seed(schema, admin1, nens, weather_table, "stratified")
+    rng = np.random.default_rng(seed)
+    if weather_pixels is None:
+        latest = db.latest_date(con, schema, f"{weather_table}_rain")
+        weather_pixels = get_weather_pixels(
+            con, schema, latest, weather_table, [admin1]
+        ).get(admin1, [])
+    assert len(weather_pixels) > 0, f"No weather pixels in {admin1}"
+    n_clusters = int(np.ceil(np.sqrt(n_strata)))
+    
+    soils = admin1_soils(con, schema, admin1)
+    soil_features = np.array([
+        soil_water_capacity(db.get_soil_profile(con, schema, lon, lat))
+        for lon, lat in zip(soils.lon, soils.lat)
+    ])[:, None]
+    soil_labels = cluster_labels(soil_features, n_clusters)
+
+    if mean_rain is None:
+        mean_rain = dict(zip(
+            weather_pixels, 
+            db.get_mean_rain(con, schema, weather_pixels, weather_table)
+        ))
+    weather_features = np.column_stack([
+        [mean_rain.get(pixel, np.nan) for pixel in weather_pixels],
+        db.get_static_pars(con, schema, weather_pixels, ["tav"]).tav.values
+    ])
+    # Missing features are set to the admin1 mean
+    weather_features = np.where(
+        np.isnan(weather_features), 
+        np.nanmean(weather_features, axis=0) if \
+            (~np.isnan(weather_features)).any() else 0., 
+        weather_features
+    )
+    weather_features = np.nan_to_num(weather_features)
+    weather_labels = cluster_labels(weather_features, n_clusters)
+
+    # Each soil point gets its weather pixel, then its stratum
+    pixel_rows = closest_pixels(weather_pixels, zip(soils.lon, soils.lat))
+    strata = list(zip(soil_labels, weather_labels[pixel_rows]))
+    point_features = standardize(np.column_stack([
+        soil_features, weather_features[pixel_rows]
+    ]))
+    members = {}
+    for n, stratum in enumerate(strata):
+        members.setdefault(stratum, []).append(n)
+    members = list(members.values())
+    weights = allocate_weights([len(rows) for rows in members], nens)
+
+    soil_rows = []
+    for rows, weight in zip(members, weights):
+        if weight == 0:
+            continue
+        rows = np.array(rows)
+        centroid = point_features[rows].mean(axis=0)
+        dist = ((point_features[rows] - centroid)**2).sum(axis=1)
+        first = rows[np.argmin(dist)]
+        soil_rows.append(first)
+        others = rows[rows != first]
+        if weight > 1 and len(others) > 0:
+            soil_rows.extend(rng.choice(
+                others, weight - 1, replace=len(others) < weight - 1
             ))
+        elif weight > 1:
+            soil_rows.extend([first]*(weight - 1))
+    soil_rows = np.array(soil_rows)
+    pixels = [weather_pixels[n] for n in pixel_rows[soil_rows]]
+    plan = pd.DataFrame({
+        "soil_gid": soils.gid.values[soil_rows],
+        "soil_lon": soils.lon.values[soil_rows],
+        "soil_lat": soils.lat.values[soil_rows],
+        "weather_lon": [pixel[0] for pixel in pixels],
+        "weather_lat": [pixel[1] for pixel in pixels],
+        "weight": 1
+    })
+    plan = plan.groupby(
+        ["soil_gid", "soil_lon", "soil_lat", "weather_lon", "weather_lat"],
+        sort=False
+    ).weight.sum().reset_index()
+    plan = add_plan_ensembles(plan, rng)
+    return plan
+
+def precompute_sample_plans(con:pg.extensions.connection, schema:str, 
+                            nens:int=50, n_strata:int=16,
+                            weather_table:str='era5', admin1_list:list=None,
+                            progress=None):
+    """
+    Calculates and stores the stratified sample plans of the admin units (all
+    of them by default). Weather pixels and their mean rainfall are queried 
+    once for all the admin units. If progress is passed, it is called as 
+    progress("sampling", done, total) as the admin units are done.
+    """
+    if admin1_list is None:
+        admin1_list = db.get_admin1_units(con, schema)
+    latest = db.latest_date(con, schema, f"{weather_table}_rain")
+    weather_pixels = get_weather_pixels(
+        con, schema, latest, weather_table, admin1_list
+    )
+    all_pixels = list(dict.fromkeys(
+        pixel for pixels in weather_pixels.values() for pixel in pixels
+    ))
+    mean_rain = dict(zip(
+        all_pixels, db.get_mean_rain(con, schema, all_pixels, weather_table)
+    ))
+    for n, admin1 in enumerate(admin1_list):
+        if progress is not None:
+            progress("sampling", n, len(admin1_list))
+        try:
+            plan = stratified_plan(
+                con, schema, admin1, nens, n_strata, weather_table, 
+                weather_pixels.get(admin1, []), mean_rain=mean_rain
+            )
+        except AssertionError as e:
+            logger.warning(f"{admin1} skipped: {e}")
             continue
-        gs.add_treatment(
-            soil_profile=soil_profile,
-            weather=os.path.join(tmp_dir_name, f"{dssat_weather._name}.WTH"),
-            nitrogen=nitrogen,
-            planting=planting,
-            cultivar=cultivar
+        db.save_sample_plan(
+            con, schema, admin1, nens, weather_table, "stratified", plan
         )
-    if return_input:
-        return input_files
-    # Run DSSAT
-    # Set automatic management
-    # planting_window_start = plantingdate - timedelta(days=15)
-    # planting_window_end = plantingdate + timedelta(days=15)
-    # sim_controls = {
-    #     "PLANT": "F", # Automatic, force in last day of window
-    #     "PFRST": planting_window_start.strftime("%y%j"),
-    #     "PLAST": planting_window_end.strftime("%y%j"),
-    #     "PH2OL": 50, "PH2OU": 100, "PH2OD": 20, 
-    #     "PSTMX": 40, "PSTMN": 10
-    # }
-    # Get run kwargs if defined
-    sim_controls = {}
-    start_date = kwargs.get("start_date", start_date)
-    sim_controls = kwargs.get("sim_controls", sim_controls)
-    out = gs.run(
-        start_date=start_date,
-        sim_controls=sim_controls
+    if progress is not None:
+        progress("sampling", len(admin1_list), len(admin1_list))
+
+def plan_to_pairs(con:pg.extensions.connection, schema:str, 
+                  plan:pd.DataFrame):
+    """
+    Returns the (soil, weather) pairs of the sample plan in the same format as
+    sample_pixels.
+    """
+    # Stored and new plans are always in the same order
+    plan = plan.sort_values(
+        ["soil_gid", "weather_lon", "weather_lat"], kind="stable"
     )
-    tmp_dir.cleanup()
-    if (out.MAT == "-99").mean() > .5:
-        logger.warning(
-            "Most of the simulations were terminated before reaching maturity. "
-            "It is likely that the available weather data was not long enough "
-            "to complete the simulation."
+    pairs = pd.DataFrame({
+        "soil_gid": plan.soil_gid.astype(int).values,
+        "soil": list(zip(plan.soil_lon, plan.soil_lat)),
+        "weather": list(zip(plan.weather_lon, plan.weather_lat)),
+        "ens": plan.ens.astype(int).values,
+        "weight": plan.weight.astype(int).values
+    })
+    pairs["profile"] = [
+        db.get_soil_profile_id(con, schema, soil[0], soil[1]) 
+        for soil in pairs.soil
+    ]
+    # Treatments with the same soil profile and weather are identical. Only 
+    # the distinct pairs are written and simulated, and their results are
+    # weighted by their frequency.
+    pairs = (
+        pairs.groupby(["profile", "weather", "ens"], sort=False)
+        .agg(
+            soil_gid=("soil_gid", "first"), soil=("soil", "first"),
+            weight=("weight", "sum")
         )
-    # print("")
-    if overview:
-        return out, gs.overview
-    return out
-        
+        .reset_index()
+    )
+    return pairs
 
+def write_inputs(con:pg.extensions.connection, schema:str, pairs:pd.DataFrame,
+                 start_date:datetime, end_date:datetime, folder:str,
+                 weather_table:str='era5', weather_files:dict=None,
+                 progress=None):
+    """
+    Writes the weather files for the sampled pairs (see sample_pixels) in 
+    folder. Weather files are written once per weather pixel and ensemble
+    member. It returns the pairs that have valid weather data, with two more 
+    columns: wth (path to the weather file) and soil_profile (soil profile 
+    text). weather_files is a dict mapping the (weather pixel, ens) keys to 
+    the files already written in folder, it is updated with the new files. It
+    allows to write inputs for several batches of pairs in the same folder.
+    If progress is passed, it is called as progress("weather", done, total)
+    after each weather pixel is retrieved.
+    """
+    if weather_files is None:
+        weather_files = {}
+    if "ens" in pairs.columns:
+        keys = list(zip(pairs.weather, pairs.ens))
+    else:
+        keys = [(weather, None) for weather in pairs.weather]
+    unique_keys = [
+        key for key in dict.fromkeys(keys) if key not in weather_files
+    ]
+    # TAV and TAMP for all weather pixels. NaN if not in the static table
+    static_pars = db.get_static_pars(
+        con, schema, [key[0] for key in unique_keys], ["tav", "tamp"]
+    )
+    latest_past_weather = db.latest_date(con, schema, f"{weather_table}_rain")
     
+    n_written = len(weather_files)
+    # Weather series are grouped by their dates, and each group is written at
+    # once (see write_weather_block)
+    blocks = {}
+    for n, (weather, ens) in enumerate(unique_keys):
+        weather_df = get_pixel_weather(
+            con, schema, weather, start_date, end_date, weather_table, 
+            latest_past_weather, ens
+        )
+        if progress is not None:
+            progress("weather", n + 1, len(unique_keys))
+        weather_files[(weather, ens)] = None
+        if weather_df is None:
+            continue
+        weather_df = weather_df.sort_index()
+        dates_key = (weather_df.index[0], weather_df.index[-1], len(weather_df))
+        blocks.setdefault(dates_key, []).append((n, weather_df))
+    for block in blocks.values():
+        rows = [n for n, _ in block]
+        paths = write_weather_block(
+            np.stack([df[list(WTH_VARIABLES)].to_numpy() for _, df in block]),
+            block[0][1].index,
+            [unique_keys[n][0][0] for n in rows],
+            [unique_keys[n][0][1] for n in rows],
+            static_pars.tav.values[rows], static_pars.tamp.values[rows],
+            folder, [station_code(n_written + n) for n in rows]
+        )
+        for n, path in zip(rows, paths):
+            weather_files[unique_keys[n]] = path
+    inputs = pairs.copy()
+    inputs["wth"] = [weather_files[key] for key in keys]
+    inputs = inputs.loc[inputs.wth.notna()].reset_index(drop=True)
+    inputs["soil_profile"] = [
+        db.get_soil_profile(con, schema, soil[0], soil[1]) 
+        for soil in inputs.soil
+    ]
+    return inputs
 
-    
+def get_pixel_weather(con:pg.extensions.connection, schema:str, 
+                      weather:tuple, start_date:datetime, end_date:datetime,
+                      weather_table:str='era5', latest_past_weather=None,
+                      ens:int=None):
+    """
+    Returns the weather series for the weather pixel (lon, lat) as a DataFrame
+    in DSSAT units (C, mm, MJ/m2). If the past weather (weather_table) is not
+    available until end_date, then the series is completed using the NMME 
+    forecast data for the ens ensemble member. If ens is None, the member is
+    derived from the pixel and start_date. It returns None if there is no
+    data for that pixel.
+    """
+    from sklearn.neighbors import KNeighborsRegressor
+    # Assign weather retrieval function
+    if weather_table == 'era5':
+        get_weather_for_point = db.get_era5_for_point
+    elif weather_table == 'prism':
+        get_weather_for_point = db.get_prism_for_point
+    else:
+        raise NameError(f'{weather_table} tables not in database')
+    # Verify that all the series are available from past weather
+    if latest_past_weather is None:
+        latest_past_weather = db.latest_date(con, schema, f"{weather_table}_rain")
+    if latest_past_weather >= end_date: # End of season
+        weather_df = get_weather_for_point(
+            con, schema, weather[0], weather[1], 
+            start_date, end_date
+        )
+        if weather_df is None:
+            return
+    else: # Forecast
+        latest_forecast_weather = db.latest_date(con, schema, "nmme_rain")
+        end_date = latest_forecast_weather
+        # Get latest year of past weather. That year is used to train a 
+        # KNN estimator for srad
+        start_past_forecast = min(
+            latest_past_weather - timedelta(365), start_date
+        )
+        past_weather_df = get_weather_for_point(
+            con, schema, weather[0], weather[1], 
+            start_past_forecast, latest_past_weather
+        )
+        if past_weather_df is None:
+            return
+        if ens is None:
+            ens = 1 + sampling_seed(weather, start_date)%NMME_ENSEMBLES
+        future_weather_df = db.get_nmme_for_point(
+            con, schema, weather[0], weather[1], 
+            latest_past_weather, end_date, ens
+        )    
+        if future_weather_df is None:
+            return
+        # Estimate forecast srad
+        # Adjust a harmonic model to past srad
+        add_harmonic_coefs(past_weather_df)          
+        past_weather_df["srad_rolling"] = \
+            past_weather_df.srad.rolling(10).mean()
+        A = past_weather_df.dropna()[HARM_VARS].to_numpy()
+        b = past_weather_df.dropna()["srad_rolling"].to_numpy()
+        coefs, _, _, _ = np.linalg.lstsq(A, b)
+        # Estimate the srad difference when compared to harmonic
+        past_weather_df["srad_harm"] = (
+            past_weather_df[HARM_VARS].to_numpy() @ coefs
+        ).flatten()
+        past_weather_df["srad_dif"] = \
+            past_weather_df.srad - past_weather_df.srad_harm
+        
+        # Adjust a KNN regressor to srad_diff using cos1 and rain
+        knn_reg = KNeighborsRegressor()
+        x = past_weather_df[["cos1", "rain"]].to_numpy()
+        y = past_weather_df.srad_dif.to_numpy()
+        knn_reg = knn_reg.fit(x, y)
+        add_harmonic_coefs(future_weather_df)
+        future_weather_df["srad_harm"] = (
+            future_weather_df[HARM_VARS].to_numpy() @ coefs
+        ).flatten()
+        future_weather_df["srad_dif"] = knn_reg.predict(
+            future_weather_df[["cos1", "rain"]].to_numpy()
+        )
+        future_weather_df["srad"] = \
+            future_weather_df.srad_harm + future_weather_df.srad_dif
+        
+        past_weather_df = past_weather_df[
+            ["tmax", 'tmin', 'rain', 'srad']
+        ]
+        future_weather_df = future_weather_df[
+            ["tmax", 'tmin', 'rain', 'srad']
+        ]
+        
+        # Fill whatever is missed by repeating past_weather
+        post_forecast_df = past_weather_df.copy()
+        post_forecast_df.index = post_forecast_df.index + timedelta(365)
+        post_forecast_df = post_forecast_df.loc[
+            ~post_forecast_df.index.isin(future_weather_df.index)
+        ]
+        
+        # Concat dfs
+        weather_df = pd.concat([
+            past_weather_df, future_weather_df, post_forecast_df
+        ])
+        weather_df = weather_df.sort_index()
+        weather_df = weather_df.loc[
+            pd.to_datetime(weather_df.index) >= start_date
+        ]
+
+    if (weather_df is None) or (len(weather_df) < 1):
+        # In the unlikely case that there is no data for that location.
+        # This can occur in soil pixels that are near coasts or very close
+        # to the domain's boundary
+        return
+    weather_df["tmax"] -= 273.15
+    weather_df["tmin"] -= 273.15
+    weather_df["srad"] /= 1e6
+    weather_df["rain"] = weather_df.rain.abs()
+
+    # weather_df = weather_df.sort_index()
+    weather_df.index = pd.to_datetime(weather_df.index)
+    return weather_df
+
+def write_pixel_weather(con:pg.extensions.connection, schema:str, 
+                        weather:tuple, start_date:datetime, end_date:datetime,
+                        folder:str, name:str, tav:float=None, tamp:float=None,
+                        weather_table:str='era5', latest_past_weather=None,
+                        ens:int=None):
+    """
+    Writes the DSSAT weather file for the weather pixel (lon, lat) in folder.
+    The first four characters of the file name are set by name. tav and tamp
+    are the TAV and TAMP parameters for that pixel (None or NaN if not 
+    available). ens is the NMME ensemble member used in forecast mode (see 
+    get_pixel_weather). It returns the path to the file, or None if there is
+    no valid weather data for that pixel.
+    """
+    weather_df = get_pixel_weather(
+        con, schema, weather, start_date, end_date, weather_table, 
+        latest_past_weather, ens
+    )
+    if weather_df is None:
+        return
+    weather_df = weather_df.sort_index()
+    return write_weather_block(
+        weather_df[list(WTH_VARIABLES)].to_numpy()[None], weather_df.index,
+        [weather[0]], [weather[1]], [tav], [tamp], folder, [name]
+    )[0]
+
+def valid_weather(data:np.ndarray):
+    """
+    Checks the consistency of the weather data of several pixels at once. data
+    is a (pixels, days, WTH_VARIABLES) array. It returns a boolean array, 
+    False for the pixels that have missing data, tmax < tmin, or negative
+    rain or srad.
+    """
+    tmax, tmin, rain, srad = (data[..., n] for n in range(len(WTH_VARIABLES)))
+    return (
+        ~np.isnan(data).any(axis=(1, 2)) &
+        (tmin <= tmax).all(axis=1) &
+        (rain >= 0).all(axis=1) &
+        (srad >= 0).all(axis=1)
+    )
+
+def station_line(lat:float, lon:float, tav:float=None, tamp:float=None):
+    """
+    Returns the weather station line of the weather file. It is the same line
+    DSSATTools writes for a station without elevation, reference heights and
+    CO2.
+    """
+    tav = "   -99" if tav is None else f" {tav:5.1f}"
+    tamp = "   -99" if tamp is None else f" {tamp:5.1f}"
+    return f"  WSTA {lat:8.3f} {lon:8.3f}     0{tav}{tamp}   -99   -99      \n"
+
+def write_weather_block(data:np.ndarray, dates, lon, lat, tav, tamp,
+                        folder:str, names:list):
+    """
+    Writes the DSSAT weather files of several pixels at once. data is a 
+    (pixels, days, WTH_VARIABLES) array for the same dates. lon, lat, tav, and
+    tamp are the per pixel station parameters (tav and tamp can be None or 
+    NaN). The first four characters of each file name are set by names. 
+    Files are identical to the ones written by DSSATTools.Weather. It returns 
+    the list of paths to the files, None for the pixels that do not pass the 
+    consistency checks (see valid_weather).
+    """
+    from DSSATTools.base.formater import weather_data_header
+    data = np.asarray(data, dtype=float)
+    dates = pd.DatetimeIndex(dates)
+    valid = valid_weather(data)
+    data_header = weather_data_header([var.upper() for var in WTH_VARIABLES])
+    # The dates are the same for all the pixels, then the format string for
+    # the whole series is built once and filled with each pixel's data.
+    line_fmt = " %5.1f"*len(WTH_VARIABLES)
+    body_fmt = "\n".join(day + line_fmt for day in dates.strftime("%Y%j"))
+    suffix = f"{str(dates[0].year)[2:]}{dates[-1].year - dates[0].year + 1:02d}"
+    paths = []
+    for n in range(len(data)):
+        if not valid[n]:
+            paths.append(None)
+            continue
+        if pd.isna(tav[n]) or pd.isna(tamp[n]):
+            pixel_tav, pixel_tamp = None, None
+        else:
+            pixel_tav, pixel_tamp = float(tav[n]), float(tamp[n])
+        station = station_line(lat[n], lon[n], pixel_tav, pixel_tamp)
+        path = os.path.join(folder, f"{names[n]}{suffix}.WTH")
+        with open(path, "w") as f:
+            f.write(WTH_HEADER + station + data_header)
+            f.write(body_fmt % tuple(data[n].ravel().tolist()))
+        paths.append(path)
+    return paths
+
+def typed_results(out:pd.DataFrame, inputs:pd.DataFrame):
+    """
+    Returns the DSSAT results with typed columns. DSSAT returns text columns,
+    they are converted to their type in RESULTS_DTYPES (Float32 if they are 
+    not there), with missing values (-99) as NA. The types do not depend on
+    the values of the run, so the results of all runs can be concatenated and
+    stored in the same tables. The treatment metadata columns 
+    (RESULTS_METADATA) are added from the inputs (see write_inputs), which 
+    must be in the same order of the treatments.
+    """
+    typed = {}
+    for col in out.columns:
+        dtype = RESULTS_DTYPES.get(col, "Float32")
+        if dtype == "category":
+            typed[col] = out[col].astype("category").values
+            continue
+        values = pd.to_numeric(out[col], errors="coerce")
+        typed[col] = values.mask(values == -99).astype(dtype).values
+    typed["soil_gid"] = inputs.soil_gid.astype("Int32").values
+    typed["pixel_lon"] = np.array(
+        [lon for lon, _ in inputs.weather], dtype="float32"
+    )
+    typed["pixel_lat"] = np.array(
+        [lat for _, lat in inputs.weather], dtype="float32"
+    )
+    typed["ens"] = inputs.ens.astype("int32").values
+    return pd.DataFrame(typed)
+
+def split_overview(overview:list):
+    """
+    Splits the overview file lines in the file header and the list of the 
+    lines of each run.
+    """
+    header = []
+    runs = []
+    for line in overview:
+        if line.startswith("*DSSAT Cropping System Model"):
+            runs.append([])
+        if len(runs) == 0:
+            header.append(line)
+        else:
+            runs[-1].append(line)
+    return header, runs
+
+def expand_overview(overview:list, weights:list):
+    """
+    Repeats each run of the overview file lines as many times as its weight.
+    It is used to expand the overview of the distinct treatments back to the
+    sampled ensemble.
+    """
+    header, runs = split_overview(overview)
+    if len(runs) != len(weights):
+        logger.warning(
+            "Number of runs in the overview does not match the number of "
+            "treatments. The overview is not expanded."
+        )
+        return overview
+    expanded = list(header)
+    for run, weight in zip(runs, weights):
+        expanded += run*weight
+    return expanded
@@ -0,0 +1,225 @@
+"""
+This module contains the pipeline to run and publish the nationwide forecast.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import dssatservice.database as db
+from dssatservice.dssat import run_national_dssat
+from dssatservice.data.transform import parse_overview, ENV_STRESS_COLNAMES
+
+from datetime import datetime
+from io import StringIO
+from pandas import DataFrame
+import logging
+
+if TYPE_CHECKING:
+    import psycopg2 as pg
+
+logger = logging.getLogger(__name__)
+
+RESULTS_TABLE = "latest_forecast_results"
+OVERVIEW_TABLE = "latest_forecast_overview"
+CHARTS_TABLE = "latest_forecast_charts"
+
+# Columns and types of the forecast tables. Column names are case sensitive.
+# Results columns follow dssat.RESULTS_DTYPES (Int32 columns are bigint).
+RESULTS_COLUMNS = (
+    ("RUN", "bigint"), ("CR", "text"), ("TRT", "bigint"), ("FLO", "bigint"),
+    ("MAT", "bigint"), ("TOPWT", "bigint"), ("HARWT", "bigint"),
+    ("RAIN", "bigint"), ("TIRR", "bigint"), ("CET", "bigint"),
+    ("PESW", "bigint"), ("TNUP", "bigint"), ("TNLF", "bigint"),
+    ("TSON", "bigint"), ("TSOC", "bigint"), ("planting", "text"),
+    ("admin1", "text"), ("season", "text")
+)
+OVERVIEW_COLUMNS = (("RUN", "bigint"),) + tuple(
+    (col, "text") if col == "devPhase" else
+    (col, "bigint") if col == "timeSpan" or col.startswith("ndays") else
+    (col, "double precision")
+    for col in ENV_STRESS_COLNAMES
+) + (("admin1", "text"),)
+CHARTS_COLUMNS = (("admin1", "text"), ("chart", "text"), ("payload", "text"))
+
+def medium_cultivar(con, schema, admin1):
+    """
+    Returns the Medium maturity cultivar for the admin1 unit. If there is not
+    a Medium maturity option, the one in the middle of the season length range
+    is returned.
+    """
+    cultivars = db.fetch_cultivars(con, schema, admin1)
+    cultivars = cultivars.sort_values(by="season_length")
+    medium = cultivars.loc[cultivars.maturity_type == "Medium", "cultivar"]
+    if len(medium) > 0:
+        return medium.iloc[0]
+    return cultivars.cultivar.iloc[len(cultivars)//2]
+
+def _create_staging_table(cur, schema, table, columns):
+    """
+    Creates an empty staging table for table.
+    """
+    cols = ", ".join(f'"{name}" {dtype}' for name, dtype in columns)
+    cur.execute("""
+        DROP TABLE IF EXISTS {0}.{1}_staging;
+        CREATE TABLE {0}.{1}_staging ({2});
+        """.format(schema, table, cols)
+    )
+
+def _copy_to_table(cur, schema, table, df, columns):
+    """
+    Writes the DataFrame into the table using COPY.
+    """
+    buffer = StringIO()
+    df[[name for name, _ in columns]].to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+    cols = ", ".join(f'"{name}"' for name, _ in columns)
+    cur.copy_expert(
+        "COPY {0}.{1} ({2}) FROM STDIN WITH (FORMAT csv)".format(
+            schema, table, cols
+        ),
+        buffer
+    )
+
+def _swap_staging_table(cur, schema, table):
+    """
+    Indexes the staging table by admin1 and replaces table by it.
+    """
+    cur.execute("""
+        CREATE INDEX {1}_staging_admin1_idx ON {0}.{1}_staging (admin1);
+        DROP TABLE IF EXISTS {0}.{1};
+        ALTER TABLE {0}.{1}_staging RENAME TO {1};
+        ALTER INDEX {0}.{1}_staging_admin1_idx RENAME TO {1}_admin1_idx;
+        ANALYZE {0}.{1};
+        """.format(schema, table)
+    )
+
+def _render_charts(cur, schema, admin1, results, overview_df):
+    """
+    Renders the forecast charts of the admin1 unit (see 
+    ui.plot.render_forecast_charts). It returns a DataFrame with the
+    CHARTS_COLUMNS, or None if the charts could not be rendered. Then, the UI
+    renders them on request.
+    """
+    from dssatservice.ui.plot import render_forecast_charts
+    # A failed query must not abort the publishing transaction
+    cur.execute("SAVEPOINT render_charts;")
+    try:
+        obs_reference = db.fetch_observed_reference(
+            cur.connection, schema, admin1
+        )
+        charts = render_forecast_charts(
+            admin1, results, overview_df, obs_reference
+        )
+    except Exception as e:
+        cur.execute("ROLLBACK TO SAVEPOINT render_charts;")
+        logger.warning(f"Forecast charts not rendered for {admin1}: {e}")
+        return
+    cur.execute("RELEASE SAVEPOINT render_charts;")
+    return DataFrame([
+        {"admin1": admin1, "chart": name, "payload": payload}
+        for name, payload in charts.items()
+    ])
+
+def publish_forecast(con:pg.extensions.connection, schema:str,
+                     plantingdate:datetime, cultivar=None, nitrogen=None,
+                     season:str=None, admin1_list:list=None, nens:int=50,
+                     weather_table:str='era5', workers:int=None,
+                     progress=None):
+    """
+    Runs the forecast for all the admin units in the country (schema) and
+    publishes it to the latest_forecast_results and latest_forecast_overview
+    tables. Admin units run in parallel, and their results, parsed overview
+    and rendered charts (latest_forecast_charts table) are written to staging
+    tables with COPY as soon as each one is done. When
+    all the admin units are done, the staging tables are indexed and replace
+    the current forecast tables in the same transaction. Then, the forecast
+    tables are never seen half written. The new forecast is stamped with a
+    version (see database.set_forecast_version) in the same transaction. It
+    returns the number of admin units published.
+
+    Parameters
+    ----------
+    con: pg.extensions.connection
+        pg connection
+    schema: str
+        Name of the schema (country)
+    plantingdate: datetime or dict
+        Planting date. A dict mapping each admin1 to its planting date can be
+        passed.
+    cultivar: str or dict
+        Cultivar code, or a dict mapping each admin1 to its cultivar. By
+        default the Medium maturity option of each admin1 (cultivar_options
+        table).
+    nitrogen: list of tuples or dict
+        Nitrogen applications (see run_spatial_dssat), or a dict mapping each
+        admin1 to its nitrogen applications. By default no fertilizer.
+    season: str
+        Season name to tag the results with.
+    admin1_list: list
+        List of the admin units to run. By default all the admin units.
+    nens: int
+        Number of random samples within each admin unit
+    weather_table: str
+        Weather table to get the data from. Default is era5
+    workers: int
+        Number of DSSAT runs executed at the same time.
+    progress: callable
+        If passed, it is called as progress(stage, done, total) as the 
+        national run advances (see dssat.run_national_dssat).
+    """
+    if admin1_list is None:
+        admin1_list = db.get_admin1_units(con, schema)
+    if cultivar is None:
+        cultivar = {
+            admin1: medium_cultivar(con, schema, admin1)
+            for admin1 in admin1_list
+        }
+    if nitrogen is None:
+        nitrogen = [(0, 0)]
+
+    cur = con.cursor()
+    published = []
+    def write_admin1(admin1, results, overview):
+        pdate = plantingdate[admin1] if isinstance(plantingdate, dict) \
+            else plantingdate
+        results = results.copy()
+        results["planting"] = pdate.strftime("%Y-%m-%d")
+        results["season"] = season
+        _copy_to_table(
+            cur, schema, f"{RESULTS_TABLE}_staging", results, RESULTS_COLUMNS
+        )
+        overview_df = parse_overview("".join(overview))
+        overview_df["admin1"] = admin1
+        _copy_to_table(
+            cur, schema, f"{OVERVIEW_TABLE}_staging", overview_df,
+            OVERVIEW_COLUMNS
+        )
+        charts = _render_charts(cur, schema, admin1, results, overview_df)
+        if charts is not None:
+            _copy_to_table(
+                cur, schema, f"{CHARTS_TABLE}_staging", charts, CHARTS_COLUMNS
+            )
+        published.append(admin1)
+
+    try:
+        _create_staging_table(cur, schema, RESULTS_TABLE, RESULTS_COLUMNS)
+        _create_staging_table(cur, schema, OVERVIEW_TABLE, OVERVIEW_COLUMNS)
+        _create_staging_table(cur, schema, CHARTS_TABLE, CHARTS_COLUMNS)
+        run_national_dssat(
+            con, schema, plantingdate, cultivar, nitrogen, admin1_list, nens,
+            all_random=True, overview=True, weather_table=weather_table,
+            workers=workers, on_result=write_admin1, progress=progress
+        )
+        assert len(published) > 0, "No admin units were simulated"
+        _swap_staging_table(cur, schema, RESULTS_TABLE)
+        _swap_staging_table(cur, schema, OVERVIEW_TABLE)
+        _swap_staging_table(cur, schema, CHARTS_TABLE)
+        # The UI caches are invalidated by the new version
+        version = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        db.set_forecast_version(con, schema, version)
+        con.commit()
+    except Exception:
+        con.rollback()
+        raise
+    finally:
+        cur.close()
+    logger.info(f"Forecast published for {len(published)} admin units")
+    return len(published)
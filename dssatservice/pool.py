@@ -0,0 +1,444 @@
+"""
+This module contains a pool of long lived worker processes to run the model
+for interactive requests. Each worker keeps its own database connection, the
+soil and static parameter caches, and the weather files written for previous
+jobs. Then, the setup cost is paid once per worker instead of once per request.
+
+Jobs are submitted to the pool, which returns a job id. Then, the job status
+and progress can be polled, and its results fetched when it is done. Jobs wait
+in the pool until a worker is free, interactive jobs first (see scheduler for
+the priorities), and they are rejected as busy when the queue is too deep. 
+LocalPool has the same interface, but it runs the jobs in a thread of the 
+current process. It is meant for development and tests.
+
+The jobs status and results are kept in the memory of the process that owns
+the pool. Then, the requests that follow a job (status and result) must be
+served by that process, e.g. web sessions must be sticky. Other processes do
+not know the job.
+"""
+import dssatservice.database as db
+from dssatservice.dssat import (
+    run_spatial_dssat_batch, InputCache, scratch_dir, batch_key
+)
+from dssatservice.scheduler import INTERACTIVE, MAX_QUEUE
+
+import multiprocessing as mp
+import tempfile
+import logging
+import shutil
+import queue
+import threading
+import itertools
+import heapq
+import uuid
+import time
+import os
+
+logger = logging.getLogger(__name__)
+
+STATIC_PARS = ("tav", "tamp")
+# Seconds between the checks of the workers by the dispatcher
+WORKER_POLL = 1.
+# Seconds the results of finished jobs are kept if they are not fetched
+DONE_TTL = 3600.
+
+def warm_caches(con, schema:str):
+    """
+    Loads the in memory soil index and static parameter grids of the schema.
+    """
+    db.get_soil_index(con, schema)
+    for par in STATIC_PARS:
+        try:
+            db.get_static_grid(con, schema, par)
+        except Exception as e:
+            con.rollback()
+            logger.warning(f"{par} grid not loaded for {schema}: {e}")
+
+def _run_job(con, input_cache:InputCache, job_id:str, kwargs:dict, 
+             results):
+    """
+    Runs a job and puts its progress events and its result in the results
+    queue. Progress events are dicts with the next keys: id (job id), status
+    (running), progress (stage, done, total), see run_spatial_dssat_batch, and
+    worker (pid of the process running it).
+    """
+    def progress(stage, done, total):
+        results.put({
+            "id": job_id, "status": "running", "progress": (stage, done, total),
+            "worker": os.getpid()
+        })
+    progress("started", 0, 1)
+    try:
+        out = run_spatial_dssat_batch(
+            con, input_cache=input_cache, progress=progress, **kwargs
+        )
+        if kwargs.get("overview", False):
+            out, overviews = out
+        else:
+            overviews = None
+        results.put({
+            "id": job_id, "status": "done", "results": out,
+            "overview": overviews, "error": None
+        })
+    except Exception as e:
+        con.rollback()
+        logger.exception(f"Job {job_id} failed")
+        results.put({
+            "id": job_id, "status": "error", "results": None,
+            "overview": None, "error": repr(e)
+        })
+
+def _worker_loop(dbname:str, schemas:tuple, workdir:str, jobs:mp.Queue,
+                 results:mp.Queue):
+    """
+    Worker process. It waits for jobs in the jobs queue, runs them, and puts
+    the progress events and results in the results queue. A None job stops 
+    the worker.
+    """
+    os.makedirs(workdir, exist_ok=True)
+    # All the scratch data of the worker (including the DSSAT runs) goes to
+    # the worker directory.
+    tempfile.tempdir = workdir
+    con = db.connect(dbname)
+    for schema in schemas:
+        warm_caches(con, schema)
+    input_cache = InputCache(os.path.join(workdir, "inputs"))
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        job_id, kwargs = job
+        _run_job(con, input_cache, job_id, kwargs, results)
+    input_cache.clear()
+    con.close()
+
+class _JobTracker:
+    """
+    Dispatches the submitted jobs to the workers and keeps their status from
+    the events in the results queue. Subclasses set the dbname (database of 
+    the jobs), the _jobs and _results queues and the _workers, and then call
+    _start_dispatcher.
+
+    Jobs wait in the pool until a worker is free, and they are dispatched by
+    priority (see scheduler, interactive jobs first), and in submission order
+    within the same priority. New jobs are rejected with the busy status when
+    max_queue jobs are waiting already. Jobs identical to a job that is not 
+    done yet (same dssat.batch_key) are not queued, they follow that job and
+    get its same result. Job ids are unique across processes (uuid4), but the
+    jobs are only known by the process of the pool (see the module 
+    docstring). Results not fetched within DONE_TTL seconds are dropped.
+    """
+    def _init_tracker(self, max_queue:int=MAX_QUEUE):
+        self.max_queue = max_queue
+        self._done = {}
+        self._status = {}
+        # Finished jobs, job id: time finished
+        self._finished = {}
+        self._cond = threading.Condition()
+        # Jobs waiting for a worker, heap of (priority, seq, job id, job)
+        self._pending = []
+        self._seq = itertools.count()
+        # Jobs sent to the workers and not done yet, job id: worker pid (None
+        # until the job starts)
+        self._running = {}
+        # Jobs not done yet, batch_key: job id, and the jobs following them
+        self._leaders = {}
+        self._followers = {}
+        self._closing = False
+
+    def _start_dispatcher(self):
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop, daemon=True
+        )
+        self._dispatcher.start()
+
+    def _dispatch_loop(self):
+        while True:
+            try:
+                event = self._results.get(timeout=WORKER_POLL)
+            except queue.Empty:
+                event = None
+            with self._cond:
+                if self._closing:
+                    return
+                if event is not None:
+                    self._handle(event)
+                self._check_workers()
+                self._expire()
+                self._dispatch()
+                self._cond.notify_all()
+
+    def _dispatch(self):
+        """
+        Sends the pending jobs with the highest priority to the free workers.
+        """
+        free = sum(w.is_alive() for w in self._workers) - len(self._running)
+        while free > 0 and self._pending:
+            _, _, job_id, job = heapq.heappop(self._pending)
+            self._running[job_id] = None
+            self._jobs.put((job_id, job))
+            free -= 1
+
+    def _handle(self, event:dict):
+        job_id = event["id"]
+        followers = self._followers.get(job_id, [])
+        if event["status"] == "running":
+            self._running[job_id] = event.get("worker")
+            stage, done, total = event["progress"]
+            for n in [job_id] + followers:
+                self._status[n] = {
+                    "status": "running", "stage": stage, "done": done, 
+                    "total": total
+                }
+        else:
+            self._running.pop(job_id, None)
+            for key, leader in list(self._leaders.items()):
+                if leader == job_id:
+                    self._leaders.pop(key)
+            self._followers.pop(job_id, None)
+            for n in [job_id] + followers:
+                self._done[n] = dict(event, id=n)
+                self._status[n] = dict(
+                    self._status.get(n, {}), status=event["status"]
+                )
+                self._finished[n] = time.monotonic()
+
+    def _expire(self):
+        expired = time.monotonic() - DONE_TTL
+        for job_id, finished in list(self._finished.items()):
+            if finished < expired:
+                self._finished.pop(job_id)
+                self._done.pop(job_id, None)
+                self._status.pop(job_id, None)
+
+    def _fail(self, job_ids:list, error:str):
+        for job_id in job_ids:
+            logger.warning(f"Job {job_id} failed: {error}")
+            self._handle({
+                "id": job_id, "status": "error", "results": None,
+                "overview": None, "error": error
+            })
+
+    def _check_workers(self):
+        """
+        Fails the jobs of the workers that died. If no worker is alive, all the
+        jobs that are not done fail.
+        """
+        alive = [worker for worker in self._workers if worker.is_alive()]
+        if len(alive) > 0:
+            dead = {
+                getattr(worker, "pid", None) for worker in self._workers
+                if not worker.is_alive()
+            }
+            self._fail([
+                n for n, pid in self._running.items() 
+                if pid is not None and pid in dead
+            ], "Worker died")
+        elif self._leaders:
+            self._pending = []
+            self._fail(list(self._leaders.values()), "No worker alive")
+
+    def _reject(self, job_id:str):
+        error = f"{self.max_queue} jobs waiting, try again later"
+        logger.warning(f"Job {job_id} rejected: {error}")
+        self._status[job_id] = {
+            "status": "busy", "stage": None, "done": 0, "total": 0
+        }
+        self._done[job_id] = {
+            "id": job_id, "status": "busy", "results": None,
+            "overview": None, "error": error
+        }
+        self._finished[job_id] = time.monotonic()
+
+    def queue_depth(self):
+        """
+        Returns the number of jobs waiting for a worker.
+        """
+        with self._cond:
+            return len(self._pending)
+
+    def submit(self, priority:int=INTERACTIVE, **job):
+        """
+        Queues a job with the priority (see scheduler) and returns its id. If
+        an identical job is not done yet, the new job follows it instead of 
+        being queued. If max_queue jobs are waiting, the job is not queued and
+        its status is busy.
+        """
+        key = batch_key(self.dbname, **{
+            name: value for name, value in job.items()
+            if name not in ("input_cache", "ram", "progress")
+        })
+        job_id = uuid.uuid4().hex
+        with self._cond:
+            leader = self._leaders.get(key)
+            if leader is not None:
+                self._followers.setdefault(leader, []).append(job_id)
+                self._status[job_id] = dict(self._status[leader])
+                return job_id
+            if len(self._pending) >= self.max_queue:
+                self._reject(job_id)
+                return job_id
+            self._leaders[key] = job_id
+            self._status[job_id] = {
+                "status": "queued", "stage": None, "done": 0, "total": 0
+            }
+            heapq.heappush(
+                self._pending, (priority, next(self._seq), job_id, job)
+            )
+            self._dispatch()
+        return job_id
+
+    def status(self, job_id:str):
+        """
+        Returns the status of the job as a dict with the next keys: status 
+        (queued, running, done, busy or error), stage, done and total
+        (progress of the current stage). It does not wait for the job. It
+        raises KeyError if the job is unknown (submitted to another pool, or 
+        expired).
+        """
+        with self._cond:
+            if job_id not in self._status:
+                raise KeyError(f"Unknown job {job_id}")
+            return dict(self._status[job_id])
+
+    def result(self, job_id:str, timeout:float=None):
+        """
+        Waits for the job to finish and returns its result. It raises
+        TimeoutError if the job is not done after timeout seconds, and 
+        KeyError if the job is unknown. If the worker running the job dies, 
+        the job fails.
+        """
+        with self._cond:
+            if job_id not in self._status:
+                raise KeyError(f"Unknown job {job_id}")
+            if not self._cond.wait_for(
+                lambda: job_id in self._done, timeout
+            ):
+                raise TimeoutError(f"Job {job_id} is not done")
+            self._status.pop(job_id, None)
+            self._finished.pop(job_id, None)
+            return self._done.pop(job_id)
+
+    def run(self, timeout:float=None, **job):
+        """
+        Runs a job and waits for its result.
+        """
+        return self.result(self.submit(**job), timeout)
+
+    def _stop_dispatcher(self):
+        """
+        Stops the dispatcher. Jobs that are not done fail.
+        """
+        with self._cond:
+            self._closing = True
+            self._pending = []
+            self._fail(list(self._leaders.values()), "Pool closed")
+            self._cond.notify_all()
+        self._dispatcher.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+class WorkerPool(_JobTracker):
+    """
+    Pool of long lived DSSAT workers. Jobs are the run_spatial_dssat_batch
+    arguments (schema, admin1, scenarios, nens, overview, ...) and optionally
+    their priority (see scheduler, INTERACTIVE by default). Their results are
+    dicts with the next keys: id (job id), status (done, busy or error),
+    results (DataFrame), overview (dict of overview lines by scenario), and
+    error (error message).
+    """
+    def __init__(self, dbname:str, workers:int=2, schemas:tuple=(),
+                 workdir:str=None, ram:bool=None, max_queue:int=MAX_QUEUE):
+        """
+        Starts the workers. Each worker has a persistent working directory
+        within workdir (a new temporary directory by default, RAM backed if 
+        ram is True, see dssat.scratch_dir), and warms the caches of the 
+        schemas on start. Jobs submitted when max_queue jobs are waiting are
+        rejected.
+        """
+        self.dbname = dbname
+        self._own_workdir = workdir is None
+        self.workdir = workdir or tempfile.mkdtemp(
+            prefix="dssatpool", dir=scratch_dir(ram)
+        )
+        self._init_tracker(max_queue)
+        self._jobs = mp.Queue()
+        self._results = mp.Queue()
+        self._workers = []
+        for n in range(workers):
+            proc = mp.Process(
+                target=_worker_loop,
+                args=(
+                    dbname, tuple(schemas),
+                    os.path.join(self.workdir, f"worker{n:02}"),
+                    self._jobs, self._results
+                ),
+                daemon=True
+            )
+            proc.start()
+            self._workers.append(proc)
+        self._start_dispatcher()
+
+    def close(self):
+        """
+        Stops the workers and removes their working directories.
+        """
+        self._stop_dispatcher()
+        for _ in self._workers:
+            self._jobs.put(None)
+        for proc in self._workers:
+            proc.join()
+        self._workers = []
+        if self._own_workdir:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+
+class LocalPool(_JobTracker):
+    """
+    Stand-in for WorkerPool that runs the jobs, one at a time, in a thread of
+    the current process with its own connection to dbname. It has the same 
+    interface, then it can replace the pool in development and tests.
+    """
+    def __init__(self, dbname:str, workdir:str=None, ram:bool=None,
+                 max_queue:int=MAX_QUEUE):
+        self._init_tracker(max_queue)
+        self.dbname = dbname
+        self._own_workdir = workdir is None
+        self.workdir = workdir or tempfile.mkdtemp(
+            prefix="dssatlocal", dir=scratch_dir(ram)
+        )
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._input_cache = InputCache(os.path.join(self.workdir, "inputs"))
+        self._workers = [threading.Thread(target=self._loop, daemon=True)]
+        self._workers[0].start()
+        self._start_dispatcher()
+
+    def _loop(self):
+        # The jobs do not share the connection (and its transactions) with 
+        # the caller
+        con = db.connect(self.dbname)
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            job_id, kwargs = job
+            _run_job(con, self._input_cache, job_id, kwargs, self._results)
+        con.close()
+
+    def close(self):
+        """
+        Stops the worker thread and removes the working directory.
+        """
+        self._stop_dispatcher()
+        for _ in self._workers:
+            self._jobs.put(None)
+        for thread in self._workers:
+            thread.join()
+        self._workers = []
+        self._input_cache.clear()
+        if self._own_workdir:
+            shutil.rmtree(self.workdir, ignore_errors=True)
@@ -0,0 +1,187 @@
+"""
+This module contains the scheduler that admits the model runs of the process.
+Each run holds a database connection and starts DSSAT, so the scheduler bounds
+how many of them run at the same time, globally and for each schema. Runs that
+can not start wait in a priority queue (interactive runs go ahead of batch and
+calibration runs). When the queue is too deep, new runs are rejected as busy.
+The limits apply to the runs of the process, the worker pools (see pool) 
+queue their jobs with the same priorities and run them in their own workers.
+
+The limits are per process, they are not shared by the processes of the
+service (e.g. the workers of the web server). Then, at most the number of 
+processes times max_running runs are in progress, and the defaults are low.
+"""
+from dssatservice.dssat import run_spatial_dssat
+
+from contextlib import contextmanager
+from collections import deque
+import threading
+import itertools
+import heapq
+import time
+
+# Priorities, lower runs first
+INTERACTIVE = 0
+BATCH = 1
+CALIBRATION = 2
+
+MAX_RUNNING = 2 # Runs at the same time in the process
+MAX_RUNNING_SCHEMA = 1 # Runs at the same time per schema in the process
+MAX_QUEUE = 32 # Runs waiting, more than this are rejected
+WAIT_HISTORY = 1000 # Wait times kept for the metrics
+
+class SchedulerBusy(Exception):
+    """
+    The run was rejected because the queue is too deep, or it waited longer
+    than its timeout.
+    """
+
+class Scheduler:
+    """
+    Admits the runs of the process. A run starts when there are less than
+    max_running runs in progress, less than the limit of its schema
+    (schema_limits, max_running_schema by default), and there are not runs
+    with higher priority (or the same priority, submitted before) waiting that
+    could start. Runs of schemas at their limit do not block the runs of other
+    schemas.
+    """
+    def __init__(self, max_running:int=MAX_RUNNING,
+                 max_running_schema:int=MAX_RUNNING_SCHEMA,
+                 max_queue:int=MAX_QUEUE, schema_limits:dict=None):
+        assert max_running > 0, "max_running must be positive"
+        assert max_running_schema > 0, "max_running_schema must be positive"
+        self.max_running = max_running
+        self.max_running_schema = max_running_schema
+        self.max_queue = max_queue
+        self.schema_limits = dict(schema_limits or {})
+        self._cond = threading.Condition()
+        self._queue = []
+        self._seq = itertools.count()
+        self._running = {}
+        self._waits = deque(maxlen=WAIT_HISTORY)
+        self._admitted = 0
+        self._rejected = 0
+
+    def _schema_free(self, schema:str):
+        limit = self.schema_limits.get(schema, self.max_running_schema)
+        return self._running.get(schema, 0) < limit
+
+    def _can_start(self, ticket:tuple):
+        if sum(self._running.values()) >= self.max_running:
+            return False
+        for waiting in sorted(self._queue):
+            if self._schema_free(waiting[2]):
+                return waiting == ticket
+        return False
+
+    def acquire(self, schema:str, priority:int=INTERACTIVE,
+                timeout:float=None):
+        """
+        Waits until the run can start and takes its slot. It raises
+        SchedulerBusy if the queue is full, or if the run could not start
+        after timeout seconds.
+        """
+        with self._cond:
+            if len(self._queue) >= self.max_queue:
+                self._rejected += 1
+                raise SchedulerBusy(
+                    f"{len(self._queue)} runs waiting, try again later"
+                )
+            ticket = (priority, next(self._seq), schema)
+            heapq.heappush(self._queue, ticket)
+            start = time.monotonic()
+            while not self._can_start(ticket):
+                remaining = None
+                if timeout is not None:
+                    remaining = timeout - (time.monotonic() - start)
+                if (remaining is not None and remaining <= 0) or \
+                        not self._cond.wait(remaining):
+                    if self._can_start(ticket):
+                        break
+                    self._queue.remove(ticket)
+                    heapq.heapify(self._queue)
+                    self._rejected += 1
+                    # The next ticket might be able to start now
+                    self._cond.notify_all()
+                    raise SchedulerBusy(
+                        f"The run could not start after {timeout} s"
+                    )
+            self._queue.remove(ticket)
+            heapq.heapify(self._queue)
+            self._running[schema] = self._running.get(schema, 0) + 1
+            self._waits.append(time.monotonic() - start)
+            self._admitted += 1
+            self._cond.notify_all()
+
+    def release(self, schema:str):
+        """
+        Frees the slot of a run of the schema.
+        """
+        with self._cond:
+            self._running[schema] -= 1
+            if self._running[schema] == 0:
+                self._running.pop(schema)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, schema:str, priority:int=INTERACTIVE, timeout:float=None):
+        """
+        Context manager that holds a slot of the schema while the block runs
+        (see acquire).
+        """
+        self.acquire(schema, priority, timeout)
+        try:
+            yield
+        finally:
+            self.release(schema)
+
+    def run(self, func, schema:str, priority:int=INTERACTIVE,
+            timeout:float=None, **kwargs):
+        """
+        Runs func(schema=schema, **kwargs) when a slot of the schema is
+        available, and returns its result.
+        """
+        with self.slot(schema, priority, timeout):
+            return func(schema=schema, **kwargs)
+
+    def metrics(self):
+        """
+        Returns a dict with the scheduler metrics: running (total and by
+        schema), queued (total and by priority), admitted and rejected runs,
+        and the mean, 95th percentile and max wait time in seconds of the
+        latest runs.
+        """
+        with self._cond:
+            waits = sorted(self._waits)
+            queued = {}
+            for priority, _, _ in self._queue:
+                queued[priority] = queued.get(priority, 0) + 1
+            return {
+                "running": sum(self._running.values()),
+                "running_by_schema": dict(self._running),
+                "queued": len(self._queue),
+                "queued_by_priority": queued,
+                "admitted": self._admitted,
+                "rejected": self._rejected,
+                "wait_mean": sum(waits)/len(waits) if waits else 0.,
+                "wait_p95": waits[int(.95*(len(waits) - 1))] if waits else 0.,
+                "wait_max": waits[-1] if waits else 0.
+            }
+
+# Scheduler shared by the runs of the process
+SCHEDULER = Scheduler()
+
+def run_spatial_dssat_scheduled(con, schema:str, admin1:str,
+                                priority:int=INTERACTIVE, timeout:float=None,
+                                scheduler:Scheduler=None, **kwargs):
+    """
+    Runs run_spatial_dssat for the admin1 unit through the scheduler
+    (SCHEDULER by default). kwargs are passed to run_spatial_dssat. It raises
+    SchedulerBusy if the run is rejected. If an identical run is in progress,
+    it waits for its results without taking a slot.
+    """
+    scheduler = scheduler or SCHEDULER
+    return run_spatial_dssat(
+        con=con, schema=schema, admin1=admin1, 
+        slot=scheduler.slot(schema, priority, timeout), **kwargs
+    )
@@ -5,12 +5,26 @@ in the user interface.
 import sys
 sys.path.append("..")
 import dssatservice.database as db
-from dssatservice.dssat import run_spatial_dssat
+from dssatservice.dssat import run_spatial_dssat, run_spatial_dssat_batch
+from dssatservice.scheduler import SCHEDULER, INTERACTIVE, BATCH
+from dssatservice.data.transform import (
+    parse_overview_lines, ENV_PARSE_INDEX, ENV_STRESS_METRICS
+)
 from datetime import datetime, timedelta
 import numpy as np
 import pandas as  pd
 from dataclasses import dataclass
-from . import FAKE_OVERVIEW
+from functools import lru_cache
+import gzip
+import os
+import time
+import logging
+import json
+import struct
+
+logger = logging.getLogger(__name__)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
 
 CULTIVAR_NAMES = {
     'KY0018': 'KATUMANICOMP-II', 'KY0016': 'HAC ', 'KY0014': 'KATUMANICOMPI',
@@ -28,14 +42,107 @@ CULTIVAR_NAMES = {
 BASELINE_YEARS = (2017, 2018, 2019, 2020, 2021)
 
 QUANTILES_TO_COMPARE = np.arange(0.005, 1, 0.01)
+
+@lru_cache(maxsize=None)
+def load_fixture(name:str):
+    """
+    Returns the text of the compressed fixture file name (without the .gz 
+    extension) in the fixtures folder. It is read on first use only.
+    """
+    with gzip.open(os.path.join(FIXTURES_DIR, f"{name}.gz"), "rt") as f:
+        return f.read()
+
 SCHEMAS = ("kenya", "zimbabwe")
 
+# Reference data of the admin units, shared by all the sessions in the process.
+# (schema, admin1): (forecast version, time loaded, data). See admin_reference
+_ADMIN_CACHE = {}
+# Latest forecast version of each schema, schema: (time checked, version)
+_FORECAST_VERSIONS = {}
+VERSION_TTL = 60 # Seconds before checking the forecast version again
+UNVERSIONED_TTL = 600 # Seconds before reloading data of unstamped forecasts
+
 def admin_list(con, schema):
     """
     Returns a list with the admin units set for simulation in that schema
     """
     return list(sorted(db.fetch_admin1_list(con, schema)))
 
+def forecast_version(con, schema:str, ttl:float=VERSION_TTL):
+    """
+    Returns the version of the published forecast of the schema (see
+    database.fetch_forecast_version). The version is queried at most once
+    every ttl seconds.
+    """
+    now = time.monotonic()
+    checked = _FORECAST_VERSIONS.get(schema)
+    if (checked is None) or (now - checked[0] > ttl):
+        checked = (now, db.fetch_forecast_version(con, schema))
+        _FORECAST_VERSIONS[schema] = checked
+    return checked[1]
+
+def admin_reference(con, schema:str, admin1:str):
+    """
+    Returns a dict with the reference data of the admin unit: forecast_results
+    and forecast_overview (latest forecast tables), forecast_charts (charts
+    rendered when the forecast was published), cultivars, and 
+    obs_reference. The data is cached for the process, and it is fetched 
+    again when a new forecast is published (the forecast version changes). If
+    the forecast has no version stamp, the data is fetched again after 
+    UNVERSIONED_TTL seconds. The returned data is shared by all the sessions,
+    it must not be modified.
+    """
+    version = forecast_version(con, schema)
+    cached = _ADMIN_CACHE.get((schema, admin1))
+    if (cached is not None) and (cached[0] == version) and (
+        version is not None or 
+        time.monotonic() - cached[1] < UNVERSIONED_TTL
+    ):
+        return cached[2]
+    forecast_results, forecast_overview = db.fetch_forecast_tables(
+        con, schema, admin1
+    )
+    cultivars = db.fetch_cultivars(con, schema, admin1)
+    cultivars = cultivars.set_index(["maturity_type"])
+    data = {
+        "forecast_results": forecast_results,
+        "forecast_overview": forecast_overview,
+        "forecast_charts": db.fetch_forecast_charts(con, schema, admin1),
+        "cultivars": cultivars.sort_values(by="season_length"),
+        "obs_reference": db.fetch_observed_reference(con, schema, admin1)
+    }
+    _ADMIN_CACHE[(schema, admin1)] = (version, time.monotonic(), data)
+    return data
+
+def warm_admin_cache(con, schemas:tuple=SCHEMAS):
+    """
+    Loads the reference data of all the admin units of the schemas into the 
+    cache (see admin_reference). It is meant to be called at worker startup.
+    It returns the number of admin units loaded.
+    """
+    loaded = 0
+    for schema in schemas:
+        for admin1 in admin_list(con, schema):
+            try:
+                admin_reference(con, schema, admin1)
+                loaded += 1
+            except Exception as e:
+                con.rollback()
+                logger.warning(f"{schema} {admin1} not cached: {e}")
+    return loaded
+
+def clear_admin_cache(schema:str=None):
+    """
+    Removes the reference data of the schema from the process cache. If 
+    schema is None the whole cache is cleared.
+    """
+    for key in list(_ADMIN_CACHE):
+        if (schema is None) or (key[0] == schema):
+            _ADMIN_CACHE.pop(key)
+    for key in list(_FORECAST_VERSIONS):
+        if (schema is None) or (key == schema):
+            _FORECAST_VERSIONS.pop(key)
+
 @dataclass
 class SimulationPars:
     nitrogen_dap: list
@@ -44,6 +151,132 @@ class SimulationPars:
     planting_date: datetime
     irrigation: bool
 
+# Simulation outputs kept in the session, the ones the charts need
+RUN_COLUMNS = ("HARWT", "MAT", "TIRR")
+EXPERIMENT_COLUMNS = (
+    "planting", "nitro_dap", "nitro_rate", "cultivar", "yield_range", 
+    "harvest_range"
+)
+MAX_EXPERIMENTS = 20 # Experiments kept in the session, the latest ones
+STRESS_METRICS = {
+    "watStress": ("stressWatPho", "stressWatGro"),
+    "nitroStress": ("stressNitPhto", "stressNitGro")
+}
+
+def process_overview(overview):
+    """
+    Process the lines of the DSSAT overview file. It returns the mean water and
+    nitrogen stress (the max of the photosynthesis and growth stress) of each
+    development phase, as a dict of {stress column: {phase: mean}}.
+    """
+    arr = parse_overview_lines(overview).array()
+    valid = ~np.isnan(arr[:, :, 0])
+    nruns = valid.sum(axis=0)
+    stress = {}
+    for col, (pho, gro) in STRESS_METRICS.items():
+        values = np.fmax(
+            arr[:, :, ENV_STRESS_METRICS.index(pho)],
+            arr[:, :, ENV_STRESS_METRICS.index(gro)]
+        )
+        total = np.where(valid, values, 0).sum(axis=0)
+        stress[col] = {
+            phase: (float(total[n]/nruns[n]) if nruns[n] > 0 else None)
+            for n, phase in enumerate(ENV_PARSE_INDEX)
+        }
+    return stress
+
+def compact_run(df):
+    """
+    Returns the RUN_COLUMNS of the simulation results as float32 columns, with
+    NaN for the missing values.
+    """
+    return pd.DataFrame({
+        col: df[col].astype("float32").to_numpy() for col in RUN_COLUMNS
+    })
+
+@dataclass
+class SessionState:
+    """
+    Compact state of a session: the simulation parameters, the RUN_COLUMNS of
+    the latest run as a (column, sample) float32 array, the stress summary of
+    the latest run (see process_overview), the experiment results, and the 
+    submitted experiments (job id: simulation parameters). It is serialized as 
+    the length of a JSON header, the header, and the raw array.
+    """
+    sim_pars: SimulationPars
+    run: np.ndarray
+    stress: dict
+    experiments: list
+    jobs: dict
+
+    @staticmethod
+    def _pars_to_dict(sim_pars:SimulationPars):
+        return {
+            "nitrogen_dap": list(sim_pars.nitrogen_dap),
+            "nitrogen_rate": list(sim_pars.nitrogen_rate),
+            "cultivar": sim_pars.cultivar,
+            "planting_date": sim_pars.planting_date.isoformat(),
+            "irrigation": bool(sim_pars.irrigation)
+        }
+
+    @staticmethod
+    def _pars_from_dict(pars:dict):
+        return SimulationPars(
+            nitrogen_dap=tuple(pars["nitrogen_dap"]),
+            nitrogen_rate=tuple(pars["nitrogen_rate"]),
+            cultivar=pars["cultivar"],
+            planting_date=datetime.fromisoformat(pars["planting_date"]),
+            irrigation=pars["irrigation"]
+        )
+
+    def to_bytes(self):
+        header = {
+            "sim_pars": self._pars_to_dict(self.sim_pars),
+            "jobs": [
+                (job_id, self._pars_to_dict(pars)) 
+                for job_id, pars in self.jobs.items()
+            ],
+            "nsamples": None if self.run is None else self.run.shape[1],
+            "stress": self.stress,
+            "experiments": [
+                dict(exp, planting=exp["planting"].isoformat()) 
+                for exp in self.experiments
+            ]
+        }
+        header = json.dumps(header).encode()
+        run = b"" if self.run is None else \
+            np.ascontiguousarray(self.run, dtype="<f4").tobytes()
+        return struct.pack("<I", len(header)) + header + run
+
+    @classmethod
+    def from_bytes(cls, data:bytes):
+        size, = struct.unpack_from("<I", data)
+        header = json.loads(data[4:4 + size])
+        run = None
+        if header["nsamples"] is not None:
+            run = np.frombuffer(data, dtype="<f4", offset=4 + size).reshape(
+                len(RUN_COLUMNS), header["nsamples"]
+            )
+        experiments = [
+            {
+                "planting": datetime.fromisoformat(exp["planting"]),
+                "nitro_dap": tuple(exp["nitro_dap"]),
+                "nitro_rate": tuple(exp["nitro_rate"]),
+                "cultivar": exp["cultivar"],
+                "yield_range": tuple(exp["yield_range"]),
+                "harvest_range": tuple(exp["harvest_range"])
+            }
+            for exp in header["experiments"]
+        ]
+        jobs = {
+            job_id: cls._pars_from_dict(pars) 
+            for job_id, pars in header["jobs"]
+        }
+        return cls(
+            cls._pars_from_dict(header["sim_pars"]), run, header["stress"], 
+            experiments, jobs
+        )
+
 class AdminBase:
     """
     This class handles the admin unit and its cultivars and latest forecast.
@@ -57,13 +290,13 @@ class AdminBase:
         self.admin1 = admin1 
         self.schema = schema
 
-        self.forecast_results, self.forecast_overview = db.fetch_forecast_tables(
-            con, schema, admin1
-        )
-        tmp_df = db.fetch_cultivars(con, schema, admin1)
-        tmp_df = tmp_df.set_index(["maturity_type"])
-        self.cultivars = tmp_df.sort_values(by="season_length")
-        self.obs_reference = db.fetch_observed_reference(con, schema, admin1)
+        # Reference data is shared by the sessions (see admin_reference)
+        reference = admin_reference(con, schema, admin1)
+        self.forecast_results = reference["forecast_results"]
+        self.forecast_overview = reference["forecast_overview"]
+        self.forecast_charts = reference["forecast_charts"]
+        self.cultivars = reference["cultivars"]
+        self.obs_reference = reference["obs_reference"]
         # TODO: This will be replaced with a model performance stats
         # pars = db.fetch_baseline_pars(con, schema, admin1)
         # self.baseline_pars = SimulationPars(
@@ -146,35 +379,86 @@ class Session:
             planting_date = datetime(2024, 1, 1),
             irrigation = False
         )
-        self.experiment_results = pd.DataFrame(
-            [], 
-            columns=[
-                "planting", "nitro_dap", "nitro_rate", "cultivar", 
-                "yield_range", 'harvest_range', 
-            ]
-        )
+        # Only the latest MAX_EXPERIMENTS experiments are kept
+        self.experiments = []
+        # The latest run is kept in compact form (see set_latest_run)
         self.latest_run = None
-        self.latest_overview = None
+        self.latest_stress = None
+        # Submitted experiments, job id: simulation parameters
+        self.jobs = {}
+
+    @property
+    def experiment_results(self):
+        return pd.DataFrame(self.experiments, columns=list(EXPERIMENT_COLUMNS))
+
+    def set_latest_run(self, df, overview):
+        """
+        Keeps the outputs of the latest run that the charts need: the 
+        RUN_COLUMNS of the results (see compact_run), and the stress summary
+        of the overview (see process_overview).
+        """
+        self.latest_run = compact_run(df)
+        self.latest_stress = process_overview(overview)
+
+    def state(self):
+        """
+        Returns the compact state of the session (see SessionState).
+        """
+        run = None
+        if self.latest_run is not None:
+            run = self.latest_run[list(RUN_COLUMNS)].to_numpy("float32").T
+        return SessionState(
+            self.simPars, run, self.latest_stress, list(self.experiments),
+            dict(self.jobs)
+        )
+
+    @classmethod
+    def from_state(cls, adminBase:AdminBase, state:SessionState):
+        """
+        Returns a session for the admin unit with the state passed.
+        """
+        session = cls(adminBase)
+        session.simPars = state.sim_pars
+        if state.run is not None:
+            session.latest_run = pd.DataFrame(
+                dict(zip(RUN_COLUMNS, state.run))
+            )
+        session.latest_stress = state.stress
+        session.experiments = list(state.experiments)
+        session.jobs = dict(state.jobs)
+        return session
+
+    def dumps(self):
+        """
+        Returns the session state serialized as bytes (see SessionState).
+        """
+        return self.state().to_bytes()
+
+    @classmethod
+    def loads(cls, adminBase:AdminBase, data:bytes):
+        """
+        Returns a session for the admin unit from its serialized state (see 
+        dumps).
+        """
+        return cls.from_state(adminBase, SessionState.from_bytes(data))
     
     def add_experiment_results(self):
         yield_range = (
             self.latest_run.HARWT.astype(float)/1000
         ).quantile((.05, .95)).values
-        harvest_range = (
-            self.latest_run.MAT.astype(int)
-        ).quantile((.05, .95)).values
-        tmp_df = pd.DataFrame([{
+        harvest_range = self.latest_run.MAT.quantile((.05, .95)).values
+        self.experiments.append({
             "planting": self.simPars.planting_date,
-            "nitro_dap": self.simPars.nitrogen_dap,
-            "nitro_rate": self.simPars.nitrogen_rate,
+            "nitro_dap": tuple(self.simPars.nitrogen_dap),
+            "nitro_rate": tuple(self.simPars.nitrogen_rate),
             "cultivar": self.simPars.cultivar,
-            "yield_range": tuple(yield_range),
-            "harvest_range": tuple(map(int, harvest_range))
-        }])
-        self.experiment_results = pd.concat(
-            [self.experiment_results, tmp_df], 
-            ignore_index=True
-        )
+            "yield_range": tuple(map(float, yield_range)),
+            # -99 if no pixel reached maturity
+            "harvest_range": tuple(
+                -99 if pd.isna(v) else int(v) for v in harvest_range
+            )
+        })
+        del self.experiments[:-MAX_EXPERIMENTS]
         
     
     def run_experiment(self, fakerun=False, baseline_run=False, **kwargs):
@@ -182,12 +466,17 @@ class Session:
         Runs the model using the lastest parameters defined.
         """
         if fakerun: # To test plots when the model is not locally set up
-            self.latest_run = pd.DataFrame({
-                "HARWT": (np.random.normal(0, 1, 50)*100) + 500,
-                "MAT": np.random.uniform(100, 180, 50),
-                "TIRR": np.random.uniform(0, 200, 50)
-            })
-            self.latest_overview = [f"{i}\n" for i in FAKE_OVERVIEW.split("\n")]
+            self.set_latest_run(
+                pd.DataFrame({
+                    "HARWT": (np.random.normal(0, 1, 50)*100) + 500,
+                    "MAT": np.random.uniform(100, 180, 50),
+                    "TIRR": np.random.uniform(0, 200, 50)
+                }),
+                [
+                    f"{i}\n" 
+                    for i in load_fixture("fake_overview.txt").split("\n")
+                ]
+            )
             self.add_experiment_results()
             return
         nitro = list(zip(self.simPars.nitrogen_dap, self.simPars.nitrogen_rate))
@@ -203,7 +492,7 @@ class Session:
                 self.simPars.planting_date.month, 
                 self.simPars.planting_date.day
             )
-        sim_controls = {}
+        sim_controls = self.sim_controls(self.simPars)
         # TIMEDELTA_WINDOW = 1
         # planting_window_start = plantingdate - timedelta(days=TIMEDELTA_WINDOW)
         # planting_window_end = plantingdate + timedelta(days=TIMEDELTA_WINDOW)
@@ -212,13 +501,13 @@ class Session:
         #     "PFRST": planting_window_start.strftime("%y%j"),
         #     "PLAST": planting_window_end.strftime("%y%j"),
         # }
-        if self.simPars.irrigation:
-            sim_controls["IRRIG"] = "A"
-            sim_controls["IMDEP"] = 30
-            sim_controls["ITHRL"] = 50
-            sim_controls["ITHRU"] = 100
         
         weather_table = kwargs.get('weather_table', 'era5')
+        # Baseline runs are not waited by the user, they go after the 
+        # interactive ones. scheduler.SchedulerBusy is raised if the queue is
+        # full. A run identical to one in progress waits for it without a 
+        # slot.
+        priority = BATCH if baseline_run else INTERACTIVE
         df, overview = run_spatial_dssat(
             dbname="", 
             con=self.adminBase.connection,
@@ -230,16 +519,130 @@ class Session:
             overview=True,
             all_random=True,
             sim_controls=sim_controls,
-            weather_table=weather_table
+            weather_table=weather_table,
+            slot=SCHEDULER.slot(self.adminBase.schema, priority)
         )
         if baseline_run:
             return df
         else:
-            self.latest_run = df
-            self.latest_overview = overview
+            self.set_latest_run(df, overview)
             self.add_experiment_results()
         
     
+    def run_experiments(self, simPars_list:list, **kwargs):
+        """
+        Runs several experiments at once. All the experiments share the same 
+        sampled pixels and weather files, so this is faster than calling 
+        run_experiment for each one of them. Results are added to the
+        experiment results in the same order of simPars_list, and the latest
+        run is the one of the last experiment.
+        """
+        scenarios = [
+            self.scenario(n, simPars) for n, simPars in enumerate(simPars_list)
+        ]
+        weather_table = kwargs.get('weather_table', 'era5')
+        df, overviews = run_spatial_dssat_batch(
+            con=self.adminBase.connection,
+            schema=self.adminBase.schema, 
+            admin1=self.adminBase.admin1,
+            scenarios=scenarios,
+            overview=True,
+            all_random=True,
+            weather_table=weather_table,
+            slot=SCHEDULER.slot(self.adminBase.schema, INTERACTIVE)
+        )
+        for n, simPars in enumerate(simPars_list):
+            self.simPars = simPars
+            self.set_latest_run(df.loc[df.scenario == n], overviews[n])
+            self.add_experiment_results()
+
+    def submit_experiment(self, pool, **kwargs):
+        """
+        Submits the experiment with the latest parameters defined to the pool
+        (see pool.WorkerPool and pool.LocalPool) and returns the job id. The
+        request does not wait for the simulation, the job is followed with
+        experiment_status and its results added with fetch_experiment. The 
+        pool keeps the job in the memory of its process, then the session must
+        be served by that process until the job is fetched (sticky sessions).
+        """
+        job_id = pool.submit(
+            priority=INTERACTIVE,
+            schema=self.adminBase.schema,
+            admin1=self.adminBase.admin1,
+            scenarios=[self.scenario(0, self.simPars)],
+            overview=True,
+            all_random=True,
+            weather_table=kwargs.get('weather_table', 'era5')
+        )
+        self.jobs[job_id] = self.simPars
+        return job_id
+
+    def experiment_status(self, pool, job_id:str):
+        """
+        Returns the status of the submitted experiment (see 
+        pool.WorkerPool.status). Jobs unknown to the pool have the error 
+        status.
+        """
+        try:
+            return pool.status(job_id)
+        except KeyError as e:
+            return {
+                "status": "error", "stage": None, "done": 0, "total": 0,
+                "error": str(e)
+            }
+
+    def fetch_experiment(self, pool, job_id:str):
+        """
+        Adds the results of the submitted experiment to the session if the job
+        is done. It returns the status of the job. If the job failed, was 
+        rejected as busy, or it is unknown to the pool (e.g. its results 
+        expired), status has the error message.
+        """
+        status = self.experiment_status(pool, job_id)
+        if status["status"] == "error" and "error" in status:
+            self.jobs.pop(job_id, None)
+            return status
+        if status["status"] in ("queued", "running"):
+            return status
+        res = pool.result(job_id)
+        simPars = self.jobs.pop(job_id)
+        if res["status"] in ("error", "busy"):
+            return dict(status, error=res["error"])
+        self.simPars = simPars
+        self.set_latest_run(res["results"], res["overview"][0])
+        self.add_experiment_results()
+        return status
+
+    def scenario(self, n:int, simPars:SimulationPars):
+        """
+        Returns the scenario n (see dssat.run_spatial_dssat_batch) for the 
+        simulation parameters.
+        """
+        return {
+            "id": n,
+            "plantingdate": datetime(
+                simPars.planting_date.year, 
+                simPars.planting_date.month, 
+                simPars.planting_date.day
+            ),
+            "cultivar": simPars.cultivar,
+            "nitrogen": list(zip(simPars.nitrogen_dap, simPars.nitrogen_rate)),
+            "sim_controls": self.sim_controls(simPars)
+        }
+
+    @staticmethod
+    def sim_controls(simPars:SimulationPars):
+        """
+        Returns the simulation controls for the simulation parameters
+        """
+        sim_controls = {}
+        if simPars.irrigation:
+            sim_controls["IRRIG"] = "A"
+            sim_controls["IMDEP"] = 30
+            sim_controls["ITHRL"] = 50
+            sim_controls["ITHRU"] = 100
+        return sim_controls
+    
     def new_baseline(self):
         """
         NOT IMPLEMENTED, it was part of former stages of the service.
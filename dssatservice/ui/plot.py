@@ -1,26 +1,15 @@
 """
-Functions to create highchart plots.
+Functions to create highchart plots. highcharts_core, matplotlib and scipy are
+imported by the functions that use them, then importing this module is fast 
+(see experiments/import_time.py).
 """
-
-from highcharts_core.chart import Chart
-from highcharts_core.chart import HighchartsOptions
-from highcharts_core.options.series.bar import ColumnRangeSeries
-from highcharts_core.options.plot_options.bar import ColumnRangeOptions
-from highcharts_core.options.series.scatter import ScatterSeries
-from highcharts_core.options.plot_options.scatter import ScatterOptions
-from highcharts_core.options.series.bar import ColumnSeries
-from highcharts_core.options.plot_options.bar import ColumnOptions
-from highcharts_core.options.legend import Legend
-
-from matplotlib import colormaps
-from matplotlib.colors import to_hex
 from datetime import timedelta
+import json
 
 from .base import AdminBase, Session, QUANTILES_TO_COMPARE
 from dssatservice.data.transform import parse_overview
 
 import numpy as np
-from scipy import stats
 
 SERIES_CI = [95, 75, 50, 25]
 Q_RANGE_PLOTS = [(.5-q/200, .5+q/200) for q in SERIES_CI]
@@ -96,6 +85,12 @@ def validation_chart(session:Session):
     """
     NOT IMPLEMENTED, it was part of former stages of the service.
     """
+    from highcharts_core.chart import Chart, HighchartsOptions
+    from highcharts_core.options.series.bar import ColumnRangeSeries
+    from highcharts_core.options.series.scatter import ScatterSeries
+    from highcharts_core.options.legend import Legend
+    from matplotlib import colormaps
+    from matplotlib.colors import to_hex
     adminBase=session.adminBase
     my_chart = Chart()
     my_chart.options = HighchartsOptions()
@@ -190,6 +185,9 @@ def init_anomalies_chart():
     """
     NOT IMPLEMENTED, it was part of former stages of the service.
     """
+    from highcharts_core.chart import Chart, HighchartsOptions
+    from highcharts_core.options.series.bar import ColumnSeries
+    from highcharts_core.options.legend import Legend
     my_chart = Chart()
     my_chart.options = HighchartsOptions()
     my_chart.options.title = {
@@ -271,6 +269,7 @@ def get_anomaly_series_data(session, model_based=True):
     """
     NOT IMPLEMENTED, it was part of former stages of the service.
     """
+    from scipy import stats
     # This is for anomaly based in model
     if model_based:
         data = session.adminBase.get_quantile_anomalies(session.latest_run)
@@ -314,6 +313,7 @@ def init_stress_chart(stress_type):
     Initilizes the stress chart for the stress type passed. Stress type can be 
     either water or nitrogen
     """
+    from highcharts_core.chart import Chart, HighchartsOptions
     assert stress_type in STRESS_COLUMNS
     my_chart = Chart()
     my_chart.options = HighchartsOptions()
@@ -364,7 +364,9 @@ def init_stress_chart(stress_type):
 
 def process_overview(overview):
     """
-    Process the lines of the DSSAT overview file.
+    Process the lines of the DSSAT overview file. It returns a DataFrame with 
+    the stress of each run and development phase. The session keeps the mean 
+    stress of each phase instead (see base.process_overview).
     """
     overview = parse_overview("".join(overview))
     overview = overview.set_index(["RUN", 'devPhase']).astype(float).reset_index()
@@ -378,12 +380,13 @@ def get_stress_series_data(session, stresstype):
     Stress type can be either water or nitrogen. The bar is made considering the 
     latest simulation run for the session.
     """
-    overview = process_overview(session.latest_overview.copy())
-    var_column = STRESS_COLUMNS[stresstype]
-    data = overview.groupby("devPhase")[var_column].mean()
-    data = 100*data
+    from highcharts_core.options.series.bar import ColumnSeries
+    data = session.latest_stress[STRESS_COLUMNS[stresstype]]
     box = ColumnSeries()
-    box.data = [data.to_dict().get(dev_st) for dev_st in DEV_STAGES]
+    box.data = [
+        None if data.get(dev_st) is None else 100*data[dev_st]
+        for dev_st in DEV_STAGES
+    ]
     return box.to_dict()
     
 def clear_stress_chart(chart_dict):
@@ -396,6 +399,7 @@ def init_columnRange_chart(session):
     """
     Initializes the yield columnRange chart for the requested session.
     """
+    from highcharts_core.chart import Chart, HighchartsOptions
     my_chart = Chart()
     my_chart.options = HighchartsOptions()
     my_chart.options.title = {
@@ -495,18 +499,25 @@ def get_columnRange_series_data(session, series_len):
     Get the series data for the columnRange chart using the results from the 
     latest simulation. series_len is the current number of series in the chart
     """
+    from highcharts_core.options.series.bar import ColumnRangeSeries
+    from matplotlib import colormaps
+    from matplotlib.colors import to_hex
     tmp_df = session.latest_run
     tmp_df['year'] = 1
     tmp_df["sim"] = tmp_df.HARWT.astype(float)/1000
     
-    counts, bins = np.histogram(tmp_df.sim, bins=5)
+    counts, bins = np.histogram(tmp_df.sim.dropna(), bins=5)
     counts = counts/sum(counts)
         
-    harvest_date_min = session.simPars.planting_date + \
-        timedelta(days=session.latest_run.MAT.astype(int).quantile(.25))
-    harvest_date_max = session.simPars.planting_date + \
-        timedelta(days=session.latest_run.MAT.astype(int).quantile(.75))
-    harvest_range = f"{harvest_date_min.strftime('%b %d %Y')} - {harvest_date_max.strftime('%b %d %Y')}"
+    maturity = session.latest_run.MAT.dropna()
+    if len(maturity) > 0:
+        harvest_date_min = session.simPars.planting_date + \
+            timedelta(days=maturity.quantile(.25))
+        harvest_date_max = session.simPars.planting_date + \
+            timedelta(days=maturity.quantile(.75))
+        harvest_range = f"{harvest_date_min.strftime('%b %d %Y')} - {harvest_date_max.strftime('%b %d %Y')}"
+    else:
+        harvest_range = "N/A (maturity not reached)"
     
     tmp_df = session.adminBase.cultivars
     cul = tmp_df.loc[tmp_df.cultivar == session.simPars.cultivar].index[0]
@@ -517,7 +528,7 @@ def get_columnRange_series_data(session, series_len):
             f"{sum(session.simPars.nitrogen_rate):.0f} kg N/ha applied in {len(session.simPars.nitrogen_rate)} events<br>"
     if session.simPars.irrigation:
         label += f"Irrigated</span><br>Harvest on {harvest_range}"
-        avg_irr = int(session.latest_run.TIRR.astype(int).mean())
+        avg_irr = int(session.latest_run.TIRR.mean())
         label += f"<br>An average of {avg_irr} mm of irrigation needed"
     else: 
         label += f"Rainfed</span><br>Harvest on {harvest_range}"
@@ -552,8 +563,27 @@ def get_columnRange_series_data(session, series_len):
 
 def current_forecast_yield_plot(session):
     """
-    Returns the columnRange yield plot for the latest forecast.
+    Returns the columnRange yield plot for the latest forecast. The chart 
+    rendered when the forecast was published is returned if there is one.
     """
+    chart = session.adminBase.forecast_charts.get("yield")
+    if chart is not None:
+        return json.loads(chart)
+    return forecast_yield_chart(
+        session.adminBase.admin1, session.adminBase.forecast_results,
+        session.adminBase.obs_reference
+    )
+
+def forecast_yield_chart(admin1, forecast_results, obs_reference):
+    """
+    Returns the columnRange yield plot for the forecast results of the admin
+    unit. obs_reference is the (min, mean, max) observed yield.
+    """
+    from highcharts_core.chart import Chart, HighchartsOptions
+    from highcharts_core.options.series.bar import ColumnRangeSeries
+    from highcharts_core.options.series.scatter import ScatterSeries
+    from matplotlib import colormaps
+    from matplotlib.colors import to_hex
     my_chart = Chart()
     my_chart.options = HighchartsOptions()
     my_chart.options.title = {
@@ -593,9 +623,11 @@ def current_forecast_yield_plot(session):
     my_chart = my_chart.to_dict()
     my_chart["userOptions"]["series"] = []
     
-    tmp_df = session.adminBase.forecast_results
-    tmp_df = tmp_df.loc[tmp_df.MAT != -99]
-    tmp_df["HARWT"] = tmp_df.HARWT/1000
+    # Tables written by db.dataframe_to_table have -99 for missing values
+    tmp_df = forecast_results.loc[
+        forecast_results.MAT.notna() & (forecast_results.MAT != -99)
+    ].copy()
+    tmp_df["HARWT"] = tmp_df.HARWT.astype(float)/1000
     
     counts, bins = np.histogram(tmp_df.HARWT, bins=5)
     counts = counts/sum(counts)
@@ -608,7 +640,7 @@ def current_forecast_yield_plot(session):
                 "color": to_hex(colormaps["Greens"](count/.35)),
                 "count": count, 
                 "custom": {
-                    "extraInformation": f'<b>{session.adminBase.admin1}</b><br>' +\
+                    "extraInformation": f'<b>{admin1}</b><br>' +\
                         f'{bins[n]:.2f}-{bins[n+1]:.2f} t/ha<br>' + \
                         f'({100*count/sum(counts):.0f}% probability)',
                 }
@@ -644,8 +676,8 @@ def current_forecast_yield_plot(session):
     
     my_chart["userOptions"]["series"] = [column.to_dict(), scatter.to_dict()]
     
-    if not any(np.isnan(session.adminBase.obs_reference)):
-        min_value = session.adminBase.obs_reference[0]/1000
+    if not any(np.isnan(obs_reference)):
+        min_value = obs_reference[0]/1000
         # min_year = session.adminBase.historical_data.set_index("year").value.idxmin()
         min_point = ScatterSeries().from_dict({
             "data": [
@@ -663,7 +695,7 @@ def current_forecast_yield_plot(session):
             }
         })
         
-        max_value = session.adminBase.obs_reference[2]/1000
+        max_value = obs_reference[2]/1000
         # max_year = session.adminBase.historical_data.set_index("year").value.idxmax()
         max_point = ScatterSeries().from_dict({
             "data": [
@@ -689,8 +721,21 @@ def current_forecast_yield_plot(session):
 
 def current_forecast_stress_plot(session):
     """
-    Returns the stress plot for the latest forecast
+    Returns the stress plot for the latest forecast. The chart rendered when 
+    the forecast was published is returned if there is one.
     """
+    chart = session.adminBase.forecast_charts.get("stress")
+    if chart is not None:
+        return json.loads(chart)
+    return forecast_stress_chart(session.adminBase.forecast_overview)
+
+def forecast_stress_chart(forecast_overview):
+    """
+    Returns the stress plot for the parsed forecast overview of the admin unit
+    (see data.transform.parse_overview).
+    """
+    from highcharts_core.chart import Chart, HighchartsOptions
+    from highcharts_core.options.series.bar import ColumnSeries
     my_chart = Chart()
     my_chart.options = HighchartsOptions()
     my_chart.options.title = {
@@ -736,9 +781,10 @@ def current_forecast_stress_plot(session):
     }  
     my_chart = my_chart.to_dict()
 
-    tmp_df = session.adminBase.forecast_overview
+    # The forecast overview is shared by the sessions (see base.admin_reference)
+    tmp_df = forecast_overview.copy()
     tmp_df["watStress"] = tmp_df[["stressWatPho", "stressWatGro"]].sum(axis=1)
-    data = session.adminBase.forecast_overview.groupby("devPhase")["watStress"].mean()
+    data = tmp_df.groupby("devPhase")["watStress"].mean()
     data = 100*data
     box = ColumnSeries().from_dict({
         "data": [data.to_dict().get(dev_st) for dev_st in DEV_STAGES],
@@ -749,7 +795,7 @@ def current_forecast_stress_plot(session):
     my_chart["userOptions"]["series"] = [box.to_dict()] 
     
     tmp_df["nitStress"] = tmp_df[["stressNitPhto", "stressNitGro"]].sum(axis=1)
-    data = session.adminBase.forecast_overview.groupby("devPhase")["nitStress"].mean()
+    data = tmp_df.groupby("devPhase")["nitStress"].mean()
     data = 100*data
     box = ColumnSeries().from_dict({
         "data": [data.to_dict().get(dev_st) for dev_st in DEV_STAGES],
@@ -757,4 +803,20 @@ def current_forecast_stress_plot(session):
         "color": "brown"
     })
     my_chart["userOptions"]["series"].append(box.to_dict())
-    return my_chart
\ No newline at end of file
+    return my_chart
+
+def render_forecast_charts(admin1, forecast_results, forecast_overview,
+                           obs_reference):
+    """
+    Renders the forecast charts of the admin unit. It returns a dict with the
+    chart name (yield or stress) and the chart dict as JSON text, the way they
+    are stored when the forecast is published (see forecast.publish_forecast).
+    """
+    charts = {
+        "yield": forecast_yield_chart(admin1, forecast_results, obs_reference),
+        "stress": forecast_stress_chart(forecast_overview)
+    }
+    return {
+        name: json.dumps(chart, default=float) 
+        for name, chart in charts.items()
+    }
@@ -0,0 +1,89 @@
+"""
+This script measures the import time of the dssatservice modules, and checks
+that the heavy libraries are not imported with them. Heavy libraries must be
+imported by the functions that use them, then web workers and ingest jobs do
+not pay for libraries they do not use.
+
+Each module is imported in a fresh interpreter. The script exits with an error
+if a module imports one of the heavy libraries, or if its import time is over
+the budget. Run it from the repository root:
+
+    python experiments/import_time.py [--budget SECONDS] [--repeat N]
+"""
+import argparse
+import json
+import subprocess
+import sys
+import os
+
+MODULES = (
+    "dssatservice.database",
+    "dssatservice.dssat",
+    "dssatservice.data.transform",
+    "dssatservice.forecast",
+    "dssatservice.pool",
+    "dssatservice.scheduler",
+    "dssatservice.ui",
+    "dssatservice.ui.base",
+    "dssatservice.ui.plot",
+)
+HEAVY_LIBRARIES = (
+    "geopandas", "sqlalchemy", "psycopg2", "spatialDSSAT", "DSSATTools",
+    "sklearn", "tqdm", "netCDF4", "osgeo", "osgeo_utils", "highcharts_core",
+    "matplotlib", "scipy",
+)
+# Import time budget in seconds. It includes numpy and pandas.
+BUDGET = 2.
+
+MEASURE = """
+import sys, time, json
+t0 = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t0
+heavy = sorted(
+    lib for lib in {heavy!r} if any(
+        m == lib or m.startswith(lib + ".") for m in sys.modules
+    )
+)
+print(json.dumps({{"time": elapsed, "heavy": heavy}}))
+"""
+
+def measure(module:str, repeat:int=3):
+    """
+    Imports the module repeat times, each one in a new interpreter. It returns
+    the minimum import time and the heavy libraries that were imported.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-c", MEASURE.format(
+                module=module, heavy=HEAVY_LIBRARIES
+            )],
+            cwd=root, capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"{module} import failed:\n{proc.stderr}")
+        out = json.loads(proc.stdout.strip().split("\n")[-1])
+        times.append(out["time"])
+    return min(times), out["heavy"]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--budget", type=float, default=BUDGET)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    failed = []
+    for module in MODULES:
+        elapsed, heavy = measure(module, args.repeat)
+        status = "ok"
+        if heavy:
+            status = f"imports {', '.join(heavy)}"
+            failed.append(module)
+        elif elapsed > args.budget:
+            status = f"over budget ({args.budget:.2f} s)"
+            failed.append(module)
+        print(f"{module:32} {elapsed:7.3f} s  {status}")
+    if failed:
+        sys.exit(f"Import regressions in: {', '.join(failed)}")
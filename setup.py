@@ -7,6 +7,8 @@ setup(
     name="dssatservice",
     version='0.0.1',
     packages=['dssatservice', 'dssatservice.data', 'dssatservice.ui'],
-    py_modules=["dssatservice.database", "dssatservice.dssat"],
+    py_modules=["dssatservice.database", "dssatservice.dssat", "dssatservice.forecast",
+                "dssatservice.pool", "dssatservice.scheduler"],
+    package_data={"dssatservice.ui": ["fixtures/*.gz"]},
     install_requires=requirements
 )
@@ -0,0 +1,255 @@
+"""
+Tests of the job pool (dssatservice.pool) and the session jobs. The model run
+(run_spatial_dssat_batch) and the database connection are replaced by stubs,
+then they do not need DSSAT or a database.
+"""
+from datetime import datetime
+from types import SimpleNamespace
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+import dssatservice.pool as pool
+from dssatservice.scheduler import INTERACTIVE, BATCH
+from dssatservice.ui.base import (
+    Session, SessionState, SimulationPars, load_fixture
+)
+
+TIMEOUT = 5.
+
+class FakeConnection:
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+class FakeRun:
+    """
+    Stub of run_spatial_dssat_batch. It records the admin1 of the calls, and
+    waits for release to be set before returning.
+    """
+    def __init__(self, error:Exception=None):
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+        self.error = error
+
+    def __call__(self, con, schema, admin1, scenarios, input_cache=None,
+                 progress=None, overview=False, **kwargs):
+        self.calls.append(admin1)
+        progress("simulation", 0, 1)
+        self.started.set()
+        assert self.release.wait(TIMEOUT)
+        if self.error is not None:
+            raise self.error
+        out = pd.DataFrame({
+            "HARWT": [1000, 2000, 3000], "MAT": [120, 130, 140],
+            "TIRR": [0, 0, 0], "scenario": [scn["id"] for scn in scenarios]*3
+        })
+        if overview:
+            lines = [
+                f"{i}\n" for i in load_fixture("fake_overview.txt").split("\n")
+            ]
+            return out, {scn["id"]: lines for scn in scenarios}
+        return out
+
+def scenarios(cultivar:str="X"):
+    return [{
+        "id": 0, "plantingdate": datetime(2020, 1, 1), "cultivar": cultivar,
+        "nitrogen": [(0, 0)]
+    }]
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    run = FakeRun()
+    monkeypatch.setattr(pool, "run_spatial_dssat_batch", run)
+    monkeypatch.setattr(pool.db, "connect", lambda dbname: FakeConnection())
+    return run
+
+@pytest.fixture
+def local_pool(fake_run, tmp_path):
+    with pool.LocalPool("test", workdir=str(tmp_path), max_queue=1) as p:
+        yield p
+
+def wait_status(p, job_id:str, status:str):
+    start = time.monotonic()
+    while p.status(job_id)["status"] != status:
+        assert time.monotonic() - start < TIMEOUT, p.status(job_id)
+        time.sleep(.01)
+
+def test_run(local_pool, fake_run):
+    res = local_pool.run(
+        schema="s", admin1="a", scenarios=scenarios(), timeout=TIMEOUT
+    )
+    assert res["status"] == "done"
+    assert res["error"] is None
+    assert list(res["results"].HARWT) == [1000, 2000, 3000]
+    assert fake_run.calls == ["a"]
+
+def test_status_and_progress(local_pool, fake_run):
+    fake_run.release.clear()
+    job_id = local_pool.submit(schema="s", admin1="a", scenarios=scenarios())
+    assert fake_run.started.wait(TIMEOUT)
+    wait_status(local_pool, job_id, "running")
+    status = local_pool.status(job_id)
+    assert (status["stage"], status["done"], status["total"]) == \
+        ("simulation", 0, 1)
+    fake_run.release.set()
+    assert local_pool.result(job_id, TIMEOUT)["status"] == "done"
+
+def test_result_timeout(local_pool, fake_run):
+    fake_run.release.clear()
+    job_id = local_pool.submit(schema="s", admin1="a", scenarios=scenarios())
+    with pytest.raises(TimeoutError):
+        local_pool.result(job_id, timeout=.1)
+    fake_run.release.set()
+    assert local_pool.result(job_id, TIMEOUT)["status"] == "done"
+
+def test_error(local_pool, fake_run):
+    fake_run.error = ValueError("no pixels")
+    res = local_pool.run(
+        schema="s", admin1="a", scenarios=scenarios(), timeout=TIMEOUT
+    )
+    assert res["status"] == "error"
+    assert "no pixels" in res["error"]
+
+def test_unknown_job(local_pool):
+    with pytest.raises(KeyError):
+        local_pool.status("unknown")
+    with pytest.raises(KeyError):
+        local_pool.result("unknown", TIMEOUT)
+
+def test_busy(local_pool, fake_run):
+    fake_run.release.clear()
+    running = local_pool.submit(schema="s", admin1="a", scenarios=scenarios())
+    assert fake_run.started.wait(TIMEOUT)
+    waiting = local_pool.submit(schema="s", admin1="b", scenarios=scenarios())
+    rejected = local_pool.submit(schema="s", admin1="c", scenarios=scenarios())
+    assert local_pool.queue_depth() == 1
+    assert local_pool.status(rejected)["status"] == "busy"
+    res = local_pool.result(rejected, TIMEOUT)
+    assert res["status"] == "busy"
+    assert res["error"]
+    fake_run.release.set()
+    assert local_pool.result(running, TIMEOUT)["status"] == "done"
+    assert local_pool.result(waiting, TIMEOUT)["status"] == "done"
+    assert fake_run.calls == ["a", "b"]
+
+def test_identical_jobs_coalesce(local_pool, fake_run):
+    fake_run.release.clear()
+    leader = local_pool.submit(schema="s", admin1="a", scenarios=scenarios())
+    follower = local_pool.submit(schema="s", admin1="a", scenarios=scenarios())
+    assert leader != follower
+    fake_run.release.set()
+    assert local_pool.result(leader, TIMEOUT)["status"] == "done"
+    assert local_pool.result(follower, TIMEOUT)["status"] == "done"
+    assert fake_run.calls == ["a"]
+
+def test_priority(fake_run, tmp_path):
+    fake_run.release.clear()
+    with pool.LocalPool("test", workdir=str(tmp_path)) as p:
+        first = p.submit(schema="s", admin1="first", scenarios=scenarios())
+        assert fake_run.started.wait(TIMEOUT)
+        batch = p.submit(
+            priority=BATCH, schema="s", admin1="batch", scenarios=scenarios()
+        )
+        interactive = p.submit(
+            priority=INTERACTIVE, schema="s", admin1="interactive",
+            scenarios=scenarios()
+        )
+        fake_run.release.set()
+        for job_id in (first, batch, interactive):
+            assert p.result(job_id, TIMEOUT)["status"] == "done"
+    assert fake_run.calls == ["first", "interactive", "batch"]
+
+def test_expiry(monkeypatch, local_pool):
+    monkeypatch.setattr(pool, "DONE_TTL", 0.)
+    monkeypatch.setattr(pool, "WORKER_POLL", .01)
+    job_id = local_pool.submit(schema="s", admin1="a", scenarios=scenarios())
+    start = time.monotonic()
+    while True:
+        try:
+            local_pool.status(job_id)
+        except KeyError:
+            break
+        assert time.monotonic() - start < TIMEOUT
+        time.sleep(.01)
+    with pytest.raises(KeyError):
+        local_pool.result(job_id, TIMEOUT)
+
+def test_closed_pool_fails_jobs(fake_run, tmp_path):
+    fake_run.release.clear()
+    p = pool.LocalPool("test", workdir=str(tmp_path))
+    job_id = p.submit(schema="s", admin1="a", scenarios=scenarios())
+    assert fake_run.started.wait(TIMEOUT)
+    waiting = p.submit(schema="s", admin1="b", scenarios=scenarios())
+    # The running job finishes while the pool is closing
+    threading.Timer(.5, fake_run.release.set).start()
+    p.close()
+    assert p.status(job_id)["status"] == "error"
+    assert p.status(waiting)["status"] == "error"
+    assert fake_run.calls == ["a"]
+
+@pytest.fixture
+def session():
+    admin = SimpleNamespace(
+        schema="s", admin1="a",
+        cultivars=pd.DataFrame({"cultivar": ["X"]}, index=["Medium"])
+    )
+    return Session(admin)
+
+def test_submit_and_fetch_experiment(local_pool, fake_run, session):
+    fake_run.release.clear()
+    job_id = session.submit_experiment(local_pool)
+    assert job_id in session.jobs
+    assert session.fetch_experiment(local_pool, job_id)["status"] in \
+        ("queued", "running")
+    assert session.experiments == []
+    fake_run.release.set()
+    wait_status(local_pool, job_id, "done")
+    assert session.fetch_experiment(local_pool, job_id)["status"] == "done"
+    assert session.jobs == {}
+    assert len(session.experiments) == 1
+    assert session.experiments[0]["yield_range"] == pytest.approx((1.1, 2.9))
+    assert list(session.latest_run.HARWT) == [1000, 2000, 3000]
+    assert session.latest_stress is not None
+
+def test_fetch_failed_experiment(local_pool, fake_run, session):
+    fake_run.error = ValueError("no pixels")
+    job_id = session.submit_experiment(local_pool)
+    wait_status(local_pool, job_id, "error")
+    status = session.fetch_experiment(local_pool, job_id)
+    assert status["status"] == "error"
+    assert "no pixels" in status["error"]
+    assert session.jobs == {}
+    assert session.experiments == []
+
+def test_fetch_unknown_experiment(local_pool, session):
+    status = session.fetch_experiment(local_pool, "unknown")
+    assert status["status"] == "error"
+    assert "unknown" in status["error"]
+
+def test_session_state_round_trip(local_pool, fake_run, session):
+    session.submit_experiment(local_pool)
+    session.run_experiment(fakerun=True)
+    state = SessionState.from_bytes(session.dumps())
+    assert state.sim_pars == session.simPars
+    assert state.jobs == session.jobs
+    assert state.experiments == session.experiments
+    assert state.stress == session.latest_stress
+    loaded = Session.loads(session.adminBase, session.dumps())
+    pd.testing.assert_frame_equal(
+        loaded.latest_run, session.latest_run.astype("float32")
+    )
+    assert loaded.jobs == session.jobs
+    assert loaded.experiments == session.experiments
+
+def test_session_state_empty(session):
+    state = SessionState.from_bytes(session.dumps())
+    assert state.run is None
+    assert state.jobs == {}
+    assert isinstance(state.sim_pars, SimulationPars)
@@ -0,0 +1,89 @@
+"""
+Tests of the admission of the runs (dssatservice.scheduler). The model run is
+replaced by a stub, then they do not need DSSAT or a database.
+"""
+from datetime import datetime
+from types import SimpleNamespace
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+import dssatservice.dssat as dssat
+from dssatservice.scheduler import (
+    Scheduler, SchedulerBusy, INTERACTIVE, BATCH
+)
+
+TIMEOUT = 5.
+
+class FakeConnection:
+    info = SimpleNamespace(dbname="test")
+
+SCENARIOS = [{
+    "id": 0, "plantingdate": datetime(2020, 1, 1), "cultivar": "X",
+    "nitrogen": [(0, 0)]
+}]
+
+def test_priority_order():
+    scheduler = Scheduler(max_running=1, max_running_schema=1)
+    scheduler.acquire("s")
+    order = []
+    def run(name, priority):
+        with scheduler.slot("s", priority):
+            order.append(name)
+    threads = [
+        threading.Thread(target=run, args=("batch", BATCH)),
+        threading.Thread(target=run, args=("interactive", INTERACTIVE))
+    ]
+    for thread in threads:
+        thread.start()
+        while scheduler.metrics()["queued"] < threads.index(thread) + 1:
+            time.sleep(.01)
+    scheduler.release("s")
+    for thread in threads:
+        thread.join(TIMEOUT)
+    assert order == ["interactive", "batch"]
+
+def test_busy():
+    scheduler = Scheduler(max_running=1)
+    scheduler.acquire("s")
+    with pytest.raises(SchedulerBusy):
+        scheduler.acquire("s", timeout=.05)
+    scheduler.release("s")
+    with pytest.raises(SchedulerBusy):
+        Scheduler(max_queue=0).acquire("s")
+    assert scheduler.metrics()["rejected"] == 1
+    assert scheduler.metrics()["running"] == 0
+
+def test_identical_run_waits_without_slot(monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+    def fake_run(con, schema, admin1, *args):
+        calls.append(admin1)
+        started.set()
+        assert release.wait(TIMEOUT)
+        return pd.DataFrame({"HARWT": [1000]})
+    monkeypatch.setattr(dssat, "_run_spatial_dssat_batch", fake_run)
+    scheduler = Scheduler(max_running=1, max_running_schema=1)
+    results = []
+    def run():
+        results.append(dssat.run_spatial_dssat_batch(
+            FakeConnection(), "s", "a", SCENARIOS, 
+            slot=scheduler.slot("s", timeout=TIMEOUT)
+        ))
+    leader = threading.Thread(target=run)
+    leader.start()
+    assert started.wait(TIMEOUT)
+    follower = threading.Thread(target=run)
+    follower.start()
+    follower.join(.2)
+    assert follower.is_alive()
+    assert scheduler.metrics()["queued"] == 0
+    release.set()
+    leader.join(TIMEOUT)
+    follower.join(TIMEOUT)
+    assert calls == ["a"]
+    assert len(results) == 2
+    assert scheduler.metrics()["admitted"] == 1